@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark: vectorized src/features.py vs the notebook feature pipeline.
+
+The reference implementation is executed straight from the function
+definitions in notebooks/03_feature_engineering.ipynb.
+
+Usage:
+    python benchmarks/bench_features.py [--scales 1,10x10] [--no-reference]
+
+A scale of '10x10' means 10x more entities and 10x more periods (100x rows).
+"""
+
+import argparse
+import ast
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+warnings.filterwarnings('ignore')
+
+# Set up paths
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.data_processing import load_and_clean_data
+from src.features import build_features
+from synthetic import make_synthetic_panel, parse_scale
+
+DATA_FILE = os.path.join(project_root, 'data', 'gdp-per-capita-worldbank.csv')
+NOTEBOOK = os.path.join(project_root, 'notebooks', '03_feature_engineering.ipynb')
+NOTEBOOK_FUNCTIONS = ['calculate_growth_features', 'calculate_trend_features', 'calculate_volatility_features',
+                      'calculate_cycle_features', 'calculate_relative_features']
+
+
+def load_notebook_functions():
+    """Compile only the top-level feature function definitions from the notebook"""
+    with open(NOTEBOOK, encoding='utf-8') as f:
+        notebook = json.load(f)
+
+    namespace = {'pd': pd, 'np': np}
+    for cell in notebook['cells']:
+        if cell['cell_type'] != 'code':
+            continue
+        tree = ast.parse(''.join(cell['source']))
+        definitions = [node for node in tree.body
+                       if isinstance(node, ast.FunctionDef) and node.name in NOTEBOOK_FUNCTIONS]
+        if definitions:
+            exec(compile(ast.Module(body=definitions, type_ignores=[]), NOTEBOOK, 'exec'), namespace)
+    return namespace
+
+
+def notebook_pipeline(functions, df, gdp_column):
+    """Run the notebook functions in notebook order"""
+    functions['gdp_column'] = gdp_column
+    df_features = functions['calculate_growth_features'](df, value_col=gdp_column)
+    df_features = functions['calculate_trend_features'](df_features, value_col=gdp_column)
+    df_features = functions['calculate_volatility_features'](df_features, value_col=gdp_column)
+    df_features = functions['calculate_cycle_features'](df_features, value_col=gdp_column)
+    return functions['calculate_relative_features'](df_features, value_col=gdp_column)
+
+
+def timed(function, *args):
+    """Return (result, seconds)"""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Feature pipeline benchmark')
+    parser.add_argument('--scales', default='1,10x10',
+                        help="Comma separated scales; '100' = 100x entities, '10x10' = 10x entities x 10x periods")
+    parser.add_argument('--no-reference', action='store_true',
+                        help='Skip the (slow) notebook implementation')
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        df, gdp_column = load_and_clean_data(DATA_FILE)
+    notebook_functions = load_notebook_functions()
+
+    print("⏱️ Feature pipeline benchmark (notebook loops vs src/features.py)")
+    print("=" * 78)
+    print(f"{'scale':>8} {'rows':>10} {'entities':>9} {'notebook':>11} {'vectorized':>11} {'speedup':>8}  match")
+
+    for scale in args.scales.split(','):
+        entity_scale, period_scale = parse_scale(scale)
+        panel = make_synthetic_panel(df, gdp_column, entity_scale, period_scale)
+
+        vectorized, vectorized_time = timed(build_features, panel, gdp_column)
+
+        if args.no_reference:
+            match, reference_text, speedup_text = 'skipped', '-', '-'
+        else:
+            reference, reference_time = timed(notebook_pipeline, notebook_functions, panel, gdp_column)
+            try:
+                pd.testing.assert_frame_equal(reference, vectorized, check_dtype=False, rtol=1e-9, atol=1e-9)
+                match = '✅'
+            except AssertionError:
+                match = '❌'
+            reference_text = f'{reference_time:.2f}s'
+            speedup_text = f'{reference_time / vectorized_time:.1f}x'
+
+        print(f"{scale:>8} {len(panel):>10,} {panel['Entity'].nunique():>9,} "
+              f"{reference_text:>11} {vectorized_time:>10.3f}s {speedup_text:>8}  {match}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark: batch forecasting throughput in entities per second.
+
+Fits the trend, Holt and AR(1) models of src/forecasting.py to every entity
+of synthetic panels at once and runs the rolling-origin backtest. On the
+smaller scales the same model code is also run one entity at a time (the
+per-country loop the batch version replaces) and the forecasts are checked
+to agree.
+
+Usage:
+    python benchmarks/bench_forecasting.py [--scales 1,10,100] [--horizon 5] [--origins 10]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+
+# Set up paths
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+warnings.filterwarnings('ignore')
+
+from src.data_processing import load_and_clean_data
+from src.forecasting import MODELS, _FORECASTERS, _log_grid, _run_model, backtest
+from src.panel import GDPPanel
+from synthetic import make_synthetic_panel, parse_scale
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def looped_forecasts(log_values, targets, model):
+    """The same model fitted entity by entity"""
+    results = [_FORECASTERS[model](log_values[i:i + 1], targets[i:i + 1]) for i in range(len(log_values))]
+    return np.vstack([mean for mean, _ in results]), np.vstack([sd for _, sd in results])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scales', default='1,10,100', help='Comma separated entity (x period) scales')
+    parser.add_argument('--horizon', type=int, default=5, help='Forecast horizon in years')
+    parser.add_argument('--origins', type=int, default=10, help='Backtest origins')
+    parser.add_argument('--loop-max-entities', type=int, default=5000,
+                        help='Largest panel also timed with the per-entity loop')
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        base, gdp_column = load_and_clean_data(os.path.join(project_root, 'data', 'gdp-per-capita-worldbank.csv'))
+
+    print(f"⏱️ Batch forecasting: {args.horizon}-year horizon, {args.origins}-origin backtest")
+    print("=" * 88)
+    print(f"{'scale':>6} {'entities':>9} {'task':<16} {'loop':>9} {'batch':>9} {'entities/s':>12} {'speedup':>8}  match")
+    for scale in args.scales.split(','):
+        df = make_synthetic_panel(base, gdp_column, *parse_scale(scale))
+        panel = GDPPanel.from_frame(df, gdp_column)
+        log_values, years = _log_grid(panel)
+        n_entities = len(panel.entities)
+        targets = np.broadcast_to(len(years) - 1 + np.arange(1, args.horizon + 1), (n_entities, args.horizon))
+        run_loop = n_entities <= args.loop_max_entities
+
+        for model in MODELS:
+            batch_time, (mean, sd) = timed(lambda: _run_model(model, log_values, targets))
+            loop_column, speedup, match = f"{'-':>9}", f"{'-':>8}", ''
+            if run_loop:
+                loop_time, (loop_mean, loop_sd) = timed(lambda: looped_forecasts(log_values, targets, model))
+                same = (np.allclose(mean, loop_mean, rtol=1e-9, equal_nan=True)
+                        and np.allclose(sd, loop_sd, rtol=1e-9, equal_nan=True))
+                loop_column = f"{loop_time:>8.3f}s"
+                speedup = f"{loop_time / batch_time:>7.1f}x"
+                match = '✅' if same else '❌'
+            print(f"{scale:>6} {n_entities:>9,} {'fit ' + model:<16} {loop_column} {batch_time:>8.3f}s "
+                  f"{n_entities / batch_time:>12,.0f} {speedup}  {match}")
+
+        backtest_time, scores = timed(lambda: backtest(panel, args.horizon, args.origins))
+        print(f"{scale:>6} {n_entities:>9,} {'backtest (all)':<16} {'-':>9} {backtest_time:>8.3f}s "
+              f"{n_entities / backtest_time:>12,.0f}")
+        one_step = scores.xs(1, level='horizon')
+        summary = ', '.join(f"{model} {row['mape']:.1f}% / {row['coverage'] * 100:.0f}%"
+                            for model, row in one_step.iterrows())
+        print(f"{'':>6} {'':>9} 1-year MAPE / interval coverage: {summary}")
+        print("-" * 88)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark: plotly HTML output size and load cost, standalone vs compact mode.
+
+Writes the notebook plotly figures (continent comparison, world map,
+top-15 evolution) for synthetic panels in both output modes and reports
+write time, file size, embedded points and the read + figure-JSON decode
+time of each file. Long series come from the period scale: '1x100' gives
+every country 100x as many yearly points.
+
+Usage:
+    python benchmarks/bench_html.py [--scales 1x1,1x100] [--max-points 2000]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+# Set up paths
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+warnings.filterwarnings('ignore')
+
+from src import visualization
+from src.data_processing import get_continent_trends, load_and_clean_data
+from synthetic import make_synthetic_panel, parse_scale
+
+FIGURES = [
+    ('continent_comparison', lambda df, gdp_column, path: visualization.plot_continent_comparison(
+        get_continent_trends(df, gdp_column), save_path=path)),
+    ('world_map', lambda df, gdp_column, path: visualization.plot_world_map_choropleth(
+        df, gdp_column, year=int(df['Year'].max()), save_path=path)),
+    ('top15_evolution', lambda df, gdp_column, path: visualization.create_animated_gdp_plot(
+        df, gdp_column, save_path=path)),
+]
+
+
+def write_figures(df, gdp_column, out_dir):
+    """Write every figure into out_dir; returns [(name, write seconds, inspect report)]"""
+    results = []
+    for name, write in FIGURES:
+        path = os.path.join(out_dir, f'{name}.png')
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            write(df, gdp_column, path)
+        elapsed = time.perf_counter() - start
+        html = [f for f in os.listdir(out_dir) if f.startswith(name) and f.endswith('.html')][0]
+        results.append((name, elapsed, visualization.inspect_plotly_html(os.path.join(out_dir, html))))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scales', default='1x1,1x100', help='Comma separated entity x period scales')
+    parser.add_argument('--max-points', type=int, default=2000, help='Compact mode point budget per trace')
+    parser.add_argument('--webgl-threshold', type=int, default=1000, help='Compact mode WebGL threshold')
+    args = parser.parse_args()
+
+    visualization.set_batch_mode(True, resolution='preview')
+    with contextlib.redirect_stdout(io.StringIO()):
+        base, gdp_column = load_and_clean_data(os.path.join(project_root, 'data', 'gdp-per-capita-worldbank.csv'))
+
+    print(f"🌐 Plotly HTML output: standalone vs compact (max {args.max_points:,} points/trace)")
+    print("=" * 96)
+    print(f"{'scale':<8} {'figure':<22} {'mode':<11} {'write':>8} {'size':>10} {'points':>9} {'read+decode':>12}")
+    for scale in args.scales.split(','):
+        df = make_synthetic_panel(base, gdp_column, *parse_scale(scale))
+        totals = {}
+        for mode in ('standalone', 'compact'):
+            visualization.set_plotly_output(mode, args.max_points, args.webgl_threshold)
+            with tempfile.TemporaryDirectory() as tmp:
+                results = write_figures(df, gdp_column, tmp)
+                shared_js = os.path.join(tmp, 'plotly.min.js')
+                bundle = os.path.getsize(shared_js) if os.path.exists(shared_js) else 0
+            for name, elapsed, report in results:
+                print(f"{scale:<8} {name:<22} {mode:<11} {elapsed:>7.2f}s {report['bytes'] / 1024:>8.0f}KB "
+                      f"{report['points']:>9,} {report['load_ms']:>10.1f}ms")
+            totals[mode] = (sum(report['bytes'] for _, _, report in results) + bundle,
+                            sum(report['load_ms'] for _, _, report in results))
+        size_ratio = totals['standalone'][0] / totals['compact'][0]
+        load_ratio = totals['standalone'][1] / totals['compact'][1]
+        print(f"{scale:<8} {'total (incl. bundle)':<22} {'':<11} {'':>8} "
+              f"{totals['standalone'][0] / 1024:>8.0f}KB -> {totals['compact'][0] / 1024:.0f}KB "
+              f"({size_ratio:.1f}x smaller; read+decode {load_ratio:.1f}x faster, shared bundle cached after first load)")
+        print("-" * 96)
+
+
+if __name__ == '__main__':
+    main()
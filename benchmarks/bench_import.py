@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark: import (startup) time of the src modules and generate_plots.py.
+
+Each module is imported in a fresh interpreter with `python -X importtime`,
+so nothing is shared with the current process; the reported time is the
+median cumulative import time of the module over --repeat runs.
+
+Usage:
+    python benchmarks/bench_import.py [--repeat N] [--top K]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+# Set up paths
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_TARGETS = [
+    'pandas',
+    'src.data_processing',
+    'src.features',
+    'src.visualization',
+    'generate_plots',
+]
+BACKENDS = ['matplotlib', 'seaborn', 'plotly']
+
+
+def measure_import(module, top=0):
+    """
+    Import a module in a fresh interpreter; return (total_ms, backends loaded, heaviest imports)
+    """
+    code = f"import sys, {module}; print(','.join(m for m in {BACKENDS!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=project_root,
+                            capture_output=True, text=True, check=True,
+                            env={**os.environ, 'MPLBACKEND': 'Agg'})
+
+    # stderr lines look like: "import time:  self [us] | cumulative | imported package",
+    # with the package name indented two spaces per nesting level after the separator's one space
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, raw_name = line[len('import time:'):].split('|')
+        depth = (len(raw_name) - len(raw_name.lstrip(' ')) - 1) // 2
+        timings.append((raw_name.strip(), int(self_us), int(cumulative_us), depth))
+
+    # A module's own imports are listed just before it, one level deeper
+    position = next((i for i in range(len(timings) - 1, -1, -1) if timings[i][0] == module), None)
+    total_us, direct = 0, []
+    if position is not None:
+        total_us, depth = timings[position][2], timings[position][3]
+        i = position - 1
+        while i >= 0 and timings[i][3] > depth:
+            if timings[i][3] == depth + 1:
+                direct.append(timings[i])
+            i -= 1
+    heaviest = sorted(direct, key=lambda t: t[2], reverse=True)[:top]
+    backends = [b for b in result.stdout.strip().split(',') if b]
+    return total_us / 1000, backends, heaviest
+
+
+def run_import_benchmark(repeat=3, top=0):
+    """
+    Median import time per target as {module: {'ms': ..., 'backends': [...]}}
+    """
+    results = {}
+    for module in IMPORT_TARGETS:
+        runs = [measure_import(module, top) for _ in range(repeat)]
+        runs.sort(key=lambda run: run[0])
+        total_ms, backends, heaviest = runs[len(runs) // 2]
+        results[module] = {'ms': total_ms, 'backends': backends,
+                           'heaviest': [(name, cumulative / 1000) for name, _, cumulative, _ in heaviest]}
+    return results
+
+
+def print_import_results(results):
+    """
+    Print the import-time table
+    """
+    print(f"{'module':<24} {'import':>10}  plotting backends loaded")
+    for module, stats in results.items():
+        backends = ', '.join(stats['backends']) or '-'
+        print(f"{module:<24} {stats['ms']:>8.1f}ms  {backends}")
+        for name, cumulative_ms in stats['heaviest']:
+            print(f"{'':<4}↳ {name:<18} {cumulative_ms:>8.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='Fresh interpreters per module')
+    parser.add_argument('--top', type=int, default=0, help='Also list the K heaviest direct imports of each module')
+    args = parser.parse_args()
+
+    print(f"⏱️ Import time (python -X importtime, median of {args.repeat})")
+    print("=" * 64)
+    print_import_results(run_import_benchmark(args.repeat, args.top))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cold CSV parse vs warm columnar cache for load_and_clean_data.
+
+Usage:
+    python benchmarks/bench_load.py [--repeat N]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+# Set up paths
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from src.cache import clear_cache
+from src.data_processing import load_and_clean_data
+
+DATA_FILE = os.path.join(project_root, 'data', 'gdp-per-capita-worldbank.csv')
+
+
+def time_load(use_cache, cold):
+    """Time a single load, optionally dropping the cache first"""
+    if cold:
+        clear_cache(DATA_FILE)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        load_and_clean_data(DATA_FILE, use_cache=use_cache)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=20, help='Timed runs per scenario')
+    args = parser.parse_args()
+
+    scenarios = {
+        'csv parse (no cache)': lambda: time_load(use_cache=False, cold=False),
+        'cold (parse + write cache)': lambda: time_load(use_cache=True, cold=True),
+        'warm (read cache)': lambda: time_load(use_cache=True, cold=False),
+    }
+
+    print(f"⏱️ load_and_clean_data benchmark ({args.repeat} runs each)")
+    print("=" * 60)
+    results = {}
+    for name, run in scenarios.items():
+        timings = sorted(run() for _ in range(args.repeat))
+        results[name] = timings[len(timings) // 2]
+        print(f"{name:<30} median {results[name] * 1000:8.2f} ms   best {timings[0] * 1000:8.2f} ms")
+
+    speedup = results['csv parse (no cache)'] / results['warm (read cache)']
+    print("=" * 60)
+    print(f"🚀 Warm cache speedup over CSV parse: {speedup:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
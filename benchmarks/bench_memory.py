@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory footprint of the default vs compact cleaned DataFrame.
+
+Usage:
+    python benchmarks/bench_memory.py [--scales 1,100] [--detail]
+
+A scale of '100' means 100x more entities; '10x10' also adds 10x more periods.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+
+# Set up paths
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.data_processing import load_and_clean_data
+from src.utils import downcast_frame, memory_report
+from synthetic import make_synthetic_panel, parse_scale
+
+DATA_FILE = os.path.join(project_root, 'data', 'gdp-per-capita-worldbank.csv')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scales', default='1,100', help='Comma separated synthetic scales')
+    parser.add_argument('--detail', action='store_true', help='Print the per-column memory_report')
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        df, gdp_column = load_and_clean_data(DATA_FILE)
+
+    results = []
+    for scale in args.scales.split(','):
+        entity_scale, period_scale = parse_scale(scale)
+        panel = make_synthetic_panel(df, gdp_column, entity_scale, period_scale)
+        compact = downcast_frame(panel, gdp_column)
+
+        with contextlib.redirect_stdout(io.StringIO()) if not args.detail else contextlib.nullcontext():
+            before = memory_report(panel, f'default x{scale}').sum()
+            after = memory_report(compact, f'compact x{scale}').sum()
+        results.append((scale, len(panel), before, after))
+
+    print("🧠 Cleaned DataFrame memory (default vs compact=True)")
+    print("=" * 64)
+    print(f"{'scale':>8} {'rows':>12} {'default':>12} {'compact':>12} {'saving':>9}")
+    for scale, rows, before, after in results:
+        print(f"{scale:>8} {rows:>12,} {before / 1024 ** 2:>10.2f}MB {after / 1024 ** 2:>10.2f}MB "
+              f"{before / after:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark: entity-partitioned parallel execution, scaling over 1..N cores.
+
+Runs calculate_growth_rate, get_moving_average, the cycle features and
+get_growth_champions_and_laggards serially and through src/parallel.py
+with an increasing number of worker processes on synthetic panels. Parallel
+timings include partitioning, the shared memory copy and pool start-up;
+results are checked against the serial functions.
+
+Usage:
+    python benchmarks/bench_parallel.py [--scales 100] [--jobs 1,2,4,8]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+import warnings
+
+import pandas as pd
+
+# Set up paths
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+warnings.filterwarnings('ignore')
+
+from src import parallel
+from src.data_processing import (calculate_growth_rate, get_growth_champions_and_laggards, get_moving_average,
+                                 load_and_clean_data)
+from src.features import calculate_cycle_features
+from synthetic import make_synthetic_panel, parse_scale
+
+
+def serial_cycle_features(df, gdp_column):
+    df_cycle = df.assign(yoy_growth=df.groupby('Entity')[gdp_column].pct_change() * 100)
+    return calculate_cycle_features(df_cycle, gdp_column)
+
+
+# (name, serial function, parallel function(df, gdp_column, jobs), compare(serial, parallel))
+TASKS = [
+    ('calculate_growth_rate', calculate_growth_rate,
+     lambda df, gdp_column, jobs: parallel.parallel_growth_rate(df, gdp_column, jobs=jobs), None),
+    ('get_moving_average', get_moving_average,
+     lambda df, gdp_column, jobs: parallel.parallel_moving_average(df, gdp_column, jobs=jobs), None),
+    ('cycle features', serial_cycle_features,
+     lambda df, gdp_column, jobs: parallel.parallel_cycle_features(df, gdp_column, jobs=jobs), None),
+    ('growth champions', get_growth_champions_and_laggards,
+     lambda df, gdp_column, jobs: parallel.parallel_growth_champions(df, gdp_column, jobs=jobs),
+     lambda expected, result: all(a.reset_index(drop=True).equals(b.reset_index(drop=True))
+                                  for a, b in zip(expected, result))),
+]
+
+
+def default_job_counts():
+    cores = parallel.default_jobs()
+    counts = [1]
+    while counts[-1] * 2 <= cores:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cores:
+        counts.append(cores)
+    return ','.join(str(count) for count in counts)
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def same_frame(expected, result):
+    try:
+        pd.testing.assert_frame_equal(expected, result)
+        return True
+    except AssertionError:
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scales', default='100', help='Comma separated entity (x period) scales')
+    parser.add_argument('--jobs', default=default_job_counts(), help='Comma separated worker counts')
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        base, gdp_column = load_and_clean_data(os.path.join(project_root, 'data', 'gdp-per-capita-worldbank.csv'))
+    job_counts = [int(jobs) for jobs in args.jobs.split(',')]
+
+    print(f"⏱️ Entity-partitioned execution on {parallel.default_jobs()} available core(s)")
+    if max(job_counts) > parallel.default_jobs():
+        print("⚠️ More workers than cores: those rows show pool overhead, not scaling")
+    print("=" * 84)
+    print(f"{'scale':>6} {'rows':>10} {'task':<22} {'jobs':>5} {'time':>9} {'speedup':>8} {'efficiency':>11}  match")
+    for scale in args.scales.split(','):
+        df = make_synthetic_panel(base, gdp_column, *parse_scale(scale))
+        for name, serial, partitioned, compare in TASKS:
+            serial_time, expected = timed(lambda: serial(df, gdp_column))
+            print(f"{scale:>6} {len(df):>10,} {name:<22} {'serial':>5} {serial_time:>8.3f}s")
+            for jobs in job_counts:
+                elapsed, result = timed(lambda: partitioned(df, gdp_column, jobs))
+                match = compare(expected, result) if compare else same_frame(expected, result)
+                speedup = serial_time / elapsed
+                print(f"{'':>6} {'':>10} {'':<22} {jobs:>5} {elapsed:>8.3f}s {speedup:>7.2f}x "
+                      f"{speedup / jobs * 100:>10.0f}%  {'✅' if match else '❌'}")
+        print("-" * 84)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark: src/ranking.py vs pandas for cross-sectional ranks.
+
+Compares, on synthetic panels:
+  * world + continent percentiles: groupby(...).rank(pct=True) vs CrossSectionRanks
+  * top/bottom 10 of every year: nlargest/nsmallest per year vs one lexsort
+  * QuantileSketch (approximate, chunked) build + query time and percentile error
+
+Usage:
+    python benchmarks/bench_ranking.py [--scales 1,10,100] [--accuracy 0.01] [--chunks 10]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+
+# Set up paths
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+warnings.filterwarnings('ignore')
+
+from src.data_processing import load_and_clean_data
+from src.ranking import QuantileSketch, cross_section_percentiles, top_bottom_by_group
+from synthetic import make_synthetic_panel, parse_scale
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def pandas_percentiles(df, gdp_column):
+    return (df.groupby('Year')[gdp_column].rank(pct=True) * 100,
+            df.groupby(['Year', 'Continent'])[gdp_column].rank(pct=True) * 100)
+
+
+def engine_percentiles(df, gdp_column):
+    return cross_section_percentiles(df, gdp_column, groupings=[['Year'], ['Year', 'Continent']])
+
+
+def pandas_top_bottom(df, gdp_column, n=10):
+    tops, bottoms = [], []
+    for year in sorted(df['Year'].unique()):
+        year_data = df[df['Year'] == year]
+        tops.append(year_data.nlargest(n, gdp_column))
+        bottoms.append(year_data.nsmallest(n, gdp_column))
+    return tops, bottoms
+
+
+def sketch_percentiles(df, gdp_column, accuracy, chunks):
+    sketch = QuantileSketch(relative_accuracy=accuracy)
+    parts = np.array_split(np.arange(len(df)), chunks)
+    for part in parts:
+        sketch.add(df.iloc[part], gdp_column, by=['Year', 'Continent'])
+    return [sketch.percentile(df.iloc[part], gdp_column, by=['Year', 'Continent']) for part in parts]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scales', default='1,10,100', help='Comma separated entity (x period) scales')
+    parser.add_argument('--accuracy', type=float, default=0.01, help='QuantileSketch relative accuracy')
+    parser.add_argument('--chunks', type=int, default=10, help='Chunks fed to the sketch')
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        base, gdp_column = load_and_clean_data(os.path.join(project_root, 'data', 'gdp-per-capita-worldbank.csv'))
+
+    print("⏱️ Cross-sectional ranking: pandas vs src/ranking.py")
+    print("=" * 86)
+    print(f"{'scale':>6} {'rows':>10} {'task':<26} {'pandas':>9} {'engine':>9} {'speedup':>8}  result")
+    for scale in args.scales.split(','):
+        df = make_synthetic_panel(base, gdp_column, *parse_scale(scale))
+
+        pandas_time, expected = timed(lambda: pandas_percentiles(df, gdp_column))
+        engine_time, result = timed(lambda: engine_percentiles(df, gdp_column))
+        exact = all(np.array_equal(a.to_numpy(), b.to_numpy(), equal_nan=True) for a, b in zip(expected, result))
+        print(f"{scale:>6} {len(df):>10,} {'world+continent percentile':<26} {pandas_time:>8.3f}s {engine_time:>8.3f}s "
+              f"{pandas_time / engine_time:>7.1f}x  {'✅ identical' if exact else '❌ differs'}")
+
+        pandas_time, (tops, bottoms) = timed(lambda: pandas_top_bottom(df, gdp_column))
+        engine_time, (top, bottom) = timed(lambda: top_bottom_by_group(df, gdp_column, by=['Year'], n=10))
+        same = (np.array_equal(top.index, np.concatenate([t.index for t in tops]))
+                and np.array_equal(bottom.index, np.concatenate([b.index for b in bottoms])))
+        print(f"{scale:>6} {len(df):>10,} {'top/bottom 10 every year':<26} {pandas_time:>8.3f}s {engine_time:>8.3f}s "
+              f"{pandas_time / engine_time:>7.1f}x  {'✅ identical' if same else '❌ differs'}")
+
+        sketch_time, parts = timed(lambda: sketch_percentiles(df, gdp_column, args.accuracy, args.chunks))
+        approximate = np.concatenate([part.to_numpy() for part in parts])
+        error = np.abs(approximate - expected[1].to_numpy())
+        print(f"{scale:>6} {len(df):>10,} {'continent pct (sketch)':<26} {'':>9} {sketch_time:>8.3f}s {'':>8}  "
+              f"mean err {np.nanmean(error):.2f} / p99 {np.nanpercentile(error, 99):.2f} pct points")
+        print("-" * 86)
+
+
+if __name__ == '__main__':
+    main()
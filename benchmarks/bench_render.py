@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark: plot export cost of the ten generate_plots.py outputs per resolution profile.
+
+'print' is the original full-resolution path (300 dpi, tight bounding box);
+every profile renders all ten jobs into a temporary directory with the Agg
+backend and reports per-plot time, total time, speedup and PNG size.
+
+Usage:
+    python benchmarks/bench_render.py [--profiles print,web,preview] [--repeat N]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+# Set up paths
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+import generate_plots
+
+
+def render_all(df, gdp_column, resolution, out_dir):
+    """Render every plot job once; returns ({job: seconds}, total PNG bytes)"""
+    generate_plots.output_path = out_dir
+    generate_plots.export_settings['resolution'] = resolution
+    timings = {}
+    for name, plot_function in generate_plots.PLOT_JOBS:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            plot_function(df, gdp_column)
+        timings[name] = time.perf_counter() - start
+
+    png_bytes = sum(os.path.getsize(os.path.join(out_dir, f)) for f in os.listdir(out_dir) if f.endswith('.png'))
+    return timings, png_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--profiles', default='print,web,preview', help='Comma separated profiles; the first is the baseline')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per profile (best run per plot is reported)')
+    args = parser.parse_args()
+
+    generate_plots.plt.switch_backend('Agg')
+    with contextlib.redirect_stdout(io.StringIO()):
+        df, gdp_column = generate_plots.load_and_prepare_data()
+
+    profiles = args.profiles.split(',')
+    results = {}
+    sizes = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        # Warm-up run so imports and font caches do not land on the baseline
+        warmup_dir = os.path.join(tmp, 'warmup')
+        os.makedirs(warmup_dir)
+        render_all(df, gdp_column, profiles[0], warmup_dir)
+        for profile in profiles:
+            out_dir = os.path.join(tmp, profile)
+            os.makedirs(out_dir)
+            runs = [render_all(df, gdp_column, profile, out_dir) for _ in range(args.repeat)]
+            results[profile] = {name: min(run[0][name] for run in runs) for name, _ in generate_plots.PLOT_JOBS}
+            sizes[profile] = runs[-1][1]
+
+    baseline = profiles[0]
+    print(f"⏱️ Plot export per resolution profile (best of {args.repeat}, Agg backend)")
+    print("=" * (30 + 11 * len(profiles)))
+    print(f"{'plot':<28}" + ''.join(f"{profile:>11}" for profile in profiles))
+    for name, _ in generate_plots.PLOT_JOBS:
+        print(f"{name:<28}" + ''.join(f"{results[profile][name]:>10.3f}s" for profile in profiles))
+
+    totals = {profile: sum(results[profile].values()) for profile in profiles}
+    print("-" * (30 + 11 * len(profiles)))
+    print(f"{'total':<28}" + ''.join(f"{totals[profile]:>10.3f}s" for profile in profiles))
+    print(f"{'speedup vs ' + baseline:<28}" + ''.join(f"{totals[baseline] / totals[profile]:>10.1f}x" for profile in profiles))
+    print(f"{'PNG output':<28}" + ''.join(f"{sizes[profile] / 1024 ** 2:>9.1f}MB" for profile in profiles))
+
+
+if __name__ == '__main__':
+    main()
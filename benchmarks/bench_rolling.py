@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark: src/rolling.py kernels vs groupby(entity).rolling(window).
+
+Each statistic used by the features (mean, std, min/max drawdown and the
+ma5 slope) is computed both ways on synthetic panels; the groupby side
+includes the reset_index(0, drop=True) realignment the code used before.
+Results are checked to agree (rtol 1e-9; slope against a rolling polyfit
+on the 1x panel only, as apply() is slow).
+
+Usage:
+    python benchmarks/bench_rolling.py [--scales 1,10,100] [--repeat 3]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+# Set up paths
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+warnings.filterwarnings('ignore')
+
+from src.data_processing import load_and_clean_data
+from src.rolling import frame_rolling
+from synthetic import make_synthetic_panel, parse_scale
+
+
+def groupby_drawdown(df, column, window):
+    rolling = df.groupby('Entity')[column].rolling(window=window, min_periods=1)
+    peak = rolling.max().reset_index(0, drop=True)
+    trough = rolling.min().reset_index(0, drop=True)
+    full_window = df.groupby('Entity').cumcount() >= window - 1
+    return (((trough - peak) / peak) * 100).where(full_window & (peak > 0))
+
+
+def groupby_slope(df, column, window):
+    x = np.arange(window)
+    return df.groupby('Entity')[column].rolling(window=window, min_periods=window).apply(
+        lambda values: np.polyfit(x, values, 1)[0], raw=True).reset_index(0, drop=True)
+
+
+# (name, groupby-rolling version, kernel version); both take (df, column)
+CASES = [
+    ('mean w=5', lambda df, c: df.groupby('Entity')[c].rolling(window=5, min_periods=1).mean().reset_index(0, drop=True),
+     lambda df, c: frame_rolling(df, c, 5, 'mean')),
+    ('mean w=10', lambda df, c: df.groupby('Entity')[c].rolling(window=10, min_periods=1).mean().reset_index(0, drop=True),
+     lambda df, c: frame_rolling(df, c, 10, 'mean')),
+    ('std w=5', lambda df, c: df.groupby('Entity')[c].rolling(window=5, min_periods=2).std().reset_index(0, drop=True),
+     lambda df, c: frame_rolling(df, c, 5, 'std', min_periods=2)),
+    ('min w=5', lambda df, c: df.groupby('Entity')[c].rolling(window=5, min_periods=1).min().reset_index(0, drop=True),
+     lambda df, c: frame_rolling(df, c, 5, 'min')),
+    ('max w=5', lambda df, c: df.groupby('Entity')[c].rolling(window=5, min_periods=1).max().reset_index(0, drop=True),
+     lambda df, c: frame_rolling(df, c, 5, 'max')),
+    ('drawdown w=5', lambda df, c: groupby_drawdown(df, c, 5),
+     lambda df, c: frame_rolling(df, c, 5, 'drawdown')),
+]
+SLOPE_CASE = ('slope w=3', lambda df, c: groupby_slope(df, c, 3), lambda df, c: frame_rolling(df, c, 3, 'slope'))
+
+
+def best_time(function, df, column, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(df, column)
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scales', default='1,10,100', help='Comma separated entity (x period) scales')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per case (best is reported)')
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        base, gdp_column = load_and_clean_data(os.path.join(project_root, 'data', 'gdp-per-capita-worldbank.csv'))
+
+    print("⏱️ Rolling windows: groupby(...).rolling(...) vs src/rolling.py kernels")
+    print("=" * 78)
+    print(f"{'scale':>6} {'rows':>10} {'statistic':<14} {'groupby':>10} {'kernel':>10} {'speedup':>8}  match")
+    for scale in args.scales.split(','):
+        df = make_synthetic_panel(base, gdp_column, *parse_scale(scale))
+        cases = CASES + ([SLOPE_CASE] if scale == '1' else [])
+        for name, groupby_version, kernel_version in cases:
+            groupby_time, expected = best_time(groupby_version, df, gdp_column, args.repeat)
+            kernel_time, result = best_time(kernel_version, df, gdp_column, args.repeat)
+            expected = expected.reindex(df.index).to_numpy(dtype=np.float64)
+            match = np.allclose(expected, result.to_numpy(), rtol=1e-9, atol=1e-6, equal_nan=True)
+            print(f"{scale:>6} {len(df):>10,} {name:<14} {groupby_time:>9.3f}s {kernel_time:>9.3f}s "
+                  f"{groupby_time / kernel_time:>7.1f}x  {'✅' if match else '❌'}")
+        print("-" * 78)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark: trajectory similarity queries on large panels.
+
+Builds a TrajectoryIndex from synthetic panels (entity copies get 2% yearly
+noise so they are not exact duplicates of each other), times save/load and
+k-nearest queries for random countries and year windows with every metric,
+and compares them with a brute-force per-entity scan (and DTW without the
+LB_Keogh prefilter). Results of both are checked to agree.
+
+Usage:
+    python benchmarks/bench_similarity.py [--scales 1,50] [--queries 20] [--k 10]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+import numpy as np
+
+# Set up paths
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+warnings.filterwarnings('ignore')
+
+from src.data_processing import load_and_clean_data
+from src.similarity import METRICS, TrajectoryIndex, _dtw
+from synthetic import make_synthetic_panel, parse_scale
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def brute_force(index, entity, start, end, k, metric, band):
+    """Distances entity by entity (DTW over every candidate, no lower bound)"""
+    complete = index.window_stats(start, end)[0]
+    query = index.trajectories([entity], start, end)[0]
+    names, distances = [], []
+    candidates = [i for i in np.flatnonzero(complete) if index.entities[i] != entity]
+    if metric == 'dtw':
+        series = index.trajectories(start=start, end=end)[candidates]
+        distances = np.sqrt(_dtw(query, series, band) / len(query))
+        names = index.entities[candidates]
+    else:
+        for i in candidates:
+            other = index.trajectories([index.entities[i]], start, end)[0]
+            if metric == 'euclidean':
+                distances.append(np.sqrt(np.mean((other - query) ** 2)))
+            else:
+                distances.append(1 - np.corrcoef(query, other)[0, 1])
+            names.append(index.entities[i])
+        distances, names = np.array(distances), np.array(names, dtype=object)
+    order = np.argsort(distances, kind='stable')[:k]
+    return list(names[order])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scales', default='1,50', help='Comma separated entity (x period) scales')
+    parser.add_argument('--queries', type=int, default=20, help='Random queries per metric')
+    parser.add_argument('--k', type=int, default=10, help='Neighbours per query')
+    parser.add_argument('--band', type=int, default=2, help='DTW band in years')
+    parser.add_argument('--brute-force-queries', type=int, default=3, help='Queries also run by brute force')
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        base, gdp_column = load_and_clean_data(os.path.join(project_root, 'data', 'gdp-per-capita-worldbank.csv'))
+    rng = np.random.default_rng(0)
+
+    print(f"⏱️ Trajectory similarity: k={args.k}, {args.queries} random queries per metric")
+    print("=" * 92)
+    for scale in args.scales.split(','):
+        df = make_synthetic_panel(base, gdp_column, *parse_scale(scale))
+        copies = df['Entity'].str.contains('#')
+        df.loc[copies, gdp_column] *= rng.lognormal(0.0, 0.02, int(copies.sum()))
+
+        build_time, index = timed(lambda: TrajectoryIndex.from_frame(df, gdp_column))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'similarity_index.npz')
+            save_time, _ = timed(lambda: index.save(path))
+            size = os.path.getsize(path)
+            load_time, index = timed(lambda: TrajectoryIndex.load(path))
+        print(f"📦 scale {scale}: {len(index):,} entities, build {build_time:.2f}s, "
+              f"save {save_time * 1000:.0f}ms, load {load_time * 1000:.0f}ms ({size / 1024 ** 2:.1f} MB)")
+        print(f"{'metric':<12} {'median':>9} {'p95':>9} {'brute force':>12} {'speedup':>8} {'evaluated':>10}  match")
+
+        first_year, last_year = int(index.years[0]), int(index.years[-1])
+        for metric in METRICS:
+            times, evaluated, brute_times, matches = [], [], [], []
+            for q in range(args.queries):
+                length = int(rng.integers(10, last_year - first_year + 2))
+                start = int(rng.integers(first_year, last_year - length + 2))
+                end = start + length - 1
+                complete = np.flatnonzero(index.window_stats(start, end)[0])
+                entity = index.entities[rng.choice(complete)]
+                elapsed, result = timed(lambda: index.query(entity, start, end, args.k, metric, args.band))
+                times.append(elapsed)
+                evaluated.append(index.last_dtw_evaluated / max(len(complete) - 1, 1))
+                if q < args.brute_force_queries:
+                    brute_time, expected = timed(lambda: brute_force(index, entity, start, end, args.k,
+                                                                     metric, args.band))
+                    brute_times.append(brute_time)
+                    matches.append(expected == list(result['Entity']))
+            median = np.median(times)
+            brute = np.median(brute_times) if brute_times else np.nan
+            share = f"{np.mean(evaluated) * 100:>9.1f}%" if metric == 'dtw' else f"{'-':>10}"
+            print(f"{metric:<12} {median * 1000:>7.1f}ms {np.percentile(times, 95) * 1000:>7.1f}ms "
+                  f"{brute * 1000:>10.1f}ms {brute / median:>7.0f}x {share}  {'✅' if all(matches) else '❌'}")
+        print("-" * 92)
+
+
+if __name__ == '__main__':
+    main()
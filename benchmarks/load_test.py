@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Load test for the local HTTP query service (src/service.py).
+
+Starts a service instance in a subprocess (unless --url is given), then
+drives it with concurrent keep-alive clients for a fixed duration and
+reports requests/second and latency percentiles per endpoint.
+
+Usage:
+    python benchmarks/load_test.py [--concurrency 16] [--duration 10] [--no-cache]
+    python benchmarks/load_test.py --url http://127.0.0.1:8000
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+
+import numpy as np
+
+# Set up paths
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENDPOINTS = [
+    '/world-trends',
+    '/continent-trends',
+    '/top-bottom?year=2023&n=10',
+    '/top-bottom?year=2008&n=5',
+    '/crisis-impact',
+    '/growth-champions?min_years=15&top_n=10',
+    '/growth-champions?start_year=2000&end_year=2023',
+]
+
+
+async def fetch(reader, writer, host, path):
+    """One keep-alive GET; returns the status code"""
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\nConnection: keep-alive\r\n\r\n".encode('latin-1'))
+    await writer.drain()
+    head = await reader.readuntil(b'\r\n\r\n')
+    lines = head.decode('latin-1').split('\r\n')
+    status = int(lines[0].split(' ', 2)[1])
+    length = 0
+    for line in lines[1:]:
+        if line.lower().startswith('content-length:'):
+            length = int(line.split(':', 1)[1])
+    await reader.readexactly(length)
+    return status
+
+
+async def client(host, port, deadline, offset, latencies, failures):
+    """Cycle through the endpoints on one connection until the deadline"""
+    reader, writer = await asyncio.open_connection(host, port)
+    i = offset
+    try:
+        while time.perf_counter() < deadline:
+            path = ENDPOINTS[i % len(ENDPOINTS)]
+            i += 1
+            start = time.perf_counter()
+            try:
+                status = await fetch(reader, writer, host, path)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                failures[path] = failures.get(path, 0) + 1
+                writer.close()
+                reader, writer = await asyncio.open_connection(host, port)
+                continue
+            latencies.setdefault(path, []).append(time.perf_counter() - start)
+            if status != 200:
+                failures[path] = failures.get(path, 0) + 1
+    finally:
+        writer.close()
+
+
+async def run_load(host, port, concurrency, duration, warmup):
+    """Warm up, then run the timed phase; returns (latencies by endpoint, failures, elapsed)"""
+    if warmup:
+        await asyncio.gather(*(client(host, port, time.perf_counter() + warmup, i, {}, {})
+                               for i in range(min(concurrency, len(ENDPOINTS)))))
+
+    latencies, failures = {}, {}
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(*(client(host, port, deadline, i, latencies, failures) for i in range(concurrency)))
+    return latencies, failures, time.perf_counter() - start
+
+
+async def wait_until_ready(host, port, timeout=60):
+    """Poll /health until the service answers"""
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            reader, writer = await asyncio.open_connection(host, port)
+            status = await fetch(reader, writer, host, '/health')
+            writer.close()
+            if status == 200:
+                return
+        except (OSError, asyncio.IncompleteReadError):
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"Service on {host}:{port} did not become ready within {timeout}s")
+
+
+def print_report(latencies, failures, elapsed, concurrency):
+    """Throughput and per-endpoint latency table"""
+    total = sum(len(values) for values in latencies.values())
+    print(f"\n📈 {total:,} requests in {elapsed:.1f}s with {concurrency} clients: "
+          f"{total / elapsed:,.0f} req/s, {sum(failures.values())} failed")
+    print(f"{'endpoint':<48} {'count':>7} {'p50':>9} {'p90':>9} {'p99':>9}")
+
+    every = []
+    for path in ENDPOINTS:
+        values = np.array(latencies.get(path, [])) * 1000
+        every.append(values)
+        if len(values):
+            p50, p90, p99 = np.percentile(values, [50, 90, 99])
+            print(f"{path:<48} {len(values):>7,} {p50:>7.2f}ms {p90:>7.2f}ms {p99:>7.2f}ms")
+    values = np.concatenate(every) if every else np.array([])
+    if len(values):
+        p50, p90, p99 = np.percentile(values, [50, 90, 99])
+        print(f"{'all endpoints':<48} {len(values):>7,} {p50:>7.2f}ms {p90:>7.2f}ms {p99:>7.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--url', default=None, help='Target an already running service instead of starting one')
+    parser.add_argument('--port', type=int, default=8765, help='Port for the service started by this script')
+    parser.add_argument('--concurrency', type=int, default=16, help='Concurrent keep-alive connections')
+    parser.add_argument('--duration', type=float, default=10.0, help='Seconds of timed load')
+    parser.add_argument('--warmup', type=float, default=1.0, help='Seconds of untimed warm-up')
+    parser.add_argument('--no-cache', action='store_true', help='Start the service with its response cache disabled')
+    args = parser.parse_args()
+
+    process = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        host, port = '127.0.0.1', args.port
+        command = [sys.executable, '-m', 'src.service', '--host', host, '--port', str(port)]
+        if args.no_cache:
+            command.append('--no-cache')
+        process = subprocess.Popen(command, cwd=project_root, stdout=subprocess.DEVNULL)
+
+    try:
+        asyncio.run(wait_until_ready(host, port))
+        mode = 'external' if args.url else ('cache off' if args.no_cache else 'cache on')
+        print(f"🔥 Load testing http://{host}:{port} ({mode}) for {args.duration:.0f}s")
+        latencies, failures, elapsed = asyncio.run(
+            run_load(host, port, args.concurrency, args.duration, args.warmup))
+        print_report(latencies, failures, elapsed, args.concurrency)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite: public src/ functions on scaled synthetic panels.
+
+Every function is timed (best and median of --repeat runs) and profiled
+once under tracemalloc for peak memory; module import times are measured
+in fresh interpreters (python -X importtime). Each run is appended to a JSON
+history so regressions can be diffed between runs.
+
+Usage:
+    python benchmarks/run_suite.py [--scales 1,10,100] [--full] [--only trends]
+    python benchmarks/run_suite.py --diff            # latest run vs the one before
+    python benchmarks/run_suite.py --diff -3 -1      # any two runs from the history
+
+A scale of '100' means 100x more entities; '10x10' = 10x entities x 10x periods.
+--full adds the 1000x panel (~7M rows, several GB for build_features).
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+import warnings
+
+import numpy as np
+import pandas as pd
+
+warnings.filterwarnings('ignore')
+
+# Set up paths
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src import data_processing, memo, utils
+from src.features import build_features
+from src.forecasting import forecast_frame
+from src.indexing import PanelIndex
+from src.panel import GDPPanel
+from src.ranking import cross_section_percentiles
+from src.rolling import frame_rolling
+from src.similarity import TrajectoryIndex
+from bench_import import print_import_results, run_import_benchmark
+from synthetic import make_synthetic_panel, parse_scale
+
+DATA_FILE = os.path.join(project_root, 'data', 'gdp-per-capita-worldbank.csv')
+HISTORY_FILE = os.path.join(project_root, 'benchmarks', 'results', 'suite_history.json')
+DEFAULT_SCALES = '1,10,100'
+FULL_SCALE = '1000'
+
+# (name, callable(df, gdp_column)); names follow module.function
+BENCHMARKS = [
+    ('data_processing.prepare_analysis_data', data_processing.prepare_analysis_data),
+    ('data_processing.calculate_growth_rate', data_processing.calculate_growth_rate),
+    ('data_processing.get_moving_average', data_processing.get_moving_average),
+    ('data_processing.get_world_trends', data_processing.get_world_trends),
+    ('data_processing.get_continent_trends', data_processing.get_continent_trends),
+    ('data_processing.analyze_crisis_impact', data_processing.analyze_crisis_impact),
+    ('data_processing.get_inequality_trends', data_processing.get_inequality_trends),
+    ('data_processing.get_growth_champions_and_laggards', data_processing.get_growth_champions_and_laggards),
+    ('utils.add_continent_column', lambda df, gdp_column: utils.add_continent_column(df.drop(columns='Continent'))),
+    ('utils.calculate_growth_rate', utils.calculate_growth_rate),
+    ('utils.get_moving_average', utils.get_moving_average),
+    ('utils.filter_complete_data', lambda df, gdp_column: utils.filter_complete_data(df)),
+    ('utils.get_top_bottom_countries', lambda df, gdp_column: utils.get_top_bottom_countries(df, gdp_column, year=2023)),
+    ('utils.downcast_frame', utils.downcast_frame),
+    ('indexing.PanelIndex', PanelIndex),
+    ('panel.GDPPanel.from_frame', GDPPanel.from_frame),
+    ('features.build_features', build_features),
+    ('rolling.frame_rolling', lambda df, gdp_column: frame_rolling(df, gdp_column, 5, 'std')),
+    ('ranking.cross_section_percentiles', lambda df, gdp_column: cross_section_percentiles(
+        df, gdp_column, [['Year'], ['Year', 'Continent']])),
+    ('forecasting.forecast_frame', forecast_frame),
+    ('similarity.TrajectoryIndex.from_frame', TrajectoryIndex.from_frame),
+]
+
+
+def run_quiet(function, df, gdp_column):
+    """Call a benchmarked function with its progress prints suppressed"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return function(df, gdp_column)
+
+
+def measure(function, df, gdp_column, repeat):
+    """Return (best seconds, median seconds, peak MB) for one function"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run_quiet(function, df, gdp_column)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+
+    # Peak memory is measured in a separate run so tracing does not skew the timings
+    tracemalloc.start()
+    try:
+        run_quiet(function, df, gdp_column)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return timings[0], timings[len(timings) // 2], peak / 1024 ** 2
+
+
+def git_revision():
+    """Short commit hash of the working tree, or None outside git"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=project_root,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(path):
+    """Previous runs (oldest first)"""
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_history(history, path):
+    """Write the run history"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(history, f, indent=2)
+
+
+def run_suite(scales, repeat, only=None, imports=True):
+    """Benchmark every selected function at every scale and return the run record"""
+    import_times = {}
+    if imports:
+        print("\n📦 import time (fresh interpreter, median of 3)")
+        import_results = run_import_benchmark(repeat=3)
+        print_import_results(import_results)
+        import_times = {module: stats['ms'] for module, stats in import_results.items()}
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        df, gdp_column = data_processing.load_and_clean_data(DATA_FILE)
+    # Memoized aggregates would turn the repeats and the memory pass into cache hits
+    memo.configure(enabled=False)
+
+    benchmarks = [(name, fn) for name, fn in BENCHMARKS if not only or any(o in name for o in only)]
+    results = {}
+
+    for scale in scales:
+        entity_scale, period_scale = parse_scale(scale)
+        panel = make_synthetic_panel(df, gdp_column, entity_scale, period_scale)
+        print(f"\n📦 scale {scale}: {len(panel):,} rows, {panel['Entity'].nunique():,} entities")
+        print(f"{'function':<52} {'best':>10} {'median':>10} {'peak MB':>10}")
+
+        results[scale] = {'rows': len(panel), 'functions': {}}
+        for name, function in benchmarks:
+            # Slow functions get a single timed run on the big panels
+            runs = repeat if len(panel) <= 100_000 else 1
+            best, median, peak_mb = measure(function, panel, gdp_column, runs)
+            results[scale]['functions'][name] = {'best_s': best, 'median_s': median, 'peak_mb': peak_mb}
+            print(f"{name:<52} {best * 1000:>8.1f}ms {median * 1000:>8.1f}ms {peak_mb:>10.1f}")
+
+        del panel
+
+    return {
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'git': git_revision(),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'imports_ms': import_times,
+        'results': results
+    }
+
+
+def diff_runs(old, new, threshold=1.2):
+    """Print per-function time/memory ratios between two runs and return the regressions"""
+    print(f"🔍 {old['timestamp']} ({old.get('git')}) -> {new['timestamp']} ({new.get('git')})")
+    print(f"{'scale':>6} {'function':<52} {'time':>8} {'memory':>8}")
+
+    regressions = []
+    for scale, scale_results in new['results'].items():
+        old_scale = old['results'].get(scale)
+        if old_scale is None:
+            continue
+        for name, stats in scale_results['functions'].items():
+            before = old_scale['functions'].get(name)
+            if before is None:
+                continue
+            time_ratio = stats['best_s'] / before['best_s'] if before['best_s'] > 0 else np.nan
+            memory_ratio = stats['peak_mb'] / before['peak_mb'] if before['peak_mb'] > 0 else np.nan
+            flag = ''
+            if time_ratio > threshold or memory_ratio > threshold:
+                flag = '  ⚠️ regression'
+                regressions.append((scale, name, time_ratio, memory_ratio))
+            print(f"{scale:>6} {name:<52} {time_ratio:>7.2f}x {memory_ratio:>7.2f}x{flag}")
+
+    for module, ms in new.get('imports_ms', {}).items():
+        before = old.get('imports_ms', {}).get(module)
+        if not before:
+            continue
+        ratio = ms / before
+        flag = ''
+        if ratio > threshold:
+            flag = '  ⚠️ regression'
+            regressions.append(('import', module, ratio, np.nan))
+        print(f"{'import':>6} {module:<52} {ratio:>7.2f}x {'':>8}{flag}")
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) above {threshold:.2f}x")
+    else:
+        print(f"\n✅ No regressions above {threshold:.2f}x")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scales', default=DEFAULT_SCALES, help='Comma separated synthetic scales')
+    parser.add_argument('--full', action='store_true', help='Also run the 1000x panel')
+    parser.add_argument('--no-imports', action='store_true', help='Skip the import-time measurement')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per function (small panels)')
+    parser.add_argument('--only', default=None, help='Comma separated substrings of function names to run')
+    parser.add_argument('--history', default=HISTORY_FILE, help='JSON history file')
+    parser.add_argument('--no-save', action='store_true', help='Do not append this run to the history')
+    parser.add_argument('--diff', nargs='*', type=int, metavar='RUN',
+                        help='Compare two history entries (default: -2 -1) instead of running')
+    parser.add_argument('--threshold', type=float, default=1.2, help='Ratio reported as a regression')
+    args = parser.parse_args()
+
+    history = load_history(args.history)
+
+    if args.diff is not None:
+        old_index, new_index = args.diff if len(args.diff) == 2 else (-2, -1)
+        if len(history) < 2:
+            print(f"⚠️ Need at least two runs in {args.history} to diff")
+            return 1
+        regressions = diff_runs(history[old_index], history[new_index], args.threshold)
+        return 1 if regressions else 0
+
+    print("⏱️ Benchmark suite for src/ (synthetic panels)")
+    print("=" * 84)
+    only = args.only.split(',') if args.only else None
+    scales = args.scales.split(',')
+    if args.full and FULL_SCALE not in scales:
+        scales.append(FULL_SCALE)
+    run = run_suite(scales, args.repeat, only, imports=not args.no_imports)
+
+    if not args.no_save:
+        history.append(run)
+        save_history(history, args.history)
+        print(f"\n💾 Run #{len(history)} saved to {args.history}")
+        if len(history) > 1:
+            print()
+            diff_runs(history[-2], run, args.threshold)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -6,14 +6,13 @@ This script runs through all notebooks and saves plots to outputs/plots/
 
 import os
 import sys
+import time
+import argparse
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import plotly.io as pio
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -21,7 +20,9 @@ warnings.filterwarnings('ignore')
 project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(os.path.join(project_root, 'src'))
 data_path = os.path.join(project_root, 'data')
+source_csv = os.path.join(data_path, 'gdp-per-capita-worldbank.csv')
 output_path = os.path.join(project_root, 'outputs', 'plots')
+manifest_path = os.path.join(output_path, '.manifest.json')
 
 # Create output directory if it doesn't exist
 os.makedirs(output_path, exist_ok=True)
@@ -46,48 +47,103 @@ except ImportError:
             'United States': 'North America'
         }
 
+# Import the cached loader (falls back to parsing the CSV directly)
+sys.path.append(project_root)
+try:
+    from src.data_processing import load_and_clean_data
+    from src import instrumentation, memo
+    from src import manifest as build_manifest
+    from src.visualization import (RESOLUTION_PROFILES, PLOTLY_OUTPUT_MODES, set_plotly_output,
+                                   get_plotly_output, write_plotly_html, inspect_plotly_html)
+except ImportError:
+    load_and_clean_data = None
+    instrumentation = None
+    memo = None
+    build_manifest = None
+    RESOLUTION_PROFILES = {'print': {'dpi': 300, 'bbox_inches': 'tight', 'plotly_scale': 2}}
+    PLOTLY_OUTPUT_MODES = ('standalone',)
+    set_plotly_output = get_plotly_output = write_plotly_html = inspect_plotly_html = None
+
+# Active export profile (set from --resolution; 'print' is the original 300 dpi output)
+export_settings = {'resolution': 'print'}
+
+def plot_span(name, rows_in=None):
+    """Instrumentation span for a plot job (no-op when instrumentation is unavailable)"""
+    if instrumentation is None:
+        return contextlib.nullcontext({})
+    return instrumentation.span(name, rows_in=rows_in)
+
+def memoized_aggregate(name):
+    """Memoize an aggregate helper on the dataset fingerprint (no-op without src.memo)"""
+    if memo is None:
+        return lambda func: func
+    return memo.memoized(name)
+
 def load_and_prepare_data():
     """Load and prepare the GDP dataset"""
     print("📊 Loading GDP dataset...")
     
-    # Load data
-    df = pd.read_csv(os.path.join(data_path, 'gdp-per-capita-worldbank.csv'))
-    
-    # Add continent mapping
-    continent_mapping = get_continent_mapping()
-    df['Continent'] = df['Entity'].map(continent_mapping)
-    
-    # Clean data
     gdp_column = 'GDP per capita, PPP (constant 2021 international $)'
-    df_clean = df.dropna(subset=[gdp_column])
-    df_clean = df_clean[df_clean[gdp_column] > 0]
+    
+    if load_and_clean_data is not None:
+        # Served from the columnar cache on warm runs
+        df_clean, gdp_column = load_and_clean_data(source_csv)
+        df_clean = df_clean[df_clean[gdp_column] > 0]
+    else:
+        # Load data
+        df = pd.read_csv(source_csv)
+        
+        # Add continent mapping
+        continent_mapping = get_continent_mapping()
+        df['Continent'] = df['Entity'].map(continent_mapping)
+        
+        # Clean data
+        df_clean = df.dropna(subset=[gdp_column])
+        df_clean = df_clean[df_clean[gdp_column] > 0]
     
     print(f"✅ Data loaded: {len(df_clean)} records, {df_clean['Entity'].nunique()} countries")
     return df_clean, gdp_column
 
+def load_plotly():
+    """Import plotly only when a plotly figure is actually rendered"""
+    import plotly.express as px
+    import plotly.graph_objects as go
+    return px, go
+
 def save_plot(fig, filename, plot_type='matplotlib'):
-    """Save plot to outputs/plots/ directory"""
+    """Save plot to outputs/plots/ directory at the active resolution profile"""
+    profile = RESOLUTION_PROFILES[export_settings['resolution']]
     if plot_type == 'matplotlib':
         filepath = os.path.join(output_path, f"{filename}.png")
-        fig.savefig(filepath, dpi=300, bbox_inches='tight', facecolor='white')
+        fig.savefig(filepath, dpi=profile['dpi'], bbox_inches=profile['bbox_inches'], facecolor='white')
         print(f"💾 Saved: {filename}.png")
     elif plot_type == 'plotly':
         # Save as both HTML and PNG
         html_path = os.path.join(output_path, f"{filename}.html")
         png_path = os.path.join(output_path, f"{filename}.png")
         
-        fig.write_html(html_path)
+        if write_plotly_html is not None:
+            write_plotly_html(fig, html_path)
+        else:
+            fig.write_html(html_path)
         try:
-            fig.write_image(png_path, width=1200, height=800, scale=2)
+            fig.write_image(png_path, width=1200, height=800, scale=profile['plotly_scale'])
             print(f"💾 Saved: {filename}.html and {filename}.png")
         except Exception as e:
             print(f"💾 Saved: {filename}.html (PNG save failed: {e})")
 
-def generate_data_exploration_plots(df, gdp_column):
-    """Generate plots from data exploration notebook"""
-    print("\n🔍 Generating Data Exploration Plots...")
-    
-    # 1. GDP Distribution Histogram
+@memoized_aggregate('plots.world_average')
+def world_average(df, gdp_column):
+    """World average GDP per capita by year"""
+    return df.groupby('Year')[gdp_column].mean()
+
+@memoized_aggregate('plots.continent_average')
+def continent_average(df, gdp_column):
+    """Average GDP per capita by year and continent (long format)"""
+    return df.groupby(['Year', 'Continent'])[gdp_column].mean().reset_index()
+
+def plot_gdp_distribution(df, gdp_column):
+    """01 - GDP distribution histogram"""
     plt.figure(figsize=(12, 6))
     plt.hist(df[gdp_column], bins=50, alpha=0.7, color='skyblue', edgecolor='black')
     plt.title('Distribution of GDP Per Capita (2021 International $)', fontsize=16, fontweight='bold')
@@ -96,8 +152,9 @@ def generate_data_exploration_plots(df, gdp_column):
     plt.grid(True, alpha=0.3)
     save_plot(plt.gcf(), "01_gdp_distribution")
     plt.close()
-    
-    # 2. Data Completeness by Year
+
+def plot_data_availability(df, gdp_column):
+    """02 - Data completeness by year"""
     yearly_count = df.groupby('Year')['Entity'].count()
     plt.figure(figsize=(14, 6))
     plt.plot(yearly_count.index, yearly_count.values, marker='o', linewidth=2, markersize=6)
@@ -107,8 +164,9 @@ def generate_data_exploration_plots(df, gdp_column):
     plt.grid(True, alpha=0.3)
     save_plot(plt.gcf(), "02_data_availability")
     plt.close()
-    
-    # 3. Top and Bottom Countries (Latest Year)
+
+def plot_top_bottom_countries(df, gdp_column):
+    """03 - Top and bottom countries (latest year)"""
     latest_year = df['Year'].max()
     latest_data = df[df['Year'] == latest_year].sort_values(gdp_column, ascending=False)
     
@@ -134,12 +192,10 @@ def generate_data_exploration_plots(df, gdp_column):
     save_plot(fig, "03_top_bottom_countries")
     plt.close()
 
-def generate_eda_plots(df, gdp_column):
-    """Generate plots from EDA analysis notebook"""
-    print("\n📈 Generating EDA Analysis Plots...")
-    
-    # 1. World GDP Trend Over Time
-    world_avg = df.groupby('Year')[gdp_column].mean()
+def plot_world_gdp_trend(df, gdp_column):
+    """04 - World GDP trend over time"""
+    px, go = load_plotly()
+    world_avg = world_average(df, gdp_column)
     
     fig = go.Figure()
     fig.add_trace(go.Scatter(
@@ -159,20 +215,24 @@ def generate_eda_plots(df, gdp_column):
         template='plotly_white'
     )
     save_plot(fig, "04_world_gdp_trend", 'plotly')
-    
-    # 2. Continental Comparison
-    continent_data = df.groupby(['Year', 'Continent'])[gdp_column].mean().reset_index()
+
+def plot_continental_trends(df, gdp_column):
+    """05 - Continental comparison"""
+    px, go = load_plotly()
+    continent_data = continent_average(df, gdp_column)
     
     fig = px.line(continent_data, x='Year', y=gdp_column, color='Continent',
                   title='GDP Per Capita by Continent Over Time',
                   labels={gdp_column: 'GDP Per Capita (USD)'})
     fig.update_layout(height=600, template='plotly_white')
     save_plot(fig, "05_continental_trends", 'plotly')
-    
-    # 3. Crisis Impact Analysis (2008 vs COVID)
+
+def plot_crisis_impact(df, gdp_column):
+    """06 - Crisis impact analysis (2008 vs COVID)"""
+    px, go = load_plotly()
     crisis_years = [2007, 2008, 2009, 2019, 2020, 2021]
-    crisis_data = df[df['Year'].isin(crisis_years)]
-    world_crisis = crisis_data.groupby('Year')[gdp_column].mean()
+    world_avg = world_average(df, gdp_column)
+    world_crisis = world_avg[world_avg.index.isin(crisis_years)]
     
     fig = go.Figure()
     fig.add_trace(go.Scatter(
@@ -198,8 +258,9 @@ def generate_eda_plots(df, gdp_column):
         template='plotly_white'
     )
     save_plot(fig, "06_crisis_impact", 'plotly')
-    
-    # 4. Wealth Inequality Analysis
+
+def plot_wealth_distribution(df, gdp_column):
+    """07 - Wealth inequality (latest year distribution)"""
     latest_year = df['Year'].max()
     latest_data = df[df['Year'] == latest_year].dropna(subset=[gdp_column])
     
@@ -218,15 +279,16 @@ def generate_eda_plots(df, gdp_column):
     save_plot(plt.gcf(), "07_wealth_distribution")
     plt.close()
 
-def generate_feature_engineering_plots(df, gdp_column):
-    """Generate plots from feature engineering notebook"""
-    print("\n🔧 Generating Feature Engineering Plots...")
-    
-    # Calculate growth rates for visualization
+@memoized_aggregate('plots.yoy_growth')
+def add_yoy_growth(df, gdp_column):
+    """Sort by country/year and add year-over-year growth (%)"""
     df_sorted = df.sort_values(['Entity', 'Year'])
     df_sorted['yoy_growth'] = df_sorted.groupby('Entity')[gdp_column].pct_change() * 100
-    
-    # 1. Growth Rate Distribution
+    return df_sorted
+
+def plot_growth_distribution(df, gdp_column):
+    """08 - Growth rate distribution"""
+    df_sorted = add_yoy_growth(df, gdp_column)
     growth_data = df_sorted.dropna(subset=['yoy_growth'])
     
     plt.figure(figsize=(12, 6))
@@ -239,8 +301,10 @@ def generate_feature_engineering_plots(df, gdp_column):
     plt.grid(True, alpha=0.3)
     save_plot(plt.gcf(), "08_growth_distribution")
     plt.close()
-    
-    # 2. Volatility Analysis (Major Economies)
+
+def plot_volatility_analysis(df, gdp_column):
+    """09 - Volatility analysis (major economies)"""
+    df_sorted = add_yoy_growth(df, gdp_column)
     major_economies = ['United States', 'China', 'Germany', 'Japan', 'United Kingdom']
     volatility_data = []
     
@@ -258,6 +322,7 @@ def generate_feature_engineering_plots(df, gdp_column):
     if volatility_data:
         vol_df = pd.DataFrame(volatility_data)
         
+        px, go = load_plotly()
         fig = go.Figure()
         fig.add_trace(go.Scatter(
             x=vol_df['Volatility'],
@@ -278,19 +343,14 @@ def generate_feature_engineering_plots(df, gdp_column):
         )
         save_plot(fig, "09_volatility_analysis", 'plotly')
 
-def generate_summary_dashboard():
-    """Generate a comprehensive summary dashboard"""
-    print("\n📊 Generating Summary Dashboard...")
-    
+def plot_summary_dashboard(df, gdp_column):
+    """10 - Multi-panel summary dashboard"""
     # Create a multi-panel summary plot
     fig, axes = plt.subplots(2, 2, figsize=(16, 12))
     fig.suptitle('Global GDP Analysis - Summary Dashboard', fontsize=20, fontweight='bold')
     
-    # Load data for summary
-    df, gdp_column = load_and_prepare_data()
-    
     # Panel 1: World trend
-    world_avg = df.groupby('Year')[gdp_column].mean()
+    world_avg = world_average(df, gdp_column)
     axes[0,0].plot(world_avg.index, world_avg.values, linewidth=2, color='blue')
     axes[0,0].set_title('World GDP Trend', fontweight='bold')
     axes[0,0].set_xlabel('Year')
@@ -307,8 +367,7 @@ def generate_summary_dashboard():
     axes[0,1].set_xlabel('GDP Per Capita (USD)')
     
     # Panel 3: Growth distribution
-    df_sorted = df.sort_values(['Entity', 'Year'])
-    df_sorted['yoy_growth'] = df_sorted.groupby('Entity')[gdp_column].pct_change() * 100
+    df_sorted = add_yoy_growth(df, gdp_column)
     growth_clean = df_sorted['yoy_growth'].dropna()
     axes[1,0].hist(growth_clean, bins=30, alpha=0.7, color='orange')
     axes[1,0].set_title('Growth Rate Distribution', fontweight='bold')
@@ -329,23 +388,309 @@ def generate_summary_dashboard():
     save_plot(fig, "10_summary_dashboard")
     plt.close()
 
-def main():
+# Every output is an independent job: (name, function(df, gdp_column))
+PLOT_JOBS = [
+    ('01_gdp_distribution', plot_gdp_distribution),
+    ('02_data_availability', plot_data_availability),
+    ('03_top_bottom_countries', plot_top_bottom_countries),
+    ('04_world_gdp_trend', plot_world_gdp_trend),
+    ('05_continental_trends', plot_continental_trends),
+    ('06_crisis_impact', plot_crisis_impact),
+    ('07_wealth_distribution', plot_wealth_distribution),
+    ('08_growth_distribution', plot_growth_distribution),
+    ('09_volatility_analysis', plot_volatility_analysis),
+    ('10_summary_dashboard', plot_summary_dashboard),
+]
+
+# Build graph: per plot, the aggregation helpers it reads (besides its own
+# function) and the files it must produce. Their source code, the source CSV
+# hash and the export parameters form the fingerprint kept in the manifest.
+PLOT_INPUTS = {
+    '01_gdp_distribution': {'aggregates': [], 'outputs': ['01_gdp_distribution.png']},
+    '02_data_availability': {'aggregates': [], 'outputs': ['02_data_availability.png']},
+    '03_top_bottom_countries': {'aggregates': [], 'outputs': ['03_top_bottom_countries.png']},
+    '04_world_gdp_trend': {'aggregates': [world_average],
+                           'outputs': ['04_world_gdp_trend.html', '04_world_gdp_trend.png']},
+    '05_continental_trends': {'aggregates': [continent_average],
+                              'outputs': ['05_continental_trends.html', '05_continental_trends.png']},
+    '06_crisis_impact': {'aggregates': [world_average],
+                         'outputs': ['06_crisis_impact.html', '06_crisis_impact.png']},
+    '07_wealth_distribution': {'aggregates': [], 'outputs': ['07_wealth_distribution.png']},
+    '08_growth_distribution': {'aggregates': [add_yoy_growth], 'outputs': ['08_growth_distribution.png']},
+    '09_volatility_analysis': {'aggregates': [add_yoy_growth],
+                               'outputs': ['09_volatility_analysis.html', '09_volatility_analysis.png']},
+    '10_summary_dashboard': {'aggregates': [world_average, add_yoy_growth],
+                             'outputs': ['10_summary_dashboard.png']},
+}
+
+# Code every plot depends on: loading/cleaning and export
+SHARED_PLOT_INPUTS = [load_and_prepare_data, get_continent_mapping, save_plot, load_plotly]
+
+# src/ modules the jobs import, directly or through each other (loading, cache,
+# HTML export, downsampling). Whole files are hashed, so helpers called by the
+# imported functions are covered too.
+SHARED_PLOT_SOURCES = ['cache.py', 'data_processing.py', 'downsample.py', 'panel.py', 'rolling.py', 'utils.py',
+                       'visualization.py']
+
+def generate_data_exploration_plots(df, gdp_column):
+    """Generate plots from data exploration notebook"""
+    print("\n🔍 Generating Data Exploration Plots...")
+    plot_gdp_distribution(df, gdp_column)
+    plot_data_availability(df, gdp_column)
+    plot_top_bottom_countries(df, gdp_column)
+
+def generate_eda_plots(df, gdp_column):
+    """Generate plots from EDA analysis notebook"""
+    print("\n📈 Generating EDA Analysis Plots...")
+    plot_world_gdp_trend(df, gdp_column)
+    plot_continental_trends(df, gdp_column)
+    plot_crisis_impact(df, gdp_column)
+    plot_wealth_distribution(df, gdp_column)
+
+def generate_feature_engineering_plots(df, gdp_column):
+    """Generate plots from feature engineering notebook"""
+    print("\n🔧 Generating Feature Engineering Plots...")
+    plot_growth_distribution(df, gdp_column)
+    plot_volatility_analysis(df, gdp_column)
+
+def generate_summary_dashboard(df=None, gdp_column=None):
+    """Generate a comprehensive summary dashboard"""
+    print("\n📊 Generating Summary Dashboard...")
+    
+    # Load data for summary when it is not passed in
+    if df is None:
+        df, gdp_column = load_and_prepare_data()
+    
+    plot_summary_dashboard(df, gdp_column)
+
+# Data shared with pool workers once at start-up (not re-sent with every task)
+_worker_data = {}
+
+def _init_worker(df, gdp_column, instrument_enabled=False, resolution='print', plotly_output=None):
+    """Pool initializer: keep the dataset in the worker process"""
+    plt.switch_backend('Agg')
+    export_settings['resolution'] = resolution
+    if plotly_output and set_plotly_output is not None:
+        set_plotly_output(**plotly_output)
+    if instrument_enabled and instrumentation is not None:
+        # Forked workers inherit the parent's spans; start from an empty list
+        instrumentation.reset()
+        instrumentation.enable()
+    _worker_data['df'] = df
+    _worker_data['gdp_column'] = gdp_column
+
+def _run_plot_job(name):
+    """Render one plot job in a worker and return its timing and spans"""
+    plot_function = dict(PLOT_JOBS)[name]
+    df = _worker_data['df']
+    start = time.perf_counter()
+    try:
+        with plot_span(f'plot.{name}', rows_in=len(df)):
+            plot_function(df, _worker_data['gdp_column'])
+        error = None
+    except Exception as e:
+        error = str(e)
+    records = instrumentation.drain() if instrumentation is not None else []
+    return name, time.perf_counter() - start, error, records
+
+def select_plot_jobs(only=None):
+    """Plot jobs whose name starts with one of the given prefixes (all when only is empty)"""
+    if not only:
+        return PLOT_JOBS
+    return [(name, fn) for name, fn in PLOT_JOBS if any(name.startswith(prefix) for prefix in only)]
+
+def run_plot_jobs(df, gdp_column, jobs=1, only=None):
+    """Render the selected plot jobs, sequentially or across a process pool"""
+    timings = []
+    plot_jobs = select_plot_jobs(only)
+    
+    if jobs <= 1:
+        for name, plot_function in plot_jobs:
+            start = time.perf_counter()
+            try:
+                with plot_span(f'plot.{name}', rows_in=len(df)):
+                    plot_function(df, gdp_column)
+                error = None
+            except Exception as e:
+                error = str(e)
+            timings.append((name, time.perf_counter() - start, error))
+        return timings
+    
+    print(f"\n⚙️ Rendering {len(plot_jobs)} plots with {jobs} worker processes...")
+    instrument_enabled = instrumentation is not None and instrumentation.is_enabled()
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(df, gdp_column, instrument_enabled, export_settings['resolution'],
+                                       get_plotly_output() if get_plotly_output is not None else None)) as executor:
+        futures = [executor.submit(_run_plot_job, name) for name, _ in plot_jobs]
+        for future in as_completed(futures):
+            name, elapsed, error, records = future.result()
+            if instrument_enabled:
+                instrumentation.extend(records)
+            timings.append((name, elapsed, error))
+    
+    # Report in job order regardless of completion order
+    order = {name: i for i, (name, _) in enumerate(plot_jobs)}
+    return sorted(timings, key=lambda item: order[item[0]])
+
+def plot_fingerprints(plot_jobs):
+    """Fingerprint per plot job from the source CSV, its code, the shared src/ modules and the export parameters"""
+    data_hash = build_manifest.file_hash(source_csv)
+    sources = {name: build_manifest.file_hash(os.path.join(project_root, 'src', name))
+               for name in SHARED_PLOT_SOURCES}
+    params = {'resolution': RESOLUTION_PROFILES[export_settings['resolution']],
+              'plotly_output': get_plotly_output() if get_plotly_output is not None else None,
+              'matplotlib': plt.matplotlib.__version__,
+              'sources': sources}
+    return {name: build_manifest.output_fingerprint(
+                data_hash, [plot_function] + PLOT_INPUTS[name]['aggregates'] + SHARED_PLOT_INPUTS, params)
+            for name, plot_function in plot_jobs}
+
+def plot_outputs(name):
+    """Files a plot job must leave behind (compact HTML also needs the shared plotly.js)"""
+    outputs = list(PLOT_INPUTS[name]['outputs'])
+    compact = get_plotly_output is not None and get_plotly_output()['mode'] == 'compact'
+    if compact and any(output.endswith('.html') for output in outputs):
+        outputs.append('plotly.min.js')
+    return outputs
+
+def plan_plot_jobs(plot_jobs, fingerprints, targets, force=False):
+    """Split plot jobs into (stale, up to date) names against the manifest"""
+    if force or build_manifest is None:
+        return [name for name, _ in plot_jobs], []
+    stale, fresh = [], []
+    for name, _ in plot_jobs:
+        if build_manifest.is_stale(targets, name, fingerprints[name], output_path, plot_outputs(name)):
+            stale.append(name)
+        else:
+            fresh.append(name)
+    return stale, fresh
+
+def print_timings(timings, wall_time, skipped=()):
+    """Print per-plot render timings"""
+    print("\n⏱️ Per-plot timings:")
+    for name, elapsed, error in timings:
+        status = f"❌ {error}" if error else "✅"
+        print(f"  {name:<28} {elapsed:7.2f}s  {status}")
+    for name in skipped:
+        print(f"  {name:<28} {'-':>7}   ⏭️ up to date")
+    print(f"  {'total (sum of jobs)':<28} {sum(t for _, t, _ in timings):7.2f}s")
+    print(f"  {'wall time':<28} {wall_time:7.2f}s")
+
+def report_html_outputs(names):
+    """Print size, embedded points and load proxy of the HTML files written by these plots"""
+    paths = [os.path.join(output_path, output) for name in names
+             for output in PLOT_INPUTS[name]['outputs'] if output.endswith('.html')]
+    paths = [path for path in paths if os.path.exists(path)]
+    if not paths or inspect_plotly_html is None:
+        return
+    print(f"\n🌐 HTML outputs ({get_plotly_output()['mode']} mode):")
+    print(f"  {'file':<32} {'size':>9} {'points':>8} {'read+decode':>12}  plotly.js")
+    reports = [inspect_plotly_html(path) for path in paths]
+    for report in reports:
+        bundle = 'embedded' if report['embedded_plotlyjs'] else 'shared'
+        print(f"  {os.path.basename(report['path']):<32} {report['bytes'] / 1024:>7.0f}KB "
+              f"{report['points']:>8,} {report['load_ms']:>10.1f}ms  {bundle}")
+    total = sum(report['bytes'] for report in reports)
+    shared_js = os.path.join(output_path, 'plotly.min.js')
+    if not all(report['embedded_plotlyjs'] for report in reports) and os.path.exists(shared_js):
+        total += os.path.getsize(shared_js)
+        print(f"  {'plotly.min.js (loaded once)':<32} {os.path.getsize(shared_js) / 1024:>7.0f}KB")
+    print(f"  {'total':<32} {total / 1024:>7.0f}KB")
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description='Generate all GDP analysis plots into outputs/plots/')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Number of worker processes used to render plots (default: 1)')
+    parser.add_argument('--only', nargs='+', metavar='PLOT',
+                        help='Render only plots whose name starts with these prefixes, e.g. --only 01 07 '
+                             '(plotly is imported only if a plotly plot is selected)')
+    parser.add_argument('--force', action='store_true',
+                        help='Rebuild every selected plot, ignoring the manifest of up-to-date outputs')
+    parser.add_argument('--resolution', choices=sorted(RESOLUTION_PROFILES), default='print',
+                        help='Export profile: preview (72 dpi), web (110 dpi) or print (300 dpi, default)')
+    parser.add_argument('--plotly-output', choices=PLOTLY_OUTPUT_MODES, default='standalone',
+                        help='standalone embeds plotly.js and all points in each HTML file; compact shares one '
+                             'plotly.min.js, downsamples large traces and uses WebGL')
+    parser.add_argument('--max-points', type=int, default=2000,
+                        help='Point budget per trace in compact mode (LTTB downsampling beyond it)')
+    parser.add_argument('--webgl-threshold', type=int, default=1000,
+                        help='Traces with at least this many points are drawn with WebGL in compact mode')
+    parser.add_argument('--memo', action='store_true',
+                        help='Memoize the shared aggregates (world/continent averages, growth) across plots')
+    parser.add_argument('--memo-dir', default=os.path.join(data_path, '.cache', 'aggregates'),
+                        help='On-disk tier for memoized aggregates, reused across runs (with --memo)')
+    parser.add_argument('--no-memo-disk', action='store_true',
+                        help='Keep memoized aggregates in memory only (with --memo)')
+    parser.add_argument('--instrument', action='store_true',
+                        help='Record per-call timing spans and print a summary at the end')
+    parser.add_argument('--instrument-output', default=os.path.join(project_root, 'outputs', 'instrumentation.json'),
+                        help='JSON file for the instrumentation summary (with --instrument)')
+    return parser.parse_args(argv)
+
+def report_instrumentation(output_file):
+    """Print the span summary table and write it as JSON"""
+    print("\n🔬 Instrumentation summary (sorted by total time):")
+    print(instrumentation.format_summary())
+    instrumentation.write_summary(output_file)
+    print(f"💾 Instrumentation JSON saved to: {output_file}")
+
+def main(argv=None):
     """Main function to generate all plots"""
+    args = parse_args(argv)
+    
+    # Batch export: files only, so use the non-interactive backend
+    plt.switch_backend('Agg')
+    export_settings['resolution'] = args.resolution
+    if set_plotly_output is not None:
+        set_plotly_output(args.plotly_output, args.max_points, args.webgl_threshold)
+    instrumented = args.instrument and instrumentation is not None
+    if instrumented:
+        instrumentation.enable()
+    memoize = args.memo and memo is not None
+    if memoize:
+        memo.configure(disk_dir='' if args.no_memo_disk else args.memo_dir, enabled=True)
+    
     print("🎨 Starting plot generation for GDP Analysis Project...")
     print("=" * 60)
+    print(f"🖼️ Resolution profile: {args.resolution}")
     
     try:
-        # Load data
-        df, gdp_column = load_and_prepare_data()
+        # Only plots whose inputs changed (or whose files are missing) are rebuilt
+        plot_jobs = select_plot_jobs(args.only)
+        fingerprints, targets = {}, {}
+        if build_manifest is not None:
+            fingerprints = plot_fingerprints(plot_jobs)
+            targets = build_manifest.load_manifest(manifest_path)
+        stale, fresh = plan_plot_jobs(plot_jobs, fingerprints, targets, force=args.force)
+        if fresh:
+            print(f"⏭️ {len(fresh)} plot(s) up to date, {len(stale)} to rebuild (--force rebuilds all)")
         
-        # Generate all plot categories
-        generate_data_exploration_plots(df, gdp_column)
-        generate_eda_plots(df, gdp_column)
-        generate_feature_engineering_plots(df, gdp_column)
-        generate_summary_dashboard()
+        timings, wall_time = [], 0.0
+        if stale:
+            # Load data once; every plot job reuses it
+            with plot_span('load_and_prepare_data') as record:
+                df, gdp_column = load_and_prepare_data()
+                record['rows_out'] = len(df)
+            
+            start = time.perf_counter()
+            timings = run_plot_jobs(df, gdp_column, jobs=args.jobs, only=stale)
+            wall_time = time.perf_counter() - start
+        
+        if build_manifest is not None and timings:
+            for name, _, error in timings:
+                if not error:
+                    build_manifest.record_target(targets, name, fingerprints[name], plot_outputs(name))
+            build_manifest.save_manifest(manifest_path, targets)
         
         print("\n" + "=" * 60)
-        print("🎉 All visualizations have been generated successfully!")
+        failed = [name for name, _, error in timings if error]
+        if failed:
+            print(f"⚠️ {len(failed)} plot(s) failed: {', '.join(failed)}")
+        elif not stale:
+            print("✨ All visualizations are up to date; nothing to rebuild.")
+        else:
+            print("🎉 All visualizations have been generated successfully!")
         print(f"📁 Plots saved to: {output_path}")
         
         # List generated files
@@ -353,6 +698,15 @@ def main():
         print(f"📊 Generated {len(plot_files)} visualization files:")
         for file in sorted(plot_files):
             print(f"  • {file}")
+        
+        print_timings(timings, wall_time, skipped=fresh)
+        report_html_outputs([name for name, _, error in timings if not error])
+        if memoize and args.jobs <= 1 and stale:
+            stats = memo.cache_stats()
+            print(f"🧠 Aggregate cache: {stats['hits']} hits, {stats['disk_hits']} disk hits, "
+                  f"{stats['misses']} misses")
+        if instrumented:
+            report_instrumentation(args.instrument_output)
             
     except Exception as e:
         print(f"❌ Error generating plots: {e}")
@@ -360,4 +714,4 @@ def main():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
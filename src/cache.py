@@ -0,0 +1,110 @@
+"""
+Columnar cache for the cleaned GDP per capita dataset
+Author: GitHub Portfolio Project
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+CACHE_VERSION = 1
+CACHE_DIR_NAME = '.cache'
+CATEGORICAL_COLUMNS = ['Entity', 'Code', 'Continent']
+
+
+def get_cache_path(file_path, cache_dir=None):
+    """
+    Return the cache file used for a given source CSV
+    """
+    source = os.path.abspath(file_path)
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(source), CACHE_DIR_NAME)
+    stem = os.path.splitext(os.path.basename(source))[0]
+    return os.path.join(cache_dir, f'{stem}.npz')
+
+
+def source_fingerprint(file_path, continent_mapping):
+    """
+    Fingerprint the source CSV (size + mtime) together with the continent mapping
+    """
+    stat = os.stat(file_path)
+    digest = hashlib.sha256()
+    digest.update(f'v{CACHE_VERSION}:{stat.st_size}:{stat.st_mtime_ns}:'.encode('utf-8'))
+    digest.update(json.dumps(continent_mapping, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def write_cache(df, gdp_column, cache_path, fingerprint):
+    """
+    Store a cleaned frame column by column (categorical codes, int16 years)
+    """
+    arrays = {'index': df.index.to_numpy(dtype=np.int64)}
+    columns = []
+
+    for col in df.columns:
+        columns.append(col)
+        if col in CATEGORICAL_COLUMNS:
+            categorical = pd.Categorical(df[col])
+            arrays[f'{col}__codes'] = categorical.codes
+            arrays[f'{col}__categories'] = np.asarray(categorical.categories, dtype=str)
+        elif col == 'Year':
+            arrays[col] = df[col].to_numpy(dtype=np.int16)
+        else:
+            arrays[col] = df[col].to_numpy()
+
+    meta = {
+        'version': CACHE_VERSION,
+        'fingerprint': fingerprint,
+        'gdp_column': gdp_column,
+        'columns': columns,
+    }
+    arrays['__meta__'] = np.array(json.dumps(meta))
+
+    # Write to a temporary file first so readers never see a half-written cache
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = f'{cache_path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_path, cache_path)
+
+
+def read_cache(cache_path, fingerprint):
+    """
+    Read a cached frame, returning None when it is missing or stale
+    """
+    if not os.path.exists(cache_path):
+        return None
+
+    try:
+        with np.load(cache_path, allow_pickle=False) as data:
+            meta = json.loads(str(data['__meta__']))
+            if meta.get('version') != CACHE_VERSION or meta.get('fingerprint') != fingerprint:
+                return None
+
+            columns = {}
+            for col in meta['columns']:
+                if col in CATEGORICAL_COLUMNS:
+                    columns[col] = pd.Categorical.from_codes(
+                        data[f'{col}__codes'], data[f'{col}__categories']
+                    )
+                else:
+                    columns[col] = data[col]
+            index = data['index']
+    except (OSError, ValueError, KeyError):
+        # Corrupt or incompatible cache files are simply rebuilt
+        return None
+
+    df = pd.DataFrame(columns, index=pd.Index(index), columns=meta['columns'])
+    return df, meta['gdp_column']
+
+
+def clear_cache(file_path, cache_dir=None):
+    """
+    Remove the cache file for a given source CSV
+    """
+    cache_path = get_cache_path(file_path, cache_dir)
+    if os.path.exists(cache_path):
+        os.remove(cache_path)
@@ -0,0 +1,270 @@
+"""
+Pre-aggregated Year x Continent x income bracket cube for GDP per capita analysis
+Author: GitHub Portfolio Project
+"""
+
+import json
+import os
+
+import pandas as pd
+import numpy as np
+from .utils import get_income_brackets
+
+CUBE_VERSION = 1
+UNMAPPED = 'Unmapped'
+DIMENSIONS = ('Year', 'Continent', 'Bracket')
+
+# Log-spaced histogram edges for approximate quantiles (~5% relative bin width)
+HIST_LOG_MIN = 1.0
+HIST_LOG_MAX = 6.5
+HIST_BINS = 256
+
+
+def _bracket_codes(values):
+    """
+    Income bracket code per value (bins from utils.get_income_brackets, 0 included in the lowest)
+    """
+    bins, labels = get_income_brackets()
+    codes = pd.cut(values, bins=bins, labels=False, include_lowest=True)
+    return np.asarray(codes, dtype=np.float64), list(labels)
+
+
+class AggregateCube:
+    """
+    count / sum / sum of squares / min / max and a log-histogram per
+    (Year, Continent, income bracket) cell
+
+    Any rollup over the three dimensions (with optional filters) is answered
+    from the cell arrays without touching row data: means and standard
+    deviations come from the moment sums, min/max are exact and quantiles
+    are interpolated from the histogram. Rows without a continent are kept
+    under 'Unmapped' so world-level rollups include them. Cubes built from
+    new rows merge in with append(); rows are assumed not to be present
+    already.
+    """
+
+    def __init__(self, years, continents, brackets, gdp_column, count, total, total_sq,
+                 minimum, maximum, hist, hist_edges):
+        self.years = np.asarray(years, dtype=np.int64)
+        self.continents = list(continents)
+        self.brackets = list(brackets)
+        self.gdp_column = gdp_column
+        self.count = count
+        self.total = total
+        self.total_sq = total_sq
+        self.minimum = minimum
+        self.maximum = maximum
+        self.hist = hist
+        self.hist_edges = hist_edges
+
+    @classmethod
+    def empty(cls, gdp_column, years=(), continents=(), brackets=None, hist_bins=HIST_BINS):
+        if brackets is None:
+            brackets = get_income_brackets()[1]
+        shape = (len(years), len(continents), len(brackets))
+        return cls(years, continents, brackets, gdp_column,
+                   np.zeros(shape, dtype=np.int64), np.zeros(shape), np.zeros(shape),
+                   np.full(shape, np.inf), np.full(shape, -np.inf),
+                   np.zeros(shape + (hist_bins,), dtype=np.int64),
+                   np.logspace(HIST_LOG_MIN, HIST_LOG_MAX, hist_bins + 1))
+
+    @classmethod
+    def from_frame(cls, df, gdp_column, hist_bins=HIST_BINS):
+        """
+        Build the cube from a long-format frame (output of load_and_clean_data)
+        """
+        values = df[gdp_column].to_numpy(dtype=np.float64)
+        bracket_codes, brackets = _bracket_codes(values)
+        continent = df['Continent'].astype(object).where(df['Continent'].notna(), UNMAPPED)
+        keep = ~np.isnan(bracket_codes)
+
+        year_codes, years = pd.factorize(df['Year'].to_numpy()[keep], sort=True)
+        continent_codes, continents = pd.factorize(continent.to_numpy()[keep], sort=True)
+        bracket_codes = bracket_codes[keep].astype(np.int64)
+        values = values[keep]
+
+        cube = cls.empty(gdp_column, years, continents, brackets, hist_bins)
+        n_cells = cube.count.size
+        cell = np.ravel_multi_index((year_codes, continent_codes, bracket_codes), cube.count.shape)
+
+        cube.count = np.bincount(cell, minlength=n_cells).reshape(cube.count.shape)
+        cube.total = np.bincount(cell, weights=values, minlength=n_cells).reshape(cube.count.shape)
+        cube.total_sq = np.bincount(cell, weights=values * values, minlength=n_cells).reshape(cube.count.shape)
+        minimum = cube.minimum.reshape(-1)
+        maximum = cube.maximum.reshape(-1)
+        np.minimum.at(minimum, cell, values)
+        np.maximum.at(maximum, cell, values)
+
+        # Histogram bin per value; out-of-range values land in the edge bins
+        hist_bin = np.clip(np.searchsorted(cube.hist_edges, values, side='right') - 1, 0, hist_bins - 1)
+        cube.hist = np.bincount(cell * hist_bins + hist_bin,
+                                minlength=n_cells * hist_bins).reshape(cube.hist.shape)
+        return cube
+
+    @property
+    def shape(self):
+        return self.count.shape
+
+    def __repr__(self):
+        year_range = f"{self.years.min()}-{self.years.max()}" if len(self.years) else "empty"
+        return (f"AggregateCube({len(self.years)} years {year_range} x {len(self.continents)} continents x "
+                f"{len(self.brackets)} brackets, {int(self.count.sum()):,} rows)")
+
+    def _reindexed(self, years, continents):
+        """
+        Copy of the cube arrays laid out on (years, continents); new cells are empty
+        """
+        target = AggregateCube.empty(self.gdp_column, years, continents, self.brackets, len(self.hist_edges) - 1)
+        year_pos = np.searchsorted(years, self.years)
+        continent_pos = np.array([continents.index(c) for c in self.continents], dtype=np.int64)
+        index = np.ix_(year_pos, continent_pos)
+        for name in ('count', 'total', 'total_sq', 'minimum', 'maximum', 'hist'):
+            getattr(target, name)[index] = getattr(self, name)
+        return target
+
+    def append(self, df):
+        """
+        Fold newly appended rows into the cube (in place) and return it
+        """
+        other = AggregateCube.from_frame(df, self.gdp_column, len(self.hist_edges) - 1)
+        if not np.array_equal(other.hist_edges, self.hist_edges) or other.brackets != self.brackets:
+            raise ValueError("Cubes use different histogram edges or income brackets")
+
+        years = np.union1d(self.years, other.years)
+        continents = sorted(set(self.continents) | set(other.continents))
+        merged = self._reindexed(years, continents)
+        incoming = other._reindexed(years, continents)
+
+        merged.count += incoming.count
+        merged.total += incoming.total
+        merged.total_sq += incoming.total_sq
+        merged.hist += incoming.hist
+        np.minimum(merged.minimum, incoming.minimum, out=merged.minimum)
+        np.maximum(merged.maximum, incoming.maximum, out=merged.maximum)
+
+        self.__dict__.update(merged.__dict__)
+        return self
+
+    def _selection(self, filters):
+        """
+        Index arrays per dimension for a {dimension: values} filter
+        """
+        labels = {'Year': list(self.years), 'Continent': self.continents, 'Bracket': self.brackets}
+        filters = filters or {}
+        for dim in filters:
+            if dim not in labels:
+                raise ValueError(f"Unknown dimension: {dim}")
+
+        selection = []
+        for dim in DIMENSIONS:
+            allowed = filters.get(dim)
+            if allowed is None:
+                selection.append(np.arange(len(labels[dim])))
+                continue
+            allowed = set(allowed) if not isinstance(allowed, (str, int, np.integer)) else {allowed}
+            selection.append(np.array([i for i, label in enumerate(labels[dim]) if label in allowed],
+                                      dtype=np.int64))
+        return selection, labels
+
+    def _quantiles(self, hist, minimum, maximum, count, q):
+        """
+        Approximate q-quantile per cell from the histogram (log interpolation, clamped to min/max)
+        """
+        cumulative = np.cumsum(hist, axis=-1)
+        target = q * count
+        bin_index = np.minimum((cumulative < target[..., None]).sum(axis=-1), hist.shape[-1] - 1)
+        below = np.where(bin_index > 0, np.take_along_axis(cumulative, np.maximum(bin_index - 1, 0)[..., None],
+                                                           axis=-1)[..., 0], 0)
+        in_bin = np.take_along_axis(hist, bin_index[..., None], axis=-1)[..., 0]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fraction = np.where(in_bin > 0, (target - below) / in_bin, 0.5)
+        log_edges = np.log10(self.hist_edges)
+        log_value = log_edges[bin_index] + np.clip(fraction, 0, 1) * (log_edges[bin_index + 1] - log_edges[bin_index])
+        estimate = np.clip(10 ** log_value, minimum, maximum)
+        return np.where(count > 0, estimate, np.nan)
+
+    def rollup(self, by=('Year',), filters=None, quantiles=(0.5,)):
+        """
+        Aggregate the cube to the `by` dimensions after applying filters
+
+        Returns one row per non-empty group with count, mean, std (ddof=1),
+        min, max and approximate quantiles (columns p50, p90, ...).
+        """
+        by = [by] if isinstance(by, str) else list(by)
+        for dim in by:
+            if dim not in DIMENSIONS:
+                raise ValueError(f"Unknown dimension: {dim}")
+        selection, labels = self._selection(filters)
+        index = np.ix_(*selection)
+        drop_axes = tuple(i for i, dim in enumerate(DIMENSIONS) if dim not in by)
+
+        count = self.count[index].sum(axis=drop_axes)
+        total = self.total[index].sum(axis=drop_axes)
+        total_sq = self.total_sq[index].sum(axis=drop_axes)
+        minimum = self.minimum[index].min(axis=drop_axes, initial=np.inf)
+        maximum = self.maximum[index].max(axis=drop_axes, initial=-np.inf)
+        hist = self.hist[index].sum(axis=drop_axes)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = total / count
+            variance = np.maximum(total_sq - total * mean, 0.0) / (count - 1)
+        std = np.where(count > 1, np.sqrt(variance), np.nan)
+
+        columns = {}
+        grids = np.meshgrid(*[np.arange(len(selection[DIMENSIONS.index(dim)])) for dim in by], indexing='ij')
+        for dim, grid in zip(by, grids):
+            dim_labels = np.asarray(labels[dim], dtype=object)[selection[DIMENSIONS.index(dim)]]
+            columns[dim] = dim_labels[grid].reshape(-1) if grid.size else np.array([], dtype=object)
+        columns['count'] = count.reshape(-1)
+        columns['mean'] = mean.reshape(-1)
+        columns['std'] = std.reshape(-1)
+        columns['min'] = np.where(count > 0, minimum, np.nan).reshape(-1)
+        columns['max'] = np.where(count > 0, maximum, np.nan).reshape(-1)
+        for q in quantiles:
+            columns[f'p{round(q * 100):g}'] = self._quantiles(hist, minimum, maximum, count, q).reshape(-1)
+
+        result = pd.DataFrame(columns)
+        if 'Year' in result.columns:
+            result['Year'] = result['Year'].astype(np.int64)
+        return result[result['count'] > 0].reset_index(drop=True)
+
+    def continent_trends(self):
+        """
+        Same frame as data_processing.get_continent_trends, answered from the cube
+        """
+        continents = [c for c in self.continents if c != UNMAPPED]
+        rollup = self.rollup(by=('Year', 'Continent'), filters={'Continent': continents}, quantiles=())
+        continent_trends = pd.DataFrame({
+            'Year': rollup['Year'],
+            'Continent': rollup['Continent'].astype(str),
+            'avg_gdp': rollup['mean'],
+            'country_count': rollup['count']
+        })
+        return continent_trends.round(2)
+
+    def save(self, path):
+        """
+        Persist the cube as a single .npz (atomic replace)
+        """
+        meta = {'version': CUBE_VERSION, 'gdp_column': self.gdp_column, 'years': self.years.tolist(),
+                'continents': self.continents, 'brackets': self.brackets}
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = path + '.tmp.npz'
+        np.savez_compressed(tmp_path, count=self.count, total=self.total, total_sq=self.total_sq,
+                            minimum=self.minimum, maximum=self.maximum, hist=self.hist,
+                            hist_edges=self.hist_edges, __meta__=np.array(json.dumps(meta)))
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a cube written by save()
+        """
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data['__meta__']))
+            if meta.get('version') != CUBE_VERSION:
+                raise ValueError(f"Unsupported cube version {meta.get('version')} in {path}")
+            return cls(meta['years'], meta['continents'], meta['brackets'], meta['gdp_column'],
+                       data['count'], data['total'], data['total_sq'], data['minimum'], data['maximum'],
+                       data['hist'], data['hist_edges'])
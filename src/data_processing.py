@@ -5,12 +5,48 @@ Author: GitHub Portfolio Project
 
 import pandas as pd
 import numpy as np
-from .utils import get_continent_mapping
+from .utils import get_continent_mapping, get_crisis_windows, downcast_frame
+from .cache import CATEGORICAL_COLUMNS, get_cache_path, source_fingerprint, read_cache, write_cache
+from .panel import GDPPanel
+from .instrumentation import instrument
+from .memo import memoized
+from .rolling import frame_rolling
 
-def load_and_clean_data(file_path='../data/gdp-per-capita-worldbank.csv'):
+@instrument()
+def load_and_clean_data(file_path='../data/gdp-per-capita-worldbank.csv', use_cache=True, compact=False):
     """
     Load and clean the GDP per capita dataset
+
+    The cleaned frame is cached next to the source CSV and rebuilt automatically
+    whenever the CSV or the continent mapping changes. compact=True returns
+    categorical names, int16 years and (where precision permits) float32 values.
     """
+    continent_mapping = get_continent_mapping()
+    
+    if use_cache:
+        cache_path = get_cache_path(file_path)
+        fingerprint = source_fingerprint(file_path, continent_mapping)
+        cached = read_cache(cache_path, fingerprint)
+        
+        if cached is not None:
+            df_clean, gdp_column = cached
+            
+            if compact:
+                df_clean = downcast_frame(df_clean, gdp_column)
+            else:
+                # Restore the dtypes produced by the CSV path
+                for col in CATEGORICAL_COLUMNS:
+                    if col in df_clean.columns:
+                        df_clean[col] = df_clean[col].astype(df_clean[col].cat.categories.dtype)
+                df_clean['Year'] = df_clean['Year'].astype(np.int64)
+            
+            print(f"⚡ Loaded cleaned dataset from cache: {cache_path}")
+            print(f"✅ Cleaned dataset size: {df_clean.shape}")
+            print(f"🌍 Countries: {df_clean['Entity'].nunique()}")
+            print(f"📅 Year range: {df_clean['Year'].min()} - {df_clean['Year'].max()}")
+            
+            return df_clean, gdp_column
+    
     # Load data
     df = pd.read_csv(file_path)
     
@@ -20,54 +56,80 @@ def load_and_clean_data(file_path='../data/gdp-per-capita-worldbank.csv'):
     print(f"📊 Original dataset size: {df.shape}")
     print(f"💰 GDP column: {gdp_column}")
     
-    # Remove missing GDP values
-    df_clean = df.dropna(subset=[gdp_column]).copy()
-    
-    # Remove negative GDP values if any
-    df_clean = df_clean[df_clean[gdp_column] >= 0]
+    # Remove missing and negative GDP values in one pass; the shallow copy
+    # detaches the result without duplicating it, and the raw frame is freed
+    values = df[gdp_column]
+    df_clean = df[values.notna() & (values >= 0)].copy(deep=False)
+    del df, values
     
     # Add continent information
-    continent_mapping = get_continent_mapping()
     df_clean['Continent'] = df_clean['Entity'].map(continent_mapping)
     
     print(f"✅ Cleaned dataset size: {df_clean.shape}")
     print(f"🌍 Countries: {df_clean['Entity'].nunique()}")
     print(f"📅 Year range: {df_clean['Year'].min()} - {df_clean['Year'].max()}")
     
+    if use_cache:
+        try:
+            write_cache(df_clean, gdp_column, cache_path, fingerprint)
+        except OSError as e:
+            print(f"⚠️ Could not write cache ({e}), continuing without it")
+    
+    if compact:
+        df_clean = downcast_frame(df_clean, gdp_column)
+    
     return df_clean, gdp_column
 
+@instrument()
+def load_panel(file_path='../data/gdp-per-capita-worldbank.csv', use_cache=True):
+    """
+    Load the cleaned dataset as a dense GDPPanel
+    """
+    df_clean, gdp_column = load_and_clean_data(file_path, use_cache=use_cache)
+    return GDPPanel.from_frame(df_clean, gdp_column), gdp_column
+
+def _as_frame(df):
+    """
+    Long-format view of a GDPPanel for functions without a panel fast path
+    """
+    return df.to_frame() if isinstance(df, GDPPanel) else df
+
+@instrument()
 def prepare_analysis_data(df, gdp_column):
     """
     Prepare data for analysis by adding calculated columns
     """
-    df_analysis = df.copy()
+    # sort_values already returns a new frame, so no extra full copy is needed
+    df_analysis = _as_frame(df).sort_values(['Entity', 'Year'])
     
     # Add year-over-year growth rate
-    df_analysis = df_analysis.sort_values(['Entity', 'Year'])
-    df_analysis['yoy_growth'] = df_analysis.groupby('Entity')[gdp_column].pct_change() * 100
+    df_analysis['yoy_growth'] = df_analysis.groupby('Entity', observed=True)[gdp_column].pct_change() * 100
     
     # Add 5-year moving average
-    df_analysis['ma_5y'] = df_analysis.groupby('Entity')[gdp_column].rolling(window=5, min_periods=1).mean().reset_index(0, drop=True)
+    df_analysis['ma_5y'] = df_analysis.groupby('Entity', observed=True)[gdp_column].rolling(window=5, min_periods=1).mean().reset_index(0, drop=True)
     
     # Add log transformation for better distribution
     df_analysis['log_gdp'] = np.log(df_analysis[gdp_column])
     
     return df_analysis
 
+@instrument()
 def calculate_growth_rate(df, gdp_column, entity_col='Entity', year_col='Year'):
     """
     Calculate year-over-year growth rate
     """
-    df_sorted = df.sort_values([entity_col, year_col])
-    df_sorted['growth_rate'] = df_sorted.groupby(entity_col)[gdp_column].pct_change() * 100
+    df_sorted = _as_frame(df).sort_values([entity_col, year_col])
+    df_sorted['growth_rate'] = df_sorted.groupby(entity_col, observed=True)[gdp_column].pct_change() * 100
     return df_sorted
 
+@instrument()
 def get_moving_average(df, gdp_column, window=5, entity_col='Entity'):
     """
     Calculate moving average for GDP values
     """
-    df_ma = df.copy()
-    df_ma[f'ma_{window}y'] = df_ma.groupby(entity_col)[gdp_column].rolling(window=window, min_periods=1).mean().reset_index(0, drop=True)
+    # Shallow copy: the new column is added without duplicating existing data
+    df_ma = _as_frame(df).copy(deep=False)
+    df_ma[f'ma_{window}y'] = frame_rolling(df_ma, gdp_column, window, 'mean', entity_col)
     return df_ma
     df_analysis['log_gdp'] = np.log(df_analysis[gdp_column])
     
@@ -80,10 +142,20 @@ def get_moving_average(df, gdp_column, window=5, entity_col='Entity'):
     
     return df_analysis
 
+@instrument()
+@memoized('world_trends')
 def get_world_trends(df, gdp_column):
     """
     Calculate world trends and statistics
     """
+    if isinstance(df, GDPPanel):
+        stats = df.aggregate(('mean', 'median', 'std', 'min', 'max', 'count'))
+        world_trends = pd.DataFrame({'Year': df.years})
+        for stat in ('mean', 'median', 'std', 'min', 'max'):
+            world_trends[f'{gdp_column}_{stat}'] = stats[stat]
+        world_trends['Entity_count'] = stats['count']
+        return world_trends[stats['count'] > 0].round(2).reset_index(drop=True)
+    
     world_trends = df.groupby('Year').agg({
         gdp_column: ['mean', 'median', 'std', 'min', 'max'],
         'Entity': 'count'
@@ -94,11 +166,24 @@ def get_world_trends(df, gdp_column):
     
     return world_trends
 
+@instrument()
+@memoized('continent_trends')
 def get_continent_trends(df, gdp_column):
     """
     Calculate continent-wise trends
     """
-    continent_trends = df.groupby(['Year', 'Continent']).agg({
+    if isinstance(df, GDPPanel):
+        means, counts = df.continent_aggregate()
+        continent_idx, year_idx = np.nonzero(counts.T > 0)[::-1]
+        continent_trends = pd.DataFrame({
+            'Year': df.years[year_idx],
+            'Continent': df.continents[continent_idx],
+            'avg_gdp': means[continent_idx, year_idx],
+            'country_count': counts[continent_idx, year_idx]
+        }).round(2)
+        return continent_trends
+    
+    continent_trends = df.groupby(['Year', 'Continent'], observed=True).agg({
         gdp_column: 'mean',
         'Entity': 'count'
     }).round(2)
@@ -108,109 +193,202 @@ def get_continent_trends(df, gdp_column):
     
     return continent_trends
 
-def analyze_crisis_impact(df, gdp_column):
+@instrument()
+def analyze_crisis_impact(df, gdp_column, windows=None):
     """
     Analyze impact of economic crises
+
+    windows is a list of (name, pre-crisis years, crisis years) tuples and
+    defaults to utils.get_crisis_windows(). The panel is pivoted once into an
+    entity x year matrix (or taken as-is from a GDPPanel) and every window is
+    evaluated by column slicing.
     """
-    crisis_analysis = {}
-    
-    # 2008 Financial Crisis
-    pre_2008 = df[df['Year'].isin([2006, 2007])].groupby('Entity')[gdp_column].mean()
-    post_2008 = df[df['Year'].isin([2008, 2009])].groupby('Entity')[gdp_column].mean()
-    
-    crisis_2008 = pd.DataFrame({
-        'pre_crisis': pre_2008,
-        'during_crisis': post_2008
-    }).dropna()
-    
-    crisis_2008['impact_2008'] = ((crisis_2008['during_crisis'] - crisis_2008['pre_crisis']) / crisis_2008['pre_crisis'] * 100)
-    
-    # COVID-19 Impact
-    pre_covid = df[df['Year'].isin([2018, 2019])].groupby('Entity')[gdp_column].mean()
-    during_covid = df[df['Year'].isin([2020, 2021])].groupby('Entity')[gdp_column].mean()
+    if windows is None:
+        windows = get_crisis_windows()
     
-    crisis_covid = pd.DataFrame({
-        'pre_crisis': pre_covid,
-        'during_crisis': during_covid
-    }).dropna()
+    panel = df if isinstance(df, GDPPanel) else GDPPanel.from_frame(df, gdp_column)
     
-    crisis_covid['impact_covid'] = ((crisis_covid['during_crisis'] - crisis_covid['pre_crisis']) / crisis_covid['pre_crisis'] * 100)
+    crisis_analysis = {}
     
-    crisis_analysis['2008_crisis'] = crisis_2008
-    crisis_analysis['covid_crisis'] = crisis_covid
+    for name, pre_years, during_years in windows:
+        crisis = pd.DataFrame({
+            'pre_crisis': panel.window_mean(pre_years),
+            'during_crisis': panel.window_mean(during_years)
+        }, index=pd.Index(panel.entities, name='Entity')).dropna()
+        
+        # e.g. '2008_crisis' -> 'impact_2008', 'covid_crisis' -> 'impact_covid'
+        impact_column = f"impact_{name.removesuffix('_crisis')}"
+        crisis[impact_column] = (crisis['during_crisis'] - crisis['pre_crisis']) / crisis['pre_crisis'] * 100
+        
+        crisis_analysis[name] = crisis
     
     return crisis_analysis
 
-def get_inequality_trends(df, gdp_column):
+def _grouped_quantile(sorted_values, starts, counts, q):
+    """
+    Linearly interpolated quantile for every group of a buffer sorted within groups
+    """
+    position = (counts - 1) * q
+    lower = np.floor(position).astype(np.int64)
+    upper = np.minimum(lower + 1, counts - 1)
+    fraction = position - lower
+    low_values = sorted_values[starts + lower]
+    high_values = sorted_values[starts + upper]
+    return low_values + (high_values - low_values) * fraction
+
+@instrument()
+def get_inequality_trends(df, gdp_column, min_countries=10):
     """
     Calculate inequality trends over time
+
+    All years are computed in one pass over a buffer sorted by (Year, GDP):
+    per-year ranks and sums come from group offsets, so the cost is one sort
+    instead of a filter + sort per year.
     """
-    inequality_data = []
-    
-    for year in df['Year'].unique():
-        year_data = df[df['Year'] == year]
-        if len(year_data) >= 10:  # Minimum countries for meaningful calculation
-            
-            # Calculate inequality metrics
-            max_gdp = year_data[gdp_column].max()
-            min_gdp = year_data[gdp_column].min()
-            ratio = max_gdp / min_gdp if min_gdp > 0 else np.nan
-            
-            # Gini coefficient approximation
-            sorted_gdp = year_data[gdp_column].sort_values()
-            n = len(sorted_gdp)
-            cum_sum = sorted_gdp.cumsum()
-            gini = (2 * (np.arange(1, n+1) * sorted_gdp).sum() - (n + 1) * cum_sum.iloc[-1]) / (n * cum_sum.iloc[-1])
-            
-            inequality_data.append({
-                'Year': year,
-                'max_gdp': max_gdp,
-                'min_gdp': min_gdp,
-                'ratio': ratio,
-                'gini_approx': gini,
-                'std_dev': year_data[gdp_column].std()
-            })
+    if isinstance(df, GDPPanel):
+        _, years, values = df.to_long_arrays()
+    else:
+        values = df[gdp_column].to_numpy(dtype=np.float64)
+        years = df['Year'].to_numpy()
+    valid = ~np.isnan(values)
+    values, years = values[valid], years[valid]
+    
+    # Sort once by (Year, GDP) and locate each year's contiguous block
+    order = np.lexsort((values, years))
+    sorted_values = values[order]
+    unique_years, starts, counts = np.unique(years[order], return_index=True, return_counts=True)
+    
+    if len(unique_years) == 0:
+        return pd.DataFrame(columns=['Year', 'max_gdp', 'min_gdp', 'ratio', 'gini_approx', 'std_dev',
+                                     'theil_index', 'palma_ratio', 'p90_p10_ratio', 'p80_p20_ratio'])
+    
+    group_ids = np.repeat(np.arange(len(unique_years)), counts)
+    ranks = np.arange(len(sorted_values)) - starts[group_ids] + 1
+    n = counts.astype(np.float64)
+    
+    # Extremes are the block edges
+    min_gdp = sorted_values[starts]
+    max_gdp = sorted_values[starts + counts - 1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(min_gdp > 0, max_gdp / min_gdp, np.nan)
+        
+        # Gini coefficient approximation
+        totals = np.add.reduceat(sorted_values, starts)
+        weighted = np.add.reduceat(ranks * sorted_values, starts)
+        gini = (2 * weighted - (n + 1) * totals) / (n * totals)
+        
+        # Sample standard deviation
+        means = totals / n
+        deviations = sorted_values - means[group_ids]
+        std_dev = np.sqrt(np.add.reduceat(deviations ** 2, starts) / (n - 1))
+        
+        # Theil T index (zero incomes contribute nothing)
+        shares = sorted_values / means[group_ids]
+        theil_terms = np.where(shares > 0, shares * np.log(np.where(shares > 0, shares, 1)), 0.0)
+        theil = np.add.reduceat(theil_terms, starts) / n
+        
+        # Palma ratio: income share of the top 10% over the bottom 40%
+        top_decile = ranks > 0.9 * n[group_ids]
+        bottom_40 = ranks <= 0.4 * n[group_ids]
+        top_sum = np.add.reduceat(np.where(top_decile, sorted_values, 0.0), starts)
+        bottom_sum = np.add.reduceat(np.where(bottom_40, sorted_values, 0.0), starts)
+        palma = top_sum / bottom_sum
+        
+        # Percentile ratios
+        p10 = _grouped_quantile(sorted_values, starts, counts, 0.10)
+        p20 = _grouped_quantile(sorted_values, starts, counts, 0.20)
+        p80 = _grouped_quantile(sorted_values, starts, counts, 0.80)
+        p90 = _grouped_quantile(sorted_values, starts, counts, 0.90)
+        p90_p10 = p90 / p10
+        p80_p20 = p80 / p20
+    
+    inequality_data = pd.DataFrame({
+        'Year': unique_years,
+        'max_gdp': max_gdp,
+        'min_gdp': min_gdp,
+        'ratio': ratio,
+        'gini_approx': gini,
+        'std_dev': std_dev,
+        'theil_index': theil,
+        'palma_ratio': palma,
+        'p90_p10_ratio': p90_p10,
+        'p80_p20_ratio': p80_p20
+    })
+    
+    # Minimum countries for meaningful calculation
+    inequality_data = inequality_data[counts >= min_countries].reset_index(drop=True)
+    
+    return inequality_data
+
+def _top_k_positions(values, k, largest=True):
+    """
+    Positions of the k largest (or smallest) values using partial selection
+    """
+    k = min(k, len(values))
+    if k <= 0:
+        return np.array([], dtype=np.int64)
     
-    return pd.DataFrame(inequality_data)
+    keys = -values if largest else values
+    candidates = np.argpartition(keys, k - 1)[:k]
+    return candidates[np.argsort(keys[candidates], kind='stable')]
 
-def get_growth_champions_and_laggards(df, gdp_column, min_years=15):
+@instrument()
+def get_growth_champions_and_laggards(df, gdp_column, min_years=15, top_n=10, start_year=None, end_year=None):
     """
     Identify fastest growing and declining countries
+
+    First/last observations of every entity are taken from one sort by
+    (Entity, Year); champions and laggards use partial selection instead of a
+    full sort. start_year/end_year restrict the analysis window.
     """
-    # Filter countries with sufficient data
-    country_years = df.groupby('Entity')['Year'].count()
-    sufficient_data = country_years[country_years >= min_years].index
-    df_filtered = df[df['Entity'].isin(sufficient_data)]
-    
-    growth_analysis = []
-    
-    for country in df_filtered['Entity'].unique():
-        country_data = df_filtered[df_filtered['Entity'] == country].sort_values('Year')
-        
-        if len(country_data) >= min_years:
-            # Calculate compound annual growth rate (CAGR)
-            first_year = country_data.iloc[0]
-            last_year = country_data.iloc[-1]
-            years = last_year['Year'] - first_year['Year']
-            
-            if first_year[gdp_column] > 0 and years > 0:
-                cagr = (((last_year[gdp_column] / first_year[gdp_column]) ** (1/years)) - 1) * 100
-                
-                growth_analysis.append({
-                    'Entity': country,
-                    'start_year': first_year['Year'],
-                    'end_year': last_year['Year'],
-                    'start_gdp': first_year[gdp_column],
-                    'end_gdp': last_year[gdp_column],
-                    'total_growth': ((last_year[gdp_column] - first_year[gdp_column]) / first_year[gdp_column]) * 100,
-                    'cagr': cagr,
-                    'years': years
-                })
-    
-    growth_df = pd.DataFrame(growth_analysis)
+    if isinstance(df, GDPPanel):
+        entity_codes, years, values = df.to_long_arrays()
+        entities = df.entities
+    else:
+        # Entity codes in order of first appearance
+        entity_codes, entities = pd.factorize(df['Entity'])
+        years = df['Year'].to_numpy()
+        values = df[gdp_column].to_numpy(dtype=np.float64)
+    
+    in_window = np.ones(len(years), dtype=bool)
+    if start_year is not None:
+        in_window &= years >= start_year
+    if end_year is not None:
+        in_window &= years <= end_year
+    entity_codes, years, values = entity_codes[in_window], years[in_window], values[in_window]
+    
+    # Sort once and locate each entity's contiguous block
+    order = np.lexsort((years, entity_codes))
+    sorted_codes = entity_codes[order]
+    codes, starts, counts = np.unique(sorted_codes, return_index=True, return_counts=True)
+    first = order[starts]
+    last = order[starts + counts - 1]
+    
+    start_gdp = values[first]
+    end_gdp = values[last]
+    span = years[last] - years[first]
+    
+    # Filter countries with sufficient data and a valid base value
+    valid = (counts >= min_years) & (start_gdp > 0) & (span > 0)
+    start_gdp, end_gdp, span = start_gdp[valid], end_gdp[valid], span[valid]
+    
+    # Calculate compound annual growth rate (CAGR)
+    cagr = ((end_gdp / start_gdp) ** (1 / span) - 1) * 100
+    
+    growth_df = pd.DataFrame({
+        'Entity': entities[codes[valid]],
+        'start_year': years[first[valid]],
+        'end_year': years[last[valid]],
+        'start_gdp': start_gdp,
+        'end_gdp': end_gdp,
+        'total_growth': (end_gdp - start_gdp) / start_gdp * 100,
+        'cagr': cagr,
+        'years': span
+    })
     
     # Get top performers
-    top_growers = growth_df.nlargest(10, 'cagr')
-    worst_performers = growth_df.nsmallest(10, 'cagr')
+    cagr_values = growth_df['cagr'].to_numpy()
+    top_growers = growth_df.iloc[_top_k_positions(cagr_values, top_n, largest=True)]
+    worst_performers = growth_df.iloc[_top_k_positions(cagr_values, top_n, largest=False)]
     
-    return top_growers, worst_performers, growth_df
\ No newline at end of file
+    return top_growers, worst_performers, growth_df
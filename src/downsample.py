@@ -0,0 +1,139 @@
+"""
+Point reduction for interactive GDP per capita plots
+Author: GitHub Portfolio Project
+"""
+
+import numpy as np
+
+# Per-point trace arrays that must stay aligned with x/y when points are dropped
+POINT_ARRAYS = ('x', 'y', 'text', 'hovertext', 'customdata', 'ids')
+LINE_TRACES = ('scatter', 'scattergl')
+
+
+def lttb_indices(x, y, threshold):
+    """
+    Indices of the points kept by Largest-Triangle-Three-Buckets downsampling
+
+    The first and last points are always kept; every bucket in between
+    contributes the point forming the largest triangle with the previously
+    kept point and the average of the next bucket, which preserves peaks and
+    troughs far better than striding. NaN values are never preferred.
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # threshold - 2 buckets over points 1 .. n-2; edges[i]:edges[i + 1] is bucket i
+    edges = (np.floor(np.arange(threshold - 1) * (n - 2) / (threshold - 2)) + 1).astype(np.int64)
+    edges[-1] = n - 1
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        next_x = x[end:next_end]
+        next_y = y[end:next_end]
+        finite = ~np.isnan(next_y)
+        avg_x = next_x[finite].mean() if finite.any() else next_x.mean()
+        avg_y = next_y[finite].mean() if finite.any() else y[a]
+
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        area = np.where(np.isnan(area), -1.0, area)
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def _point_count(trace):
+    y = getattr(trace, 'y', None)
+    return 0 if y is None else len(y)
+
+
+def _x_positions(x, n):
+    """
+    Numeric x for the triangle areas: the values when sorted numbers, else the position
+    """
+    if x is not None:
+        try:
+            values = np.asarray(x, dtype=np.float64)
+        except (TypeError, ValueError):
+            values = None
+        if values is not None and len(values) == n and not np.any(np.diff(values) < 0):
+            return values
+    return np.arange(n, dtype=np.float64)
+
+
+def downsample_trace(trace, max_points):
+    """
+    LTTB-reduce a scatter/line trace in place to at most max_points; returns points removed
+    """
+    n = _point_count(trace)
+    if trace.type not in LINE_TRACES or n <= max_points:
+        return 0
+    keep = lttb_indices(_x_positions(trace.x, n), trace.y, max_points)
+    updates = {}
+    for name in POINT_ARRAYS:
+        values = getattr(trace, name, None)
+        if values is not None and not isinstance(values, str) and len(values) == n:
+            updates[name] = np.asarray(values)[keep]
+    marker = {}
+    for name in ('color', 'size'):
+        values = getattr(trace.marker, name, None)
+        if values is not None and not isinstance(values, (str, int, float)) and len(values) == n:
+            marker[name] = np.asarray(values)[keep]
+    if marker:
+        updates['marker'] = marker
+    trace.update(updates)
+    return n - len(keep)
+
+
+def to_webgl(fig, min_points):
+    """
+    Replace scatter traces with at least min_points points by Scattergl (same properties)
+
+    Animated figures are left alone: WebGL traces do not support frame transitions.
+    """
+    import plotly.graph_objects as go
+
+    if fig.frames:
+        return 0
+    traces = []
+    converted = 0
+    for trace in fig.data:
+        if trace.type == 'scatter' and _point_count(trace) >= min_points:
+            properties = trace.to_plotly_json()
+            properties.pop('type', None)
+            traces.append(go.Scattergl(properties, skip_invalid=True))
+            converted += 1
+        else:
+            traces.append(trace)
+    if converted:
+        fig.data = ()
+        fig.add_traces(traces)
+    return converted
+
+
+def slim_figure(fig, max_points=None, webgl_threshold=None):
+    """
+    Copy of a plotly figure with large traces downsampled and moved to WebGL
+
+    Returns (figure, stats) where stats counts points before/after and the
+    traces switched to WebGL. Frames of animated figures are downsampled too.
+    """
+    import plotly.graph_objects as go
+
+    fig = go.Figure(fig)
+    points_in = sum(_point_count(trace) for trace in fig.data)
+    if max_points:
+        for trace in fig.data:
+            downsample_trace(trace, max_points)
+        for frame in fig.frames:
+            for trace in frame.data:
+                downsample_trace(trace, max_points)
+    webgl_traces = to_webgl(fig, webgl_threshold) if webgl_threshold else 0
+    points_out = sum(_point_count(trace) for trace in fig.data)
+    return fig, {'points_in': points_in, 'points_out': points_out, 'webgl_traces': webgl_traces}
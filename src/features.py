@@ -0,0 +1,340 @@
+"""
+Feature engineering functions for GDP per capita analysis
+Author: GitHub Portfolio Project
+
+Vectorized port of notebooks/03_feature_engineering.ipynb: produces the
+columns documented in outputs/feature_documentation.csv using grouped
+shift/transform operations and the panel-wide rolling kernels in
+src/rolling.py, and supports incremental updates.
+"""
+
+import pandas as pd
+import numpy as np
+from .instrumentation import instrument
+from .ranking import cross_section_percentiles
+from .rolling import frame_rolling
+
+# Longest backward-looking window used by any per-entity feature
+# (growth_10y / ma_10y need the 10 previous observations)
+FEATURE_LOOKBACK = 10
+
+FEATURE_GROUPS = {
+    'Growth Features': ['yoy_growth', 'growth_3y', 'growth_5y', 'growth_10y', 'cagr_5y'],
+    'Trend Features': ['ma_3y', 'ma_5y', 'ma_10y', 'trend_vs_ma3', 'trend_vs_ma5', 'trend_vs_ma10', 'ma5_slope'],
+    'Volatility Features': ['volatility_5y', 'cv_growth_5y', 'gdp_volatility_5y', 'risk_adjusted_performance', 'max_drawdown_5y'],
+    'Cycle Features': ['in_recession', 'in_recovery', 'economic_phase', 'crisis_year', 'years_since_recession'],
+    'Relative Features': ['gdp_vs_world', 'gdp_vs_continent', 'growth_vs_world', 'world_percentile', 'continent_percentile', 'income_classification']
+}
+
+RELATIVE_COLUMNS = ['world_avg_gdp', 'continent_avg_gdp', 'gdp_vs_world', 'gdp_vs_continent',
+                    'world_avg_growth', 'growth_vs_world', 'world_percentile', 'continent_percentile',
+                    'income_classification']
+
+def calculate_growth_features(df, gdp_column, entity_col='Entity', year_col='Year'):
+    """
+    Calculate various growth rate features for time series data
+    """
+    df_features = df.copy()
+    df_features = df_features.sort_values([entity_col, year_col])
+    grouped = df_features.groupby(entity_col)[gdp_column]
+
+    # Year-over-Year Growth Rate
+    df_features['yoy_growth'] = grouped.pct_change() * 100
+
+    # 3-Year Growth Rate
+    df_features['growth_3y'] = grouped.pct_change(periods=3) * 100
+
+    # 5-Year Growth Rate
+    df_features['growth_5y'] = grouped.pct_change(periods=5) * 100
+
+    # 10-Year Growth Rate
+    df_features['growth_10y'] = grouped.pct_change(periods=10) * 100
+
+    # 5-year CAGR from the value 5 observations earlier (shift-based)
+    start_value = grouped.shift(5)
+    end_value = df_features[gdp_column]
+    valid = (start_value > 0) & (end_value > 0)
+    df_features['cagr_5y'] = (((end_value / start_value) ** (1/5) - 1) * 100).where(valid)
+
+    return df_features
+
+def calculate_trend_features(df, gdp_column, entity_col='Entity', year_col='Year'):
+    """
+    Calculate moving averages and trend indicators
+    """
+    df_trend = df.copy()
+    df_trend = df_trend.sort_values([entity_col, year_col])
+
+    # Moving Averages
+    df_trend['ma_3y'] = frame_rolling(df_trend, gdp_column, 3, 'mean', entity_col)
+    df_trend['ma_5y'] = frame_rolling(df_trend, gdp_column, 5, 'mean', entity_col)
+    df_trend['ma_10y'] = frame_rolling(df_trend, gdp_column, 10, 'mean', entity_col)
+
+    # Trend indicators (current value vs moving average)
+    df_trend['trend_vs_ma3'] = ((df_trend[gdp_column] - df_trend['ma_3y']) / df_trend['ma_3y']) * 100
+    df_trend['trend_vs_ma5'] = ((df_trend[gdp_column] - df_trend['ma_5y']) / df_trend['ma_5y']) * 100
+    df_trend['trend_vs_ma10'] = ((df_trend[gdp_column] - df_trend['ma_10y']) / df_trend['ma_10y']) * 100
+
+    # Least-squares slope of the last 3 ma_5y points, NaN when any of them is missing
+    df_trend['ma5_slope'] = frame_rolling(df_trend, 'ma_5y', 3, 'slope', entity_col)
+
+    return df_trend
+
+def calculate_volatility_features(df, gdp_column, entity_col='Entity', year_col='Year', window=5):
+    """
+    Calculate volatility and risk measures
+    """
+    df_vol = df.copy()
+    df_vol = df_vol.sort_values([entity_col, year_col])
+
+    # Rolling standard deviation of growth rates
+    df_vol['volatility_5y'] = frame_rolling(df_vol, 'yoy_growth', window, 'std', entity_col, min_periods=2)
+
+    # Coefficient of variation (CV) - volatility relative to mean
+    avg_growth_5y = frame_rolling(df_vol, 'yoy_growth', window, 'mean', entity_col, min_periods=2)
+    df_vol['cv_growth_5y'] = (df_vol['volatility_5y'] / avg_growth_5y.abs()) * 100
+
+    # GDP level volatility (coefficient of variation of GDP levels)
+    df_vol['gdp_volatility_5y'] = frame_rolling(df_vol, gdp_column, window, 'std', entity_col, min_periods=2)
+
+    # Risk-adjusted performance (average growth / volatility)
+    df_vol['risk_adjusted_performance'] = avg_growth_5y / (df_vol['volatility_5y'] + 0.001)  # Add small constant to avoid division by zero
+
+    # Maximum drawdown over full windows: (trough - peak) / peak
+    df_vol['max_drawdown_5y'] = frame_rolling(df_vol, gdp_column, window, 'drawdown', entity_col)
+
+    return df_vol
+
+def calculate_cycle_features(df, gdp_column, entity_col='Entity', year_col='Year'):
+    """
+    Calculate economic cycle and crisis detection features
+    """
+    df_cycle = df.copy()
+    df_cycle = df_cycle.sort_values([entity_col, year_col]).reset_index(drop=True)
+
+    # Current and previous growth within each country (first year has no previous)
+    current_growth = df_cycle['yoy_growth']
+    prev_growth = df_cycle.groupby(entity_col)['yoy_growth'].shift(1)
+    has_previous = df_cycle.groupby(entity_col).cumcount() > 0
+
+    # Phases are checked in priority order, like an if/elif chain
+    recession = has_previous & (current_growth < -2) & (prev_growth < -2)  # Use -2% threshold
+    recovery = has_previous & ~recession & (current_growth > 2) & (prev_growth < 0)  # Use 2% threshold
+    crisis = has_previous & ~recession & ~recovery & (current_growth < -5)
+    growth = has_previous & ~recession & ~recovery & ~crisis & (current_growth > 3)
+
+    df_cycle['in_recession'] = recession.to_numpy()
+    df_cycle['in_recovery'] = recovery.to_numpy()
+    df_cycle['economic_phase'] = np.select(
+        [recession, recovery, crisis, growth],
+        ['recession', 'recovery', 'crisis', 'growth'],
+        default='stable'
+    )
+    df_cycle['crisis_year'] = crisis.to_numpy()
+
+    # Years since the most recent recession year (run-length via forward fill)
+    recession_year = df_cycle[year_col].where(recession)
+    last_recession = recession_year.groupby(df_cycle[entity_col]).ffill()
+    df_cycle['years_since_recession'] = (df_cycle[year_col] - last_recession).fillna(0).astype(np.int64)
+
+    return df_cycle
+
+def calculate_relative_features(df, gdp_column, entity_col='Entity', year_col='Year'):
+    """
+    Calculate relative performance features vs world and continent averages
+    """
+    df_rel = df.copy()
+
+    # World average by year
+    df_rel['world_avg_gdp'] = df_rel.groupby(year_col)[gdp_column].transform('mean')
+
+    # Continent average by year (merged back on (year, continent))
+    continent_avg = (df_rel.groupby([year_col, 'Continent'])[gdp_column].mean()
+                     .rename('continent_avg_gdp').reset_index())
+    df_rel['continent_avg_gdp'] = df_rel[[year_col, 'Continent']].merge(
+        continent_avg, on=[year_col, 'Continent'], how='left'
+    )['continent_avg_gdp'].to_numpy()
+
+    # Relative performance vs world
+    df_rel['gdp_vs_world'] = ((df_rel[gdp_column] - df_rel['world_avg_gdp']) / df_rel['world_avg_gdp']) * 100
+
+    # Relative performance vs continent
+    df_rel['gdp_vs_continent'] = ((df_rel[gdp_column] - df_rel['continent_avg_gdp']) / df_rel['continent_avg_gdp']) * 100
+
+    # World growth rate
+    df_rel['world_avg_growth'] = df_rel.groupby(year_col)['yoy_growth'].transform('mean')
+
+    # Relative growth performance
+    df_rel['growth_vs_world'] = df_rel['yoy_growth'] - df_rel['world_avg_growth']
+
+    # GDP per capita percentile rank within world and within continent
+    # (rank(pct=True) * 100 per year, both from one value sort)
+    world_percentile, continent_percentile = cross_section_percentiles(
+        df_rel, gdp_column, groupings=[[year_col], [year_col, 'Continent']])
+    df_rel['world_percentile'] = world_percentile
+    df_rel['continent_percentile'] = continent_percentile
+
+    # Income classification based on World Bank thresholds (2023)
+    gdp = df_rel[gdp_column]
+    df_rel['income_classification'] = np.select(
+        [gdp.isna(), gdp >= 50000, gdp >= 25000, gdp >= 10000, gdp >= 3000],
+        ['Unknown', 'Very High Income', 'High Income', 'Upper Middle Income', 'Lower Middle Income'],
+        default='Low Income'
+    )
+
+    return df_rel
+
+def calculate_entity_features(df, gdp_column, entity_col='Entity', year_col='Year'):
+    """
+    Per-entity (time series) features: growth, trend, volatility and cycle
+    """
+    df_features = calculate_growth_features(df, gdp_column, entity_col, year_col)
+    df_features = calculate_trend_features(df_features, gdp_column, entity_col, year_col)
+    df_features = calculate_volatility_features(df_features, gdp_column, entity_col, year_col)
+    return calculate_cycle_features(df_features, gdp_column, entity_col, year_col)
+
+@instrument()
+def build_features(df, gdp_column, entity_col='Entity', year_col='Year'):
+    """
+    Full feature pipeline (same columns as outputs/gdp_with_features.csv)
+    """
+    df_features = calculate_entity_features(df, gdp_column, entity_col, year_col)
+    return calculate_relative_features(df_features, gdp_column, entity_col, year_col)
+
+def export_features(df_features, output_path):
+    """
+    Round numeric columns and write the feature dataset to CSV
+    """
+    df_export = df_features.copy()
+
+    # Round numerical columns for cleaner output
+    numeric_columns = df_export.select_dtypes(include=[np.number]).columns
+    df_export[numeric_columns] = df_export[numeric_columns].round(3)
+
+    df_export.to_csv(output_path, index=False)
+    return df_export
+
+def _find_changed_rows(df_features, df, gdp_column, entity_col, year_col):
+    """
+    Earliest changed year per entity and the set of removed (entity, year) keys
+    """
+    keys = [entity_col, year_col]
+    merged = pd.merge(
+        df[keys + [gdp_column]],
+        df_features[keys + [gdp_column]],
+        on=keys, how='outer', suffixes=('', '_stored'), indicator=True
+    )
+
+    # Stored outputs are rounded to 3 decimals, so compare at that precision
+    new_values = merged[gdp_column].round(3)
+    stored_values = merged[f'{gdp_column}_stored'].round(3)
+    changed = (merged['_merge'] != 'both') | ~np.isclose(new_values, stored_values, rtol=0, atol=1e-9)
+
+    changed_rows = merged[changed]
+    first_changed = changed_rows.groupby(entity_col)[year_col].min()
+    removed = changed_rows[changed_rows['_merge'] == 'right_only'][keys]
+
+    return first_changed, removed
+
+def _fix_years_since_recession(recomputed, df_features, first_changed, entity_col, year_col):
+    """
+    Re-seed years_since_recession with the last recession before the recomputed span
+    """
+    # Each affected entity's last stored recession year before its first changed year
+    stored_start = df_features[entity_col].map(first_changed)
+    prior = df_features[df_features['in_recession'].astype(bool) & (df_features[year_col] < stored_start)]
+    seed = prior.groupby(entity_col)[year_col].max()
+
+    # Recession years of the recomputed rows take over from the seed (forward fill per entity)
+    recession_year = recomputed[year_col].where(recomputed['in_recession'].astype(bool))
+    last_recession = (recession_year.groupby(recomputed[entity_col]).ffill()
+                      .fillna(recomputed[entity_col].map(seed)))
+    recomputed['years_since_recession'] = (recomputed[year_col] - last_recession).fillna(0).astype(np.int64)
+    return recomputed
+
+@instrument()
+def update_features(df_features, df, gdp_column, entity_col='Entity', year_col='Year'):
+    """
+    Incrementally update a feature dataset after new or revised rows arrive
+
+    Only rows whose backward-looking windows touch changed data are
+    recomputed: for every affected entity, the rows from its earliest changed
+    year onwards (using FEATURE_LOOKBACK earlier rows as context). The
+    cross-sectional (relative) features are then recomputed for the years
+    those rows fall in. Returns the updated frame and a summary dict.
+    """
+    df_features = df_features.sort_values([entity_col, year_col]).reset_index(drop=True)
+    df = df.sort_values([entity_col, year_col]).reset_index(drop=True)
+
+    first_changed, removed = _find_changed_rows(df_features, df, gdp_column, entity_col, year_col)
+    summary = {'entities_affected': len(first_changed), 'rows_recomputed': 0,
+               'years_recomputed': [], 'rows_removed': len(removed)}
+
+    if len(first_changed) == 0:
+        return df_features, summary
+
+    # Rows from the first changed year onwards plus the lookback context
+    start_year = df[entity_col].map(first_changed)
+    affected = start_year.notna()
+    is_target = affected & (df[year_col] >= start_year)
+    position = df.groupby(entity_col).cumcount()
+    first_target = position.where(is_target).groupby(df[entity_col]).transform('min')
+    in_context = affected & (position >= first_target - FEATURE_LOOKBACK)
+
+    context = df[in_context].drop(columns=RELATIVE_COLUMNS + sum(FEATURE_GROUPS.values(), []), errors='ignore')
+    recomputed = calculate_entity_features(context, gdp_column, entity_col, year_col)
+    recomputed = recomputed[recomputed[year_col] >= recomputed[entity_col].map(first_changed)]
+    recomputed = _fix_years_since_recession(recomputed.copy(), df_features, first_changed, entity_col, year_col)
+
+    # Replace stale per-entity rows
+    stored_start = df_features[entity_col].map(first_changed)
+    stale = stored_start.notna() & (df_features[year_col] >= stored_start)
+    updated = pd.concat([df_features[~stale], recomputed], ignore_index=True)
+
+    # Cross-sectional features only for the years touched by the update
+    touched_years = sorted(set(recomputed[year_col]) | set(removed[year_col]))
+    in_touched = updated[year_col].isin(touched_years)
+    relative = calculate_relative_features(
+        updated.loc[in_touched].drop(columns=RELATIVE_COLUMNS, errors='ignore'),
+        gdp_column, entity_col, year_col
+    )
+    updated = pd.concat([updated[~in_touched], relative], ignore_index=True)
+
+    updated = updated[df_features.columns]
+    updated = updated.sort_values([entity_col, year_col]).reset_index(drop=True)
+
+    summary['rows_recomputed'] = len(recomputed)
+    summary['years_recomputed'] = touched_years
+    return updated, summary
+
+def verify_incremental_update(df_old, df_new, gdp_column, rtol=1e-9, atol=1e-9):
+    """
+    Check that update_features(build_features(df_old), df_new) equals build_features(df_new)
+    """
+    stored = build_features(df_old, gdp_column)
+    incremental, summary = update_features(stored, df_new, gdp_column)
+    full = build_features(df_new, gdp_column)
+
+    numeric_columns = full.select_dtypes(include=[np.number]).columns
+    other_columns = [col for col in full.columns if col not in numeric_columns]
+
+    same_shape = incremental.shape == full.shape
+    numeric_match = same_shape and np.allclose(
+        incremental[numeric_columns].to_numpy(dtype=np.float64),
+        full[numeric_columns].to_numpy(dtype=np.float64),
+        rtol=rtol, atol=atol, equal_nan=True
+    )
+    other_match = same_shape and incremental[other_columns].astype(str).equals(full[other_columns].astype(str))
+
+    summary['matches_full_recompute'] = bool(numeric_match and other_match)
+    return summary
+
+def update_features_file(features_path, df, gdp_column):
+    """
+    Patch a stored feature CSV in place with new or revised rows from df
+    """
+    df_features = pd.read_csv(features_path)
+    updated, summary = update_features(df_features, df, gdp_column)
+    if summary['entities_affected'] > 0:
+        export_features(updated, features_path)
+    return summary
@@ -0,0 +1,303 @@
+"""
+Batch forecasting for GDP per capita analysis
+Author: GitHub Portfolio Project
+
+Every model is fitted to all entities at once on the dense entity x year
+matrix of a GDPPanel, working on log GDP per capita: closed-form least
+squares for the log-linear trend and AR(1), and one pass over the years
+for Holt smoothing with every (alpha, beta) pair of a small grid evaluated
+side by side. Forecasts are medians exp(mean log) with normal prediction
+intervals in log space.
+"""
+
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .panel import GDPPanel
+except ImportError:
+    from panel import GDPPanel
+
+MODELS = ('trend', 'holt', 'ar1')
+HOLT_ALPHAS = (0.1, 0.3, 0.5, 0.7, 0.9)
+HOLT_BETAS = (0.05, 0.1, 0.2, 0.4)
+# Rows fitted per batch; keeps the Holt grid state (rows x 20 pairs) cache sized
+CHUNK_ROWS = 8192
+
+
+def _log_grid(panel):
+    """
+    Log values on a gap-free calendar year grid (NaN where missing or not positive)
+    """
+    years = np.arange(panel.years.min(), panel.years.max() + 1) if len(panel.years) else panel.years
+    log_values = np.full((len(panel.entities), len(years)), np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_values[:, panel.years - years[0]] = np.where(panel.values > 0, np.log(panel.values), np.nan)
+    return log_values, years
+
+
+def _last_observed(log_values):
+    """
+    Column of each row's last observation (-1 for empty rows)
+    """
+    observed = ~np.isnan(log_values)
+    last = log_values.shape[1] - 1 - np.argmax(observed[:, ::-1], axis=1)
+    return np.where(observed.any(axis=1), last, -1)
+
+
+def _gather(table, steps):
+    """
+    table[row, steps - 1] per target, NaN where steps are out of range
+    """
+    valid = (steps >= 1) & (steps <= table.shape[1])
+    index = np.clip(steps - 1, 0, max(table.shape[1] - 1, 0))
+    if table.shape[1] == 0:
+        return np.full(steps.shape, np.nan)
+    return np.where(valid, np.take_along_axis(table, index, axis=1), np.nan)
+
+
+def trend_forecast(log_values, targets):
+    """
+    Log-linear trend: least-squares line through each row's observed log values
+
+    targets are column positions (E x H); returns (mean, sd) of the log forecast
+    with the usual OLS prediction variance s^2 (1 + 1/n + (x0 - x_mean)^2 / Sxx).
+    """
+    observed = ~np.isnan(log_values)
+    positions = np.broadcast_to(np.arange(log_values.shape[1], dtype=np.float64), log_values.shape)
+    count = observed.sum(axis=1).astype(np.float64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_x = np.where(observed, positions, 0.0).sum(axis=1) / count
+        mean_y = np.where(observed, log_values, 0.0).sum(axis=1) / count
+        dx = np.where(observed, positions - mean_x[:, None], 0.0)
+        dy = np.where(observed, log_values - mean_y[:, None], 0.0)
+        sxx = (dx * dx).sum(axis=1)
+        slope = (dx * dy).sum(axis=1) / sxx
+        residuals = dy - slope[:, None] * dx
+        sigma2 = (residuals * residuals).sum(axis=1) / (count - 2)
+
+        x0 = targets - mean_x[:, None]
+        mean = mean_y[:, None] + slope[:, None] * x0
+        sd = np.sqrt(sigma2[:, None] * (1 + 1 / count[:, None] + x0 * x0 / sxx[:, None]))
+    enough = (count >= 3)[:, None]
+    return np.where(enough, mean, np.nan), np.where(enough, sd, np.nan)
+
+
+def holt_forecast(log_values, targets, alphas=HOLT_ALPHAS, betas=HOLT_BETAS):
+    """
+    Holt's linear exponential smoothing with (alpha, beta) chosen per row from a grid
+
+    The first two observations set the level and trend; missing years carry
+    the state forward by the trend. The pair with the smallest in-sample
+    one-step squared error is kept, and the h-step variance is
+    s^2 (1 + sum_{j<h} alpha^2 (1 + j beta)^2).
+    """
+    n_rows, n_periods = log_values.shape
+    alpha = np.repeat(np.asarray(alphas, dtype=np.float64), len(betas))[None, :]
+    beta = np.tile(np.asarray(betas, dtype=np.float64), len(alphas))[None, :]
+    n_grid = alpha.shape[1]
+
+    level = np.zeros((n_rows, n_grid))
+    trend = np.zeros((n_rows, n_grid))
+    sse = np.zeros((n_rows, n_grid))
+    seen = np.zeros(n_rows, dtype=np.int64)
+    gap = np.zeros(n_rows)
+    n_errors = np.zeros(n_rows)
+
+    for j in range(n_periods):
+        y = log_values[:, j]
+        observed = ~np.isnan(y)
+        started = seen >= 1
+        gap += started
+        first = (observed & (seen == 0))[:, None]
+        second = (observed & (seen == 1))[:, None]
+        update = (observed & (seen >= 2))[:, None]
+
+        predicted = level + trend
+        error = y[:, None] - predicted
+        with np.errstate(invalid='ignore', divide='ignore'):
+            trend = np.where(second, error / gap[:, None], np.where(update, trend + alpha * beta * error, trend))
+        level = np.where(first | second, y[:, None],
+                         np.where(update, predicted + alpha * error, np.where(started[:, None], predicted, level)))
+        sse += np.where(update, error * error, 0.0)
+        n_errors += update[:, 0]
+        gap[observed] = 0
+        seen += observed
+
+    best = np.argmin(sse, axis=1)[:, None]
+    level = np.take_along_axis(level, best, axis=1)
+    trend = np.take_along_axis(trend, best, axis=1)
+    alpha = alpha[0, best]
+    beta = beta[0, best]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        sigma2 = np.take_along_axis(sse, best, axis=1) / n_errors[:, None]
+
+    # State is at the last column; steps are counted from the last observation
+    mean = level + trend * (targets - (n_periods - 1))
+    steps = targets - _last_observed(log_values)[:, None]
+    max_steps = int(steps.max()) if steps.size else 0
+    j = np.arange(1, max(max_steps, 1))[None, :]
+    spread = np.hstack([np.zeros((n_rows, 1)), np.cumsum((alpha * (1 + j * beta)) ** 2, axis=1)])
+    sd = np.sqrt(sigma2 * (1 + _gather(spread, steps)))
+    enough = (n_errors >= 2)[:, None]
+    return np.where(enough, mean, np.nan), np.where(enough, sd, np.nan)
+
+
+def ar1_forecast(log_values, targets, max_phi=0.99):
+    """
+    AR(1) on year-over-year growth (%), compounded onto the last observed level
+
+    g_t = c + phi g_(t-1) + e is fitted by least squares over consecutive
+    years (phi clipped to +/- max_phi to stay stationary); growth forecasts
+    revert to c / (1 - phi) and the log-level variance adds up the growth
+    errors (first order: log(1 + g / 100) ~ g / 100).
+    """
+    n_rows, n_periods = log_values.shape
+    growth = np.full((n_rows, n_periods), np.nan)
+    growth[:, 1:] = np.expm1(np.diff(log_values, axis=1)) * 100
+    x, y = growth[:, :-1], growth[:, 1:]
+    pairs = ~np.isnan(x) & ~np.isnan(y)
+    count = pairs.sum(axis=1).astype(np.float64)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_x = np.where(pairs, x, 0.0).sum(axis=1) / count
+        mean_y = np.where(pairs, y, 0.0).sum(axis=1) / count
+        dx = np.where(pairs, x - mean_x[:, None], 0.0)
+        dy = np.where(pairs, y - mean_y[:, None], 0.0)
+        phi = np.clip((dx * dy).sum(axis=1) / (dx * dx).sum(axis=1), -max_phi, max_phi)
+        phi = np.where(np.isnan(phi), 0.0, phi)
+        intercept = mean_y - phi * mean_x
+        residuals = dy - phi[:, None] * dx
+        sigma2 = (residuals * residuals).sum(axis=1) / (count - 2)
+        long_run = intercept / (1 - phi)
+
+    last = _last_observed(log_values)
+    rows = np.arange(n_rows)
+    last_level = np.where(last >= 0, log_values[rows, np.maximum(last, 0)], np.nan)
+    last_growth = np.where(last >= 1, growth[rows, np.maximum(last, 0)], np.nan)
+    last_growth = np.where(np.isnan(last_growth), long_run, last_growth)
+
+    steps = targets - last[:, None]
+    max_steps = max(int(steps.max()) if steps.size else 0, 1)
+    decay = phi[:, None] ** np.arange(1, max_steps + 1)[None, :]
+    path = long_run[:, None] + decay * (last_growth - long_run)[:, None]
+    with np.errstate(invalid='ignore'):
+        log_path = last_level[:, None] + np.cumsum(np.log1p(path / 100), axis=1)
+    # Error e_(T+j) enters the cumulative growth of h steps with weight (1 - phi^(h-j+1)) / (1 - phi)
+    spread = np.cumsum(((1 - decay) / (1 - phi)[:, None]) ** 2, axis=1) * sigma2[:, None] / 100 ** 2
+
+    mean = _gather(log_path, steps)
+    sd = np.sqrt(_gather(spread, steps))
+    enough = (count >= 3)[:, None]
+    return np.where(enough, mean, np.nan), np.where(enough, sd, np.nan)
+
+
+_FORECASTERS = {
+    'trend': trend_forecast,
+    'holt': holt_forecast,
+    'ar1': ar1_forecast,
+}
+
+
+def _run_model(model, log_values, targets, chunk_rows=CHUNK_ROWS):
+    """
+    (mean, sd) of one model for every row, fitted chunk_rows rows at a time
+    """
+    forecaster = _FORECASTERS[model]
+    if len(log_values) <= chunk_rows:
+        return forecaster(log_values, targets)
+    parts = [forecaster(log_values[start:start + chunk_rows], targets[start:start + chunk_rows])
+             for start in range(0, len(log_values), chunk_rows)]
+    return np.vstack([mean for mean, _ in parts]), np.vstack([sd for _, sd in parts])
+
+
+def _check_models(models):
+    models = [models] if isinstance(models, str) else list(models)
+    unknown = [model for model in models if model not in _FORECASTERS]
+    if unknown:
+        raise ValueError(f"Unknown model: {', '.join(unknown)} (choose from {', '.join(MODELS)})")
+    return models
+
+
+def forecast_panel(panel, horizon=5, models=MODELS, level=0.95):
+    """
+    Forecast every entity `horizon` years past the panel's last year
+
+    Returns a long frame (Entity, Year, model, horizon, forecast, lower,
+    upper, last_observed); entities whose series ends early are forecast from
+    their last observation, with intervals widened accordingly.
+    """
+    models = _check_models(models)
+    log_values, years = _log_grid(panel)
+    z = NormalDist().inv_cdf(0.5 + level / 2)
+    n_entities = len(panel.entities)
+    steps = np.arange(1, horizon + 1)
+    targets = np.broadcast_to(len(years) - 1 + steps, (n_entities, horizon))
+    last = _last_observed(log_values)
+
+    frames = []
+    for model in models:
+        mean, sd = _run_model(model, log_values, targets)
+        frames.append(pd.DataFrame({
+            'Entity': np.repeat(panel.entities, horizon),
+            'Year': np.tile(years[-1] + steps, n_entities),
+            'model': model,
+            'horizon': np.tile(steps, n_entities),
+            'forecast': np.exp(mean).ravel(),
+            'lower': np.exp(mean - z * sd).ravel(),
+            'upper': np.exp(mean + z * sd).ravel(),
+            'last_observed': np.repeat(np.where(last >= 0, years[np.maximum(last, 0)], -1), horizon),
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def forecast_frame(df, gdp_column, horizon=5, models=MODELS, level=0.95):
+    """
+    forecast_panel() on the long-format output of load_and_clean_data
+    """
+    return forecast_panel(GDPPanel.from_frame(df, gdp_column), horizon, models, level)
+
+
+def backtest(panel, horizon=5, n_origins=10, models=MODELS, level=0.95):
+    """
+    Rolling-origin backtest over the last `n_origins` years
+
+    Every (entity, origin) pair becomes one row of a stacked matrix whose
+    values after the origin are hidden, so each model is fitted in the same
+    batches for all origins. Returns accuracy per model and horizon: scored forecasts,
+    MAPE (%), RMSE of the log error and the share of actuals inside the
+    prediction interval.
+    """
+    models = _check_models(models)
+    log_values, years = _log_grid(panel)
+    n_entities, n_periods = log_values.shape
+    origins = np.arange(max(n_periods - 1 - n_origins, 1), n_periods - 1)
+    z = NormalDist().inv_cdf(0.5 + level / 2)
+
+    width = int(origins.max()) + 1 if len(origins) else 0
+    stacked = np.tile(log_values[:, :width], (len(origins), 1))
+    cutoff = np.repeat(origins, n_entities)
+    stacked[np.arange(width)[None, :] > cutoff[:, None]] = np.nan
+    targets = cutoff[:, None] + np.arange(1, horizon + 1)[None, :]
+    rows = np.tile(np.arange(n_entities), len(origins))[:, None]
+    actual = np.where(targets < n_periods, log_values[rows, np.minimum(targets, n_periods - 1)], np.nan)
+
+    records = []
+    for model in models:
+        mean, sd = _run_model(model, stacked, targets)
+        error = actual - mean
+        scored = ~np.isnan(error) & ~np.isnan(sd)
+        for h in range(horizon):
+            valid = scored[:, h]
+            e = error[valid, h]
+            records.append({
+                'model': model,
+                'horizon': h + 1,
+                'n': int(valid.sum()),
+                'mape': float(np.mean(np.abs(np.expm1(-e))) * 100) if len(e) else np.nan,
+                'rmse_log': float(np.sqrt(np.mean(e * e))) if len(e) else np.nan,
+                'coverage': float(np.mean(np.abs(e) <= z * sd[valid, h])) if len(e) else np.nan,
+            })
+    return pd.DataFrame(records).set_index(['model', 'horizon'])
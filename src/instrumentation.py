@@ -0,0 +1,213 @@
+"""
+Lightweight timing instrumentation for GDP per capita analysis
+Author: GitHub Portfolio Project
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Off unless GDP_INSTRUMENT=1 or enable() is called; a disabled call costs one attribute check
+ENV_FLAG = 'GDP_INSTRUMENT'
+# Spans kept in memory; a long-running process (e.g. the service) drops the oldest beyond this
+MAX_RECORDS = 100000
+
+
+class _State:
+    enabled = os.environ.get(ENV_FLAG, '').lower() in ('1', 'true', 'yes')
+    records = deque(maxlen=MAX_RECORDS)
+    lock = threading.Lock()
+
+
+# Nesting depth per thread / asyncio task, so concurrent spans do not share it
+_depth = ContextVar('instrumentation_depth', default=0)
+
+
+_state = _State()
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def enable():
+    """
+    Start recording spans
+    """
+    _state.enabled = True
+
+
+def disable():
+    """
+    Stop recording spans (decorated functions run untouched)
+    """
+    _state.enabled = False
+
+
+def is_enabled():
+    return _state.enabled
+
+
+def reset():
+    """
+    Drop all recorded spans
+    """
+    with _state.lock:
+        _state.records.clear()
+
+
+def drain():
+    """
+    Return the recorded spans and clear them (used to ship records out of worker processes)
+    """
+    with _state.lock:
+        records = list(_state.records)
+        _state.records.clear()
+    return records
+
+
+def get_records():
+    """
+    Copy of the recorded spans (oldest first)
+    """
+    with _state.lock:
+        return list(_state.records)
+
+
+def extend(records):
+    """
+    Merge spans recorded elsewhere (e.g. in a worker process)
+    """
+    with _state.lock:
+        _state.records.extend(records)
+
+
+def _current_rss():
+    """
+    Resident set size in bytes, or None where /proc is unavailable
+    """
+    try:
+        with open('/proc/self/statm', encoding='ascii') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def count_rows(obj):
+    """
+    Rows of a DataFrame/Series/GDPPanel, or of the first element of a
+    (frame, ...) tuple; dicts of frames are summed. None when unknown.
+    """
+    if obj is None:
+        return None
+    if isinstance(obj, tuple):
+        return count_rows(obj[0]) if obj else None
+    if isinstance(obj, dict):
+        counts = [count_rows(value) for value in obj.values()]
+        counts = [c for c in counts if c is not None]
+        return sum(counts) if counts else None
+    if hasattr(obj, 'to_long_arrays') and hasattr(obj, 'observed'):
+        return int(obj.observed.sum())
+    if hasattr(obj, 'shape') and hasattr(obj, '__len__'):
+        return len(obj)
+    return None
+
+
+@contextmanager
+def span(name, rows_in=None):
+    """
+    Time a block; set record['rows_out'] inside the block to report output rows
+    """
+    if not _state.enabled:
+        yield {}
+        return
+
+    depth = _depth.get()
+    record = {'name': name, 'depth': depth, 'rows_in': rows_in, 'rows_out': None}
+    rss_before = _current_rss()
+    token = _depth.set(depth + 1)
+    start = time.perf_counter()
+    try:
+        yield record
+    except Exception as e:
+        record['error'] = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        record['seconds'] = time.perf_counter() - start
+        _depth.reset(token)
+        rss_after = _current_rss()
+        record['mem_delta_mb'] = ((rss_after - rss_before) / 1024 ** 2
+                                  if rss_before is not None and rss_after is not None else None)
+        with _state.lock:
+            _state.records.append(record)
+
+
+def instrument(name=None):
+    """
+    Decorator recording wall time, rows in/out and memory delta of every call
+    """
+    def decorator(func):
+        label = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _state.enabled:
+                return func(*args, **kwargs)
+            with span(label, rows_in=count_rows(args[0]) if args else None) as record:
+                result = func(*args, **kwargs)
+                record['rows_out'] = count_rows(result)
+            return result
+
+        return wrapper
+    return decorator
+
+
+def summary(records=None):
+    """
+    Per-name totals sorted by total time (calls, seconds, rows, memory delta)
+    """
+    records = get_records() if records is None else records
+    totals = {}
+    for record in records:
+        entry = totals.setdefault(record['name'], {
+            'name': record['name'], 'calls': 0, 'total_s': 0.0, 'max_s': 0.0,
+            'rows_in': 0, 'rows_out': 0, 'mem_delta_mb': 0.0, 'errors': 0
+        })
+        entry['calls'] += 1
+        entry['total_s'] += record['seconds']
+        entry['max_s'] = max(entry['max_s'], record['seconds'])
+        entry['rows_in'] += record['rows_in'] or 0
+        entry['rows_out'] += record['rows_out'] or 0
+        entry['mem_delta_mb'] += record['mem_delta_mb'] or 0.0
+        entry['errors'] += 'error' in record
+
+    for entry in totals.values():
+        entry['mean_s'] = entry['total_s'] / entry['calls']
+    return sorted(totals.values(), key=lambda entry: entry['total_s'], reverse=True)
+
+
+def format_summary(records=None):
+    """
+    Text table of summary()
+    """
+    rows = summary(records)
+    lines = [f"{'span':<40} {'calls':>6} {'total':>9} {'mean':>9} {'rows in':>10} {'rows out':>10} {'mem Δ':>9}"]
+    for entry in rows:
+        error_flag = '  ❌' if entry['errors'] else ''
+        lines.append(f"{entry['name'][:40]:<40} {entry['calls']:>6} {entry['total_s']:>8.3f}s "
+                     f"{entry['mean_s']:>8.3f}s {entry['rows_in']:>10,} {entry['rows_out']:>10,} "
+                     f"{entry['mem_delta_mb']:>7.1f}MB{error_flag}")
+    return '\n'.join(lines)
+
+
+def write_summary(path, records=None):
+    """
+    Write the summary and the raw spans as JSON
+    """
+    records = get_records() if records is None else records
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'summary': summary(records), 'spans': records}, f, indent=2)
+    return path
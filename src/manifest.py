@@ -0,0 +1,94 @@
+"""
+Build manifest for skipping unchanged outputs in GDP per capita analysis
+Author: GitHub Portfolio Project
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import time
+
+MANIFEST_VERSION = 1
+
+
+def file_hash(path, chunk_size=1 << 20):
+    """
+    sha256 of a file's contents
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def source_hash(functions):
+    """
+    sha256 over the source code of the given functions (decorators unwrapped)
+    """
+    digest = hashlib.sha256()
+    for function in functions:
+        target = inspect.unwrap(function)
+        try:
+            source = inspect.getsource(target)
+        except (OSError, TypeError):
+            # Source unavailable (e.g. interactive definitions): fall back to the bytecode
+            code = getattr(target, '__code__', None)
+            source = code.co_code.hex() if code is not None else repr(target)
+        digest.update(function.__qualname__.encode('utf-8'))
+        digest.update(source.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def output_fingerprint(data_hash, functions, params):
+    """
+    Fingerprint of one output: input data hash + producing code + parameters
+    """
+    digest = hashlib.sha256(f'manifest-v{MANIFEST_VERSION}:{data_hash}:'.encode('utf-8'))
+    digest.update(source_hash(functions).encode('utf-8'))
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def load_manifest(path):
+    """
+    Manifest entries by target name (empty when missing or unreadable)
+    """
+    try:
+        with open(path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get('version') != MANIFEST_VERSION:
+        return {}
+    return manifest.get('targets', {})
+
+
+def save_manifest(path, targets):
+    """
+    Write the manifest atomically
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': MANIFEST_VERSION, 'targets': targets}, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def is_stale(targets, name, fingerprint, output_dir, outputs):
+    """
+    True when a target has no manifest entry, a different fingerprint, or a missing output
+    """
+    entry = targets.get(name)
+    if entry is None or entry.get('fingerprint') != fingerprint:
+        return True
+    return any(not os.path.exists(os.path.join(output_dir, output)) for output in outputs)
+
+
+def record_target(targets, name, fingerprint, outputs):
+    """
+    Record that a target was built from fingerprint
+    """
+    targets[name] = {'fingerprint': fingerprint, 'outputs': list(outputs),
+                     'built_at': time.strftime('%Y-%m-%dT%H:%M:%S')}
@@ -0,0 +1,232 @@
+"""
+Dense entity x year panel representation for GDP per capita analysis
+Author: GitHub Portfolio Project
+"""
+
+import warnings
+
+import pandas as pd
+import numpy as np
+
+
+class GDPPanel:
+    """
+    Dense float64 matrix (entities x years) with NaN for missing observations
+
+    Entities and years are sorted; continent membership is stored as one
+    integer code per entity (-1 when unmapped). Build it once with
+    GDPPanel.from_frame and reuse it across the analysis functions.
+    """
+
+    def __init__(self, values, entities, years, gdp_column, codes=None,
+                 continent_codes=None, continents=None):
+        self.values = values
+        self.entities = np.asarray(entities, dtype=object)
+        self.years = np.asarray(years, dtype=np.int64)
+        self.gdp_column = gdp_column
+        self.codes = codes if codes is not None else np.full(len(self.entities), np.nan, dtype=object)
+        self.continent_codes = (continent_codes if continent_codes is not None
+                                else np.full(len(self.entities), -1, dtype=np.int64))
+        self.continents = np.asarray(continents if continents is not None else [], dtype=object)
+
+        self.entity_index = {entity: i for i, entity in enumerate(self.entities)}
+        self.year_index = {int(year): j for j, year in enumerate(self.years)}
+
+    @classmethod
+    def from_frame(cls, df, gdp_column):
+        """
+        Build a panel from the long-format output of load_and_clean_data
+        """
+        entity_codes, entities = pd.factorize(df['Entity'], sort=True)
+        year_codes, years = pd.factorize(df['Year'], sort=True)
+
+        # Duplicate (Entity, Year) rows keep the last value
+        values = np.full((len(entities), len(years)), np.nan)
+        values[entity_codes, year_codes] = df[gdp_column].to_numpy(dtype=np.float64)
+
+        # One ISO code and continent per entity (first non-missing value)
+        codes = np.full(len(entities), np.nan, dtype=object)
+        if 'Code' in df.columns:
+            code_series = df['Code'].astype(object)
+            present = code_series.notna().to_numpy()
+            codes[entity_codes[present][::-1]] = code_series.to_numpy()[present][::-1]
+
+        continent_codes = np.full(len(entities), -1, dtype=np.int64)
+        continents = []
+        if 'Continent' in df.columns:
+            row_continents, continents = pd.factorize(df['Continent'], sort=True)
+            present = row_continents >= 0
+            continent_codes[entity_codes[present][::-1]] = row_continents[present][::-1]
+
+        return cls(values, entities, years, gdp_column, codes, continent_codes, continents)
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    @property
+    def observed(self):
+        """
+        Boolean mask of non-missing cells
+        """
+        return ~np.isnan(self.values)
+
+    def __len__(self):
+        return len(self.entities)
+
+    def __repr__(self):
+        n_entities, n_years = self.shape
+        coverage = self.observed.mean() * 100 if self.values.size else 0.0
+        year_range = f"{self.years.min()}-{self.years.max()}" if n_years else "empty"
+        return f"GDPPanel({n_entities} entities x {n_years} years, {year_range}, {coverage:.1f}% observed)"
+
+    def entity(self, name):
+        """
+        Series of values for one entity indexed by year
+        """
+        return pd.Series(self.values[self.entity_index[name]], index=self.years, name=name)
+
+    def year(self, year):
+        """
+        Series of values for one year indexed by entity
+        """
+        return pd.Series(self.values[:, self.year_index[int(year)]], index=self.entities, name=int(year))
+
+    def select(self, entities=None, years=None):
+        """
+        Slice the panel by entity names and/or years
+        """
+        rows = slice(None)
+        cols = slice(None)
+        if entities is not None:
+            rows = np.array([self.entity_index[e] for e in entities if e in self.entity_index], dtype=np.int64)
+        if years is not None:
+            cols = np.array([self.year_index[int(y)] for y in years if int(y) in self.year_index], dtype=np.int64)
+
+        return GDPPanel(
+            self.values[rows][:, cols],
+            self.entities[rows],
+            self.years[cols],
+            self.gdp_column,
+            self.codes[rows],
+            self.continent_codes[rows],
+            self.continents
+        )
+
+    def to_long_arrays(self):
+        """
+        Observed cells as (entity positions, years, values), sorted by entity then year
+        """
+        rows, cols = np.nonzero(self.observed)
+        return rows, self.years[cols], self.values[rows, cols]
+
+    def to_frame(self):
+        """
+        Long-format frame with the same columns as load_and_clean_data
+        """
+        rows, years, values = self.to_long_arrays()
+        continent_labels = np.full(len(self.entities), np.nan, dtype=object)
+        mapped = self.continent_codes >= 0
+        continent_labels[mapped] = self.continents[self.continent_codes[mapped]]
+
+        return pd.DataFrame({
+            'Entity': self.entities[rows],
+            'Code': self.codes[rows],
+            'Year': years,
+            self.gdp_column: values,
+            'Continent': continent_labels[rows]
+        })
+
+    def growth(self, periods=1):
+        """
+        Growth rate (%) over `periods` calendar years; NaN where either year is missing
+        """
+        growth = np.full_like(self.values, np.nan)
+        if periods < self.values.shape[1]:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                growth[:, periods:] = (self.values[:, periods:] / self.values[:, :-periods] - 1) * 100
+        return growth
+
+    def moving_average(self, window=5, min_periods=1):
+        """
+        Trailing moving average over calendar years, ignoring missing values
+        """
+        observed = self.observed
+        filled = np.where(observed, self.values, 0.0)
+
+        # Windowed sums from padded cumulative sums along the year axis
+        zeros = np.zeros((filled.shape[0], 1))
+        cum_values = np.hstack([zeros, np.cumsum(filled, axis=1)])
+        cum_counts = np.hstack([zeros, np.cumsum(observed, axis=1)])
+        upper = np.arange(1, filled.shape[1] + 1)
+        lower = np.maximum(upper - window, 0)
+        sums = cum_values[:, upper] - cum_values[:, lower]
+        counts = cum_counts[:, upper] - cum_counts[:, lower]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            averages = sums / counts
+        averages[(counts < min_periods) | ~observed] = np.nan
+        return averages
+
+    def ranks(self, ascending=False, pct=False):
+        """
+        Rank of every entity within each year (1 = richest by default)
+        """
+        ranked = pd.DataFrame(self.values).rank(axis=0, ascending=ascending, pct=pct)
+        return ranked.to_numpy()
+
+    def aggregate(self, stats=('mean', 'median', 'std', 'min', 'max', 'count')):
+        """
+        Cross-sectional statistics per year as a dict of arrays
+        """
+        values = self.values
+        result = {}
+        with warnings.catch_warnings():
+            # All-missing years produce NaN without warning noise
+            warnings.simplefilter('ignore', RuntimeWarning)
+            for stat in stats:
+                if stat == 'mean':
+                    result[stat] = np.nanmean(values, axis=0)
+                elif stat == 'median':
+                    result[stat] = np.nanmedian(values, axis=0)
+                elif stat == 'std':
+                    result[stat] = np.nanstd(values, axis=0, ddof=1)
+                elif stat == 'min':
+                    result[stat] = np.nanmin(values, axis=0)
+                elif stat == 'max':
+                    result[stat] = np.nanmax(values, axis=0)
+                elif stat == 'sum':
+                    result[stat] = np.nansum(values, axis=0)
+                elif stat == 'count':
+                    result[stat] = self.observed.sum(axis=0)
+                else:
+                    raise ValueError(f"Unknown statistic: {stat}")
+        return result
+
+    def continent_aggregate(self):
+        """
+        Mean and count per (continent, year) as two (continents x years) arrays
+        """
+        # One-hot membership turns the group sums into a single matrix product
+        membership = np.zeros((len(self.continents), len(self.entities)))
+        mapped = self.continent_codes >= 0
+        membership[self.continent_codes[mapped], np.nonzero(mapped)[0]] = 1.0
+
+        observed = self.observed
+        sums = membership @ np.where(observed, self.values, 0.0)
+        counts = membership @ observed.astype(np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            means = np.where(counts > 0, sums / counts, np.nan)
+        return means, counts.astype(np.int64)
+
+    def window_mean(self, years):
+        """
+        Per-entity mean over a set of years, ignoring missing values
+        """
+        positions = [self.year_index[int(y)] for y in years if int(y) in self.year_index]
+        block = self.values[:, positions]
+        observed = ~np.isnan(block)
+        counts = observed.sum(axis=1)
+        totals = np.where(observed, block, 0.0).sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(counts > 0, totals / counts, np.nan)
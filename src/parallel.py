@@ -0,0 +1,307 @@
+"""
+Entity-partitioned parallel execution for GDP per capita analysis
+Author: GitHub Portfolio Project
+
+The panel is sorted by (entity, year) and cut at entity boundaries into
+contiguous blocks of similar row counts, so every per-entity computation
+sees whole series and blocks are independent. Columns are copied once into
+a shared memory segment (text columns as integer codes); worker processes
+attach to it when the pool starts and receive only (start, stop) row ranges,
+so the frame is never pickled per task. Block results come back in block
+order and are stitched into the same output as the serial functions. With
+one job, or when a process pool or shared memory is unavailable, the same
+kernels run in-process.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pandas as pd
+
+from .data_processing import (_top_k_positions, calculate_growth_rate, get_growth_champions_and_laggards,
+                              get_moving_average)
+from .features import calculate_cycle_features
+
+# Blocks per worker: smaller blocks even out uneven entity lengths across workers
+BLOCKS_PER_JOB = 4
+CYCLE_COLUMNS = ['in_recession', 'in_recovery', 'economic_phase', 'crisis_year', 'years_since_recession']
+
+_worker_state = {}
+
+
+def default_jobs():
+    """
+    CPUs available to this process
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def entity_blocks(entity_codes, n_blocks):
+    """
+    (start, stop) row ranges of ~equal size over entity-sorted codes, cut only where the entity changes
+    """
+    entity_codes = np.asarray(entity_codes)
+    n = len(entity_codes)
+    if n == 0:
+        return []
+    change = np.ones(n, dtype=bool)
+    change[1:] = entity_codes[1:] != entity_codes[:-1]
+    entity_starts = np.append(np.flatnonzero(change), n)
+    # Snap every ideal cut to the first entity start at or after it
+    ideal = np.arange(1, max(int(n_blocks), 1)) * n / max(int(n_blocks), 1)
+    cuts = entity_starts[np.searchsorted(entity_starts, ideal)]
+    bounds = np.unique(np.concatenate([[0], cuts, [n]]))
+    return [(int(start), int(stop)) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def _encode_columns(df, known_codes=None):
+    """
+    Numeric arrays per column plus (is categorical, labels) of text/categorical columns (stored as int32 codes)
+
+    known_codes maps columns to already factorized (codes, uniques).
+    """
+    known_codes = known_codes or {}
+    arrays, labels = {}, {}
+    for column in df.columns:
+        series = df[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            arrays[column] = series.cat.codes.to_numpy(dtype=np.int32)
+            labels[column] = (True, series.cat.categories)
+        elif pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype):
+            arrays[column] = series.to_numpy()
+        else:
+            codes, uniques = known_codes[column] if column in known_codes else pd.factorize(series)
+            arrays[column] = codes.astype(np.int32)
+            labels[column] = (False, uniques)
+    return arrays, labels
+
+
+def _decode_block(arrays, labels, start, stop):
+    """
+    DataFrame of rows [start, stop) from encoded column arrays
+    """
+    columns = {}
+    for column, values in arrays.items():
+        block = values[start:stop]
+        if column not in labels:
+            columns[column] = block.copy()
+            continue
+        categorical, values = labels[column]
+        # -1 (missing) becomes NaN
+        columns[column] = (pd.Categorical.from_codes(block, values) if categorical
+                           else values.array.take(block, allow_fill=True))
+    return pd.DataFrame(columns)
+
+
+class _SharedColumns:
+    """
+    Encoded columns laid out in one shared memory segment
+    """
+
+    def __init__(self, arrays):
+        from multiprocessing import shared_memory
+
+        layout, offset = [], 0
+        for column, values in arrays.items():
+            layout.append((column, values.dtype.str, offset, len(values)))
+            # 8-byte alignment for every column
+            offset += (values.nbytes + 7) // 8 * 8
+        self.memory = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        for (column, dtype, start, length), values in zip(layout, arrays.values()):
+            np.ndarray(length, dtype=dtype, buffer=self.memory.buf, offset=start)[:] = values
+        self.layout = layout
+
+    @property
+    def spec(self):
+        return self.memory.name, self.layout
+
+    @staticmethod
+    def attach(spec):
+        """
+        (shared memory handle, {column: array view}) for a segment created in another process
+        """
+        from multiprocessing import shared_memory
+
+        name, layout = spec
+        memory = shared_memory.SharedMemory(name=name)
+        views = {column: np.ndarray(length, dtype=dtype, buffer=memory.buf, offset=start)
+                 for column, dtype, start, length in layout}
+        return memory, views
+
+    def close(self):
+        self.memory.close()
+        self.memory.unlink()
+
+
+def _init_worker(spec, labels):
+    """
+    Attach a pool worker to the shared columns once
+    """
+    memory, views = _SharedColumns.attach(spec)
+    _worker_state.update(memory=memory, views=views, labels=labels)
+
+
+def _run_shared_block(kernel, start, stop, kwargs):
+    block = _decode_block(_worker_state['views'], _worker_state['labels'], start, stop)
+    return kernel(block, **kwargs)
+
+
+class PartitionedPanel:
+    """
+    Entity-sorted panel cut into contiguous entity blocks, run across a process pool
+
+    map(kernel, **kwargs) calls kernel(block_frame, **kwargs) for every block
+    and returns the results in block order; kernels must be module-level
+    functions (they are sent to the workers by reference). The pool and the
+    shared memory segment are created on first use and live until close(),
+    so several kernels can run against one partitioning.
+    """
+
+    def __init__(self, df, jobs=None, entity_col='Entity', year_col='Year', blocks_per_job=BLOCKS_PER_JOB):
+        self.jobs = default_jobs() if jobs is None else max(int(jobs), 1)
+        self.entity_col = entity_col
+        self.year_col = year_col
+        # Positions of the sorted rows in the original frame (sort_values is stable)
+        positional = df.reset_index(drop=True).sort_values([entity_col, year_col])
+        self.order = positional.index.to_numpy()
+        self.frame = df.iloc[self.order]
+        self._entity_codes = pd.factorize(self.frame[entity_col])
+        self.blocks = entity_blocks(self._entity_codes[0], self.jobs * blocks_per_job if self.jobs > 1 else 1)
+        self._shared = None
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self.blocks)
+
+    def _start_pool(self):
+        arrays, labels = _encode_columns(self.frame, {self.entity_col: self._entity_codes})
+        try:
+            self._shared = _SharedColumns(arrays)
+            self._executor = ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_worker,
+                                                 initargs=(self._shared.spec, labels))
+        except (ImportError, OSError, NotImplementedError) as e:
+            self._fall_back(e)
+
+    def _fall_back(self, error):
+        print(f"⚠️ Parallel execution unavailable ({error}); running serially")
+        self.close()
+        self.jobs = 1
+
+    def map(self, kernel, **kwargs):
+        """
+        kernel(block, **kwargs) for every block, in block order
+        """
+        if self.jobs > 1 and self._executor is None:
+            self._start_pool()
+        if self.jobs <= 1:
+            return [kernel(self.frame.iloc[start:stop], **kwargs) for start, stop in self.blocks]
+        try:
+            futures = [self._executor.submit(_run_shared_block, kernel, start, stop, kwargs)
+                       for start, stop in self.blocks]
+            return [future.result() for future in futures]
+        except BrokenProcessPool as e:
+            # Workers could not start or died (e.g. no fork/shared memory in a sandbox)
+            self._fall_back(e)
+            return self.map(kernel, **kwargs)
+
+    def columns(self, kernel, **kwargs):
+        """
+        Stitch kernels returning {column: per-row array} into full-length arrays in sorted row order
+        """
+        results = self.map(kernel, **kwargs)
+        if not results:
+            return {}
+        return {column: np.concatenate([result[column] for result in results]) for column in results[0]}
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
+
+
+def _growth_rate_kernel(block, gdp_column, entity_col, year_col):
+    return {'growth_rate': calculate_growth_rate(block, gdp_column, entity_col, year_col)['growth_rate'].to_numpy()}
+
+
+def _moving_average_kernel(block, gdp_column, window, entity_col):
+    column = f'ma_{window}y'
+    return {column: get_moving_average(block, gdp_column, window, entity_col)[column].to_numpy()}
+
+
+def _cycle_kernel(block, gdp_column, entity_col, year_col):
+    if 'yoy_growth' not in block.columns:
+        block = block.assign(yoy_growth=block.groupby(entity_col, observed=True)[gdp_column].pct_change() * 100)
+    cycle = calculate_cycle_features(block, gdp_column, entity_col, year_col)
+    return {column: cycle[column].to_numpy() for column in ['yoy_growth'] + CYCLE_COLUMNS}
+
+
+def _growth_table_kernel(block, gdp_column, min_years, start_year, end_year):
+    return get_growth_champions_and_laggards(block, gdp_column, min_years, 0, start_year, end_year)[2]
+
+
+def parallel_growth_rate(df, gdp_column, entity_col='Entity', year_col='Year', jobs=None):
+    """
+    data_processing.calculate_growth_rate across entity blocks (same sorted frame)
+    """
+    with PartitionedPanel(df, jobs, entity_col, year_col) as panel:
+        columns = panel.columns(_growth_rate_kernel, gdp_column=gdp_column, entity_col=entity_col,
+                                year_col=year_col)
+        return panel.frame.assign(**columns)
+
+
+def parallel_moving_average(df, gdp_column, window=5, entity_col='Entity', year_col='Year', jobs=None):
+    """
+    data_processing.get_moving_average across entity blocks (rows stay in df's order)
+
+    Windows run in year order, which matches the serial function whenever
+    each entity's rows are already in year order (as load_and_clean_data returns them).
+    """
+    with PartitionedPanel(df, jobs, entity_col, year_col) as panel:
+        column = f'ma_{window}y'
+        values = panel.columns(_moving_average_kernel, gdp_column=gdp_column, window=window,
+                               entity_col=entity_col)[column]
+        result = np.empty_like(values)
+        result[panel.order] = values
+    df_ma = df.copy(deep=False)
+    df_ma[column] = result
+    return df_ma
+
+
+def parallel_cycle_features(df, gdp_column, entity_col='Entity', year_col='Year', jobs=None):
+    """
+    features.calculate_cycle_features across entity blocks (yoy_growth is added when missing)
+    """
+    with PartitionedPanel(df, jobs, entity_col, year_col) as panel:
+        columns = panel.columns(_cycle_kernel, gdp_column=gdp_column, entity_col=entity_col, year_col=year_col)
+        return panel.frame.reset_index(drop=True).assign(**columns)
+
+
+def parallel_growth_champions(df, gdp_column, min_years=15, top_n=10, start_year=None, end_year=None,
+                              jobs=None):
+    """
+    data_processing.get_growth_champions_and_laggards with the per-entity CAGR table built across blocks
+
+    The growth table lists entities in sorted order (the serial function keeps
+    their order of first appearance); champions and laggards are the same.
+    """
+    with PartitionedPanel(df, jobs) as panel:
+        tables = panel.map(_growth_table_kernel, gdp_column=gdp_column, min_years=min_years,
+                           start_year=start_year, end_year=end_year)
+    growth_df = pd.concat(tables, ignore_index=True)
+    cagr_values = growth_df['cagr'].to_numpy()
+    top_growers = growth_df.iloc[_top_k_positions(cagr_values, top_n, largest=True)]
+    worst_performers = growth_df.iloc[_top_k_positions(cagr_values, top_n, largest=False)]
+    return top_growers, worst_performers, growth_df
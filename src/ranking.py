@@ -0,0 +1,297 @@
+"""
+Cross-sectional ranks and percentiles for GDP per capita analysis
+Author: GitHub Portfolio Project
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def _group_codes(df, by):
+    """
+    One integer code per row for the combination of the `by` columns (-1 when any key is missing)
+    """
+    codes = np.zeros(len(df), dtype=np.int64)
+    missing = np.zeros(len(df), dtype=bool)
+    for column in by:
+        column_codes, uniques = pd.factorize(df[column], sort=True)
+        missing |= column_codes < 0
+        codes = codes * max(len(uniques), 1) + np.maximum(column_codes, 0)
+    return np.where(missing, -1, codes)
+
+
+class CrossSectionRanks:
+    """
+    Ranks of a value within every group of a grouping (e.g. per Year, or per
+    Year and Continent), from a single sort by (group, value)
+
+    Each group becomes a contiguous ascending block with missing values at
+    its end, so dense ranks, pandas-style average ranks and percentiles come
+    from run offsets, and the top/bottom n of every group are slices of the
+    same order. Rows with a missing value or group key get NaN ranks, as
+    groupby().rank() does.
+
+    The sort is a stable value argsort followed by a stable sort of the
+    group codes (equivalent to lexsort((values, groups))); pass value_order
+    to share the value argsort between several groupings of the same column.
+    """
+
+    def __init__(self, values, group_codes, value_order=None):
+        values = np.asarray(values, dtype=np.float64)
+        self.group_codes = np.asarray(group_codes, dtype=np.int64)
+        if value_order is None:
+            value_order = np.argsort(values, kind='stable')
+        codes = self.group_codes[value_order]
+        if len(codes) and -32768 <= codes.min() and codes.max() < 32768:
+            # 16-bit keys take numpy's radix sort
+            codes = codes.astype(np.int16)
+        self.order = value_order[np.argsort(codes, kind='stable')]
+
+        sorted_values = values[self.order]
+        sorted_groups = self.group_codes[self.order]
+        n = len(sorted_values)
+        positions = np.arange(n)
+
+        group_start = np.ones(n, dtype=bool)
+        group_start[1:] = sorted_groups[1:] != sorted_groups[:-1]
+        run_start = group_start.copy()
+        run_start[1:] |= sorted_values[1:] != sorted_values[:-1]
+
+        group_first = np.maximum.accumulate(np.where(group_start, positions, 0)) if n else positions
+        run_ids = np.cumsum(run_start) - 1
+        run_first = np.flatnonzero(run_start)
+        run_sizes = np.diff(np.append(run_first, n))
+
+        valid = ~np.isnan(sorted_values) & (sorted_groups >= 0)
+        group_ids = np.cumsum(group_start) - 1
+        counts = np.bincount(group_ids, weights=valid.astype(np.float64), minlength=group_ids[-1] + 1 if n else 0)
+
+        # Average rank of a tie run: midpoint of its first and last position (1-based)
+        first = run_first[run_ids] - group_first
+        average_rank = first + (run_sizes[run_ids] + 1) / 2
+        dense_rank = run_ids - run_ids[group_first] + 1
+
+        self._sorted_valid = valid
+        self._sorted_run_ids = run_ids
+        self._sorted_group_ids = group_ids
+        self._run_first = run_first
+        self._run_sizes = run_sizes
+        self._group_first = group_first
+        self._group_counts = counts
+        self._sorted = {
+            'rank': np.where(valid, average_rank, np.nan),
+            'dense_rank': np.where(valid, dense_rank, np.nan),
+            'pct': np.where(valid, average_rank / np.maximum(counts[group_ids], 1), np.nan),
+        }
+        self._descending = None
+
+    @classmethod
+    def from_frame(cls, df, column, by=('Year',)):
+        return cls.for_groupings(df, column, [by])[0]
+
+    @classmethod
+    def for_groupings(cls, df, column, groupings):
+        """
+        One CrossSectionRanks per grouping, all sharing a single value argsort
+        """
+        values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        value_order = np.argsort(values, kind='stable')
+        return [cls(values, _group_codes(df, [by] if isinstance(by, str) else list(by)), value_order)
+                for by in groupings]
+
+    def __len__(self):
+        return len(self.order)
+
+    def _unsort(self, sorted_array):
+        result = np.empty_like(sorted_array)
+        result[self.order] = sorted_array
+        return result
+
+    def rank(self):
+        """
+        Average rank within the group (ties share the mean position), like rank()
+        """
+        return self._unsort(self._sorted['rank'])
+
+    def dense_rank(self):
+        """
+        Dense rank within the group (1 = lowest, ties share a rank, no gaps)
+        """
+        return self._unsort(self._sorted['dense_rank'])
+
+    def percentile(self, scale=100):
+        """
+        Percentile within the group: rank(pct=True) * scale
+        """
+        return self._unsort(self._sorted['pct'] * scale)
+
+    def bottom(self, n):
+        """
+        Row positions of the n lowest values per group, lowest first (ties in row order, like nsmallest)
+        """
+        position = np.arange(len(self.order)) - self._group_first
+        keep = self._sorted_valid & (position < n)
+        return self.order[keep]
+
+    def top(self, n):
+        """
+        Row positions of the n highest values per group, highest first (ties in row order, like nlargest)
+        """
+        if self._descending is None:
+            # Reverse the tie runs inside each group but keep row order within a run:
+            # a run [start, end) of a group with `count` valid rows lands at count - (end - first) + offset
+            valid = np.flatnonzero(self._sorted_valid)
+            first = self._group_first[valid]
+            run_start = self._run_first[self._sorted_run_ids[valid]]
+            run_end = run_start + self._run_sizes[self._sorted_run_ids[valid]]
+            count = self._group_counts[self._sorted_group_ids[valid]].astype(np.int64)
+            position = count - (run_end - first) + (valid - run_start)
+            rows = np.full(len(self.order), -1, dtype=np.int64)
+            positions = np.full(len(self.order), -1, dtype=np.int64)
+            rows[first + position] = self.order[valid]
+            positions[first + position] = position
+            kept = rows >= 0
+            self._descending = (rows[kept], positions[kept])
+        rows, position = self._descending
+        return rows[position < n]
+
+
+def cross_section_percentiles(df, column, groupings=(('Year',),), scale=100):
+    """
+    groupby(by)[column].rank(pct=True) * scale for each grouping, as a list of Series
+
+    The groupings share one value sort, e.g. [['Year'], ['Year', 'Continent']]
+    gives world and continent percentiles for every year at once.
+    """
+    return [pd.Series(ranks.percentile(scale), index=df.index, name=column)
+            for ranks in CrossSectionRanks.for_groupings(df, column, groupings)]
+
+
+def top_bottom_by_group(df, column, by=('Year',), n=10):
+    """
+    (top, bottom) frames with the n highest / lowest rows of every group
+    """
+    ranks = CrossSectionRanks.from_frame(df, column, by)
+    return df.iloc[ranks.top(n)], df.iloc[ranks.bottom(n)]
+
+
+class QuantileSketch:
+    """
+    Mergeable log-bucket histogram per group for approximate percentiles
+
+    For panels that do not fit in memory: feed chunks with add() (e.g. from
+    pd.read_csv(chunksize=...)), then query percentile() chunk by chunk.
+    Positive values fall into buckets whose bounds differ by a factor of
+    (1 + a) / (1 - a), so any quantile is returned within relative error a
+    of a true sample value; a value's percentile is exact up to the other
+    values sharing its bucket, which count as ties. Values <= 0 share one
+    bucket below all others.
+    """
+
+    def __init__(self, relative_accuracy=0.01, min_value=1e-3, max_value=1e9):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = np.log(self.gamma)
+        self._offset = int(np.floor(np.log(min_value) / self._log_gamma))
+        # Bucket 0 holds values <= 0; values outside [min_value, max_value] go to the first/last positive bucket
+        self.n_buckets = int(np.ceil(np.log(max_value) / self._log_gamma)) - self._offset + 2
+        self.groups = {}
+        self.counts = np.zeros((0, self.n_buckets), dtype=np.int64)
+
+    def _bucket(self, values):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            index = np.ceil(np.log(values) / self._log_gamma) - self._offset
+        index = np.where(values > 0, np.clip(index, 1, self.n_buckets - 1), 0)
+        return index.astype(np.int64)
+
+    def _group_ids(self, keys, grow=False):
+        ids = np.empty(len(keys), dtype=np.int64)
+        for i, key in enumerate(keys):
+            group = self.groups.get(key)
+            if group is None:
+                if not grow:
+                    group = -1
+                else:
+                    group = self.groups[key] = len(self.groups)
+            ids[i] = group
+        if grow and len(self.groups) > len(self.counts):
+            grown = np.zeros((len(self.groups), self.n_buckets), dtype=np.int64)
+            grown[:len(self.counts)] = self.counts
+            self.counts = grown
+        return ids
+
+    @staticmethod
+    def _keys(df, by):
+        """
+        Per row code into a list of group key tuples (-1 when any key is missing)
+        """
+        # Factorized first so the Python loop over keys runs once per distinct group
+        frame = df[list(by)]
+        missing = frame.isna().any(axis=1).to_numpy()
+        codes, uniques = pd.factorize(pd.MultiIndex.from_frame(frame[~missing]))
+        row_codes = np.full(len(frame), -1, dtype=np.int64)
+        row_codes[~missing] = codes
+        return row_codes, [tuple(key) for key in uniques]
+
+    def add(self, df, column, by=('Year',)):
+        """
+        Count a chunk's values into the sketch
+        """
+        by = [by] if isinstance(by, str) else list(by)
+        values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        codes, keys = self._keys(df, by)
+        valid = (codes >= 0) & ~np.isnan(values)
+        group_ids = self._group_ids(keys, grow=True)[codes[valid]]
+        cells = group_ids * self.n_buckets + self._bucket(values[valid])
+        self.counts += np.bincount(cells, minlength=self.counts.size).reshape(self.counts.shape)
+        return self
+
+    def merge(self, other):
+        """
+        Fold another sketch with the same accuracy and range into this one
+        """
+        if other.n_buckets != self.n_buckets or other.gamma != self.gamma:
+            raise ValueError("Sketches use different bucket layouts")
+        for key in other.groups:
+            self._group_ids([key], grow=True)
+        for key, other_id in other.groups.items():
+            self.counts[self.groups[key]] += other.counts[other_id]
+        return self
+
+    def percentile(self, df, column, by=('Year',), scale=100):
+        """
+        Approximate rank(pct=True) * scale of a chunk's values within their group
+        """
+        by = [by] if isinstance(by, str) else list(by)
+        values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        codes, keys = self._keys(df, by)
+        group_ids = np.where(codes >= 0, self._group_ids(keys)[np.maximum(codes, 0)], -1) if keys \
+            else np.full(len(values), -1)
+        valid = (group_ids >= 0) & ~np.isnan(values)
+
+        cumulative = np.cumsum(self.counts, axis=1)
+        totals = cumulative[:, -1] if len(self.counts) else np.zeros(0, dtype=np.int64)
+        result = np.full(len(values), np.nan)
+        ids = group_ids[valid]
+        buckets = self._bucket(values[valid])
+        below = np.where(buckets > 0, cumulative[ids, np.maximum(buckets - 1, 0)], 0)
+        in_bucket = self.counts[ids, buckets]
+        # Same-bucket values count as ties: average rank over the bucket
+        result[valid] = (below + (in_bucket + 1) / 2) / np.maximum(totals[ids], 1) * scale
+        return pd.Series(result, index=df.index, name=column)
+
+    def quantile(self, q):
+        """
+        Approximate q-quantile per group as a Series indexed by group key
+        """
+        cumulative = np.cumsum(self.counts, axis=1)
+        totals = cumulative[:, -1]
+        target = np.maximum(np.ceil(q * totals), 1)
+        buckets = (cumulative < target[:, None]).sum(axis=1)
+        # Bucket i covers (gamma^(i-1), gamma^i]; its midpoint estimate is within the relative accuracy
+        upper = self.gamma ** (buckets + self._offset)
+        estimate = np.where(buckets > 0, 2 * upper / (self.gamma + 1), 0.0)
+        estimate = np.where(totals > 0, estimate, np.nan)
+        keys = sorted(self.groups, key=self.groups.get)
+        index = pd.MultiIndex.from_tuples(keys) if keys and len(keys[0]) > 1 else [key[0] for key in keys]
+        return pd.Series(estimate, index=index, name=f'q{q:g}')
@@ -0,0 +1,262 @@
+"""
+Rolling-window kernels over entity-sorted panels for GDP per capita analysis
+Author: GitHub Portfolio Project
+
+Every kernel runs over the whole panel at once: values are laid out entity
+by entity and each row's window stops at its entity's first row, which is
+what groupby(entity).rolling(window) computes group by group. Windows are
+assembled from power-of-two blocks: sums add the blocks that tile
+[left, i], mean/std/slope merge the blocks' moments with the pairwise
+Welford (Chan) update, and min/max take two overlapping blocks. Each
+statistic costs O(n log window) vectorized operations and never combines
+values from outside one window.
+"""
+
+import numpy as np
+import pandas as pd
+
+STATISTICS = ('sum', 'mean', 'std', 'min', 'max', 'drawdown', 'slope')
+
+
+def segment_starts(keys):
+    """
+    Row index of the first row of each row's run of equal keys (keys must be grouped)
+    """
+    keys = np.asarray(keys)
+    n = len(keys)
+    change = np.ones(n, dtype=bool)
+    change[1:] = keys[1:] != keys[:-1]
+    return np.maximum.accumulate(np.where(change, np.arange(n), 0)) if n else np.zeros(0, dtype=np.int64)
+
+
+def _window_left(starts, window):
+    rows = np.arange(len(starts))
+    return np.maximum(starts, rows - window + 1)
+
+
+def _window_sums(columns, starts, window):
+    """
+    Sum of each array over the rows [left, i] of every row's window
+    """
+    lengths = np.arange(len(starts)) - _window_left(starts, window) + 1
+    totals = [np.zeros(len(starts)) for _ in columns]
+    blocks = [np.array(column, dtype=np.float64) for column in columns]
+    position = np.arange(len(starts))
+    for k in range(int(window).bit_length()):
+        take = ((lengths >> k) & 1).astype(bool)
+        index = np.where(take, position, 0)
+        for total, block in zip(totals, blocks):
+            total += np.where(take, block[index], 0.0)
+        position = position - (take << k)
+        # Blocks of 2^(k+1) rows ending at each row
+        step = 1 << k
+        for block in blocks:
+            block[step:] = block[step:] + block[:-step]
+    return totals
+
+
+def _merge_moments(a, b):
+    """
+    Combine (count, mean_x, mean_y, M2_x, C_xy) of two disjoint sets (Chan et al. update)
+    """
+    count_a, mean_xa, mean_ya, m2_a, c_a = a
+    count_b, mean_xb, mean_yb, m2_b, c_b = b
+    count = count_a + count_b
+    with np.errstate(invalid='ignore', divide='ignore'):
+        weight = np.where(count > 0, count_b / count, 0.0)
+    delta_x = mean_xb - mean_xa
+    delta_y = mean_yb - mean_ya
+    factor = count_a * weight
+    return (count, mean_xa + delta_x * weight, mean_ya + delta_y * weight,
+            m2_a + m2_b + delta_x * delta_x * factor, c_a + c_b + delta_x * delta_y * factor)
+
+
+def _window_moments(x, starts, window, y=None):
+    """
+    Per-window count, means, sum of squared x deviations and x/y co-deviation
+
+    Blocks of 2^k rows are merged with the pairwise form of Welford's
+    update, so no subtraction ever involves raw sums of squares.
+    """
+    n = len(starts)
+    x = np.asarray(x, dtype=np.float64)
+    observed = ~np.isnan(x)
+    if y is not None:
+        y = np.asarray(y, dtype=np.float64)
+        observed &= ~np.isnan(y)
+    zeros = np.zeros(n)
+    block = (observed.astype(np.float64), np.where(observed, x, 0.0),
+             np.where(observed, y, 0.0) if y is not None else zeros, zeros, zeros)
+    total = (zeros, zeros, zeros, zeros, zeros)
+
+    lengths = np.arange(n) - _window_left(starts, window) + 1
+    position = np.arange(n)
+    for k in range(int(window).bit_length()):
+        take = ((lengths >> k) & 1).astype(bool)
+        index = np.where(take, position, 0)
+        total = _merge_moments(total, tuple(np.where(take, part[index], 0.0) for part in block))
+        position = position - (take << k)
+        # Blocks of 2^(k+1) rows ending at each row
+        step = 1 << k
+        merged = _merge_moments(tuple(part[:-step] for part in block), tuple(part[step:] for part in block))
+        block = tuple(np.concatenate([part[:step], new_part]) for part, new_part in zip(block, merged))
+    return total
+
+
+def rolling_count(values, starts, window):
+    """
+    Non-NaN observations per window
+    """
+    return _window_sums([~np.isnan(np.asarray(values, dtype=np.float64))], starts, window)[0]
+
+
+def rolling_sum(values, starts, window, min_periods=1):
+    values = np.asarray(values, dtype=np.float64)
+    observed = ~np.isnan(values)
+    total, count = _window_sums([np.where(observed, values, 0.0), observed], starts, window)
+    return np.where(count >= min_periods, total, np.nan)
+
+
+def rolling_mean(values, starts, window, min_periods=1):
+    """
+    Rolling mean ignoring NaN, NaN below min_periods observations
+    """
+    values = np.asarray(values, dtype=np.float64)
+    observed = ~np.isnan(values)
+    total, count = _window_sums([np.where(observed, values, 0.0), observed], starts, window)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = total / count
+    return np.where(count >= max(min_periods, 1), mean, np.nan)
+
+
+def rolling_std(values, starts, window, min_periods=2, ddof=1):
+    """
+    Rolling standard deviation ignoring NaN, NaN below min_periods observations
+    """
+    return rolling_moments(values, starts, window, min_periods, ddof)[1]
+
+
+def rolling_moments(values, starts, window, min_periods=1, ddof=1):
+    """
+    (mean, std) per window, NaN below min_periods observations
+    """
+    count, mean, _, m2, _ = _window_moments(values, starts, window)
+    enough = count >= max(min_periods, 1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        std = np.sqrt(np.maximum(m2, 0.0) / (count - ddof))
+    return np.where(enough, mean, np.nan), np.where(enough & (count > ddof), std, np.nan)
+
+
+def _rolling_extreme(values, starts, window, min_periods, reduce, fill):
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    left = _window_left(starts, window)
+    lengths = np.arange(n) - left + 1
+
+    # table[k][j] = extreme of the 2^k rows ending at j
+    table = [np.where(np.isnan(values), fill, values)]
+    for k in range(max(int(window).bit_length() - 1, 0)):
+        step = 1 << k
+        previous = table[-1]
+        block = previous.copy()
+        block[step:] = reduce(previous[step:], previous[:-step])
+        table.append(block)
+    table = np.stack(table)
+
+    # Two blocks of 2^k rows cover [left, i]: one ending at i, one starting at left
+    level = np.floor(np.log2(np.maximum(lengths, 1))).astype(np.int64)
+    rows = np.arange(n)
+    result = reduce(table[level, rows], table[level, left + (1 << level) - 1])
+    count = rolling_count(values, starts, window)
+    return np.where(count >= min_periods, result, np.nan)
+
+
+def rolling_min(values, starts, window, min_periods=1):
+    return _rolling_extreme(values, starts, window, min_periods, np.minimum, np.inf)
+
+
+def rolling_max(values, starts, window, min_periods=1):
+    return _rolling_extreme(values, starts, window, min_periods, np.maximum, -np.inf)
+
+
+def rolling_drawdown(values, starts, window):
+    """
+    (window min - window max) / window max * 100 over full windows
+
+    The notebook's simplified drawdown (max_drawdown_5y): the peak-to-trough
+    range of the window regardless of the order of peak and trough, NaN
+    before the entity has `window` rows or when the peak is not positive.
+    """
+    peak = rolling_max(values, starts, window)
+    trough = rolling_min(values, starts, window)
+    full = np.arange(len(starts)) - starts >= window - 1
+    with np.errstate(invalid='ignore', divide='ignore'):
+        drawdown = (trough - peak) / peak * 100
+    return np.where(full & (peak > 0), drawdown, np.nan)
+
+
+def rolling_slope(values, starts, window, min_periods=None):
+    """
+    Least-squares slope per window with x = row position (1 per step)
+
+    Closed form cov(x, y) / var(x) from the merged window moments of the
+    observed points; NaN below min_periods observations (default: a full
+    window).
+    """
+    if min_periods is None:
+        min_periods = window
+    values = np.asarray(values, dtype=np.float64)
+    positions = (np.arange(len(values)) - starts).astype(np.float64)
+    count, _, _, m2_x, c_xy = _window_moments(positions, starts, window, y=values)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        slope = c_xy / m2_x
+    return np.where(count >= max(min_periods, 2), slope, np.nan)
+
+
+_KERNELS = {
+    'sum': rolling_sum,
+    'mean': rolling_mean,
+    'std': rolling_std,
+    'min': rolling_min,
+    'max': rolling_max,
+    'drawdown': lambda values, starts, window, min_periods=None: rolling_drawdown(values, starts, window),
+    'slope': rolling_slope,
+}
+
+
+def grouped_rolling(values, keys, window, statistic='mean', min_periods=None):
+    """
+    groupby(keys).rolling(window).<statistic>() over arrays, in the original row order
+
+    Rows keep their relative order within each group, as in pandas; rows
+    with a missing key get NaN. min_periods defaults to 1 for sum/mean/
+    min/max (the min_periods=1 the callers used with pandas), 2 for std and
+    the full window for slope.
+    """
+    if statistic not in _KERNELS:
+        raise ValueError(f"Unknown statistic: {statistic} (choose from {', '.join(STATISTICS)})")
+    values = np.asarray(values, dtype=np.float64)
+    # Codes follow first appearance, so an already grouped panel needs no reordering
+    codes = pd.factorize(keys)[0]
+    kwargs = {} if min_periods is None else {'min_periods': min_periods}
+
+    grouped = len(codes) < 2 or bool(np.all(codes[1:] >= codes[:-1]))
+    order = None if grouped else np.argsort(codes, kind='stable')
+    if order is not None:
+        values = values[order]
+        codes = codes[order]
+    result = _KERNELS[statistic](values, segment_starts(codes), window, **kwargs)
+    result = np.where(codes >= 0, result, np.nan)
+    if order is not None:
+        unsorted = np.empty_like(result)
+        unsorted[order] = result
+        result = unsorted
+    return result
+
+
+def frame_rolling(df, column, window, statistic='mean', entity_col='Entity', min_periods=None):
+    """
+    grouped_rolling() on a DataFrame column, returned as a Series aligned to df
+    """
+    return pd.Series(grouped_rolling(df[column].to_numpy(dtype=np.float64, na_value=np.nan), df[entity_col],
+                                     window, statistic, min_periods), index=df.index, name=column)
@@ -0,0 +1,299 @@
+"""
+Local HTTP query service for GDP per capita analysis
+Author: GitHub Portfolio Project
+
+Run from the project root:
+    python -m src.service [--host 127.0.0.1] [--port 8000] [--no-cache]
+
+Endpoints (GET, JSON):
+    /health
+    /world-trends
+    /continent-trends
+    /top-bottom?year=2023&n=10
+    /crisis-impact
+    /growth-champions?min_years=15&top_n=10&start_year=&end_year=
+    /inequality?min_countries=10
+    /stats                      response cache and request counters
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from .data_processing import (load_and_clean_data, get_world_trends, get_continent_trends, analyze_crisis_impact,
+                              get_growth_champions_and_laggards, get_inequality_trends)
+from .indexing import PanelIndex
+from .memo import AggregateCache
+from .panel import GDPPanel
+from .utils import get_top_bottom_countries
+
+DEFAULT_DATA_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                 'data', 'gdp-per-capita-worldbank.csv')
+MAX_HEADER_BYTES = 16 * 1024
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 500: 'Internal Server Error'}
+
+
+class QueryError(ValueError):
+    """
+    Invalid query parameter (answered with 400)
+    """
+
+
+def _json_default(value):
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.floating):
+        return None if np.isnan(value) else float(value)
+    if isinstance(value, np.bool_):
+        return bool(value)
+    raise TypeError(f"Not JSON serializable: {type(value).__name__}")
+
+
+def frame_records(df):
+    """
+    DataFrame as a list of JSON-ready row dicts (NaN becomes null)
+    """
+    df = df.astype(object).where(df.notna(), None)
+    return df.to_dict(orient='records')
+
+
+def _int_param(params, name, default=None):
+    value = params.get(name)
+    if value in (None, ''):
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise QueryError(f"'{name}' must be an integer, got {value!r}") from None
+
+
+class AnalyticsService:
+    """
+    Dataset loaded once plus the endpoint handlers over it
+    """
+
+    def __init__(self, df, gdp_column):
+        self.df = df
+        self.gdp_column = gdp_column
+        self.panel = GDPPanel.from_frame(df, gdp_column)
+        self.index = PanelIndex(df, gdp_column)
+        self.routes = {
+            '/health': self.health,
+            '/world-trends': self.world_trends,
+            '/continent-trends': self.continent_trends,
+            '/top-bottom': self.top_bottom,
+            '/crisis-impact': self.crisis_impact,
+            '/growth-champions': self.growth_champions,
+            '/inequality': self.inequality,
+        }
+
+    def health(self, params):
+        return {'status': 'ok', 'rows': len(self.df), 'entities': len(self.panel),
+                'years': [int(self.panel.years.min()), int(self.panel.years.max())]}
+
+    def world_trends(self, params):
+        return frame_records(get_world_trends(self.panel, self.gdp_column))
+
+    def continent_trends(self, params):
+        return frame_records(get_continent_trends(self.panel, self.gdp_column))
+
+    def top_bottom(self, params):
+        year = _int_param(params, 'year', self.index.latest_year)
+        n = _int_param(params, 'n', 10)
+        if not self.index.has_year(year):
+            raise QueryError(f"No data for year {year}")
+        top, bottom = get_top_bottom_countries(self.df, self.gdp_column, year=year, n=n, index=self.index)
+        columns = ['Entity', 'Code', 'Continent', self.gdp_column]
+        return {'year': year, 'top': frame_records(top[columns]), 'bottom': frame_records(bottom[columns])}
+
+    def crisis_impact(self, params):
+        crisis_analysis = analyze_crisis_impact(self.panel, self.gdp_column)
+        return {name: frame_records(crisis.reset_index()) for name, crisis in crisis_analysis.items()}
+
+    def growth_champions(self, params):
+        top_growers, worst_performers, _ = get_growth_champions_and_laggards(
+            self.panel, self.gdp_column,
+            min_years=_int_param(params, 'min_years', 15),
+            top_n=_int_param(params, 'top_n', 10),
+            start_year=_int_param(params, 'start_year'),
+            end_year=_int_param(params, 'end_year')
+        )
+        return {'champions': frame_records(top_growers), 'laggards': frame_records(worst_performers)}
+
+    def inequality(self, params):
+        return frame_records(get_inequality_trends(self.panel, self.gdp_column,
+                                                   min_countries=_int_param(params, 'min_countries', 10)))
+
+    def handle(self, path, params):
+        """
+        Run one endpoint and return (status, JSON body bytes)
+        """
+        handler = self.routes.get(path)
+        if handler is None:
+            return 404, json.dumps({'error': f"Unknown endpoint {path}", 'endpoints': sorted(self.routes)}).encode()
+        try:
+            payload = handler(params)
+        except QueryError as e:
+            return 400, json.dumps({'error': str(e)}).encode()
+        return 200, json.dumps(payload, default=_json_default).encode()
+
+
+class HTTPServer:
+    """
+    Minimal asyncio HTTP/1.1 server (GET only, keep-alive) with a response cache
+
+    Handlers run in a thread pool so slow aggregations do not block the
+    event loop; identical concurrent requests share one computation, and
+    successful responses are kept in an LRU keyed by path plus sorted query.
+    """
+
+    def __init__(self, service, cache=True, cache_size=256, workers=4):
+        self.service = service
+        self.cache = AggregateCache(maxsize=cache_size) if cache else None
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.in_flight = {}
+        self.requests = 0
+        self.errors = 0
+        self.started = time.time()
+
+    def stats(self):
+        stats = {'requests': self.requests, 'errors': self.errors,
+                 'uptime_s': round(time.time() - self.started, 1), 'cache': None}
+        if self.cache is not None:
+            stats['cache'] = self.cache.stats()
+        return 200, json.dumps(stats).encode()
+
+    async def respond(self, target):
+        """
+        Status and body for a request target (path + query string)
+        """
+        url = urlsplit(target)
+        params = dict(parse_qsl(url.query))
+        path = url.path.rstrip('/') or '/'
+        if path == '/stats':
+            return self.stats()
+
+        key = f"{path}?{sorted(params.items())!r}"
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        # Identical requests already being computed wait for the same result
+        future = self.in_flight.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self.executor, self.service.handle, path, params)
+            self.in_flight[key] = future
+            try:
+                result = await future
+            finally:
+                self.in_flight.pop(key, None)
+            if self.cache is not None and result[0] == 200:
+                self.cache.put(key, result)
+            return result
+        return await future
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self.write(writer, 400, json.dumps({'error': 'Headers too large'}).encode(), False)
+                    break
+
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = lines[0].split(' ', 2)
+                except ValueError:
+                    await self.write(writer, 400, json.dumps({'error': 'Malformed request line'}).encode(), False)
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    if ':' in line:
+                        name, value = line.split(':', 1)
+                        headers[name.strip().lower()] = value.strip()
+
+                # Bodies are not used by any endpoint, but must be drained to keep the connection in sync
+                try:
+                    length = int(headers.get('content-length', 0) or 0)
+                    if length < 0:
+                        raise ValueError(length)
+                except ValueError:
+                    await self.write(writer, 400, json.dumps({'error': 'Invalid Content-Length'}).encode(), False)
+                    break
+                if length:
+                    await reader.readexactly(length)
+
+                keep_alive = (headers.get('connection', '').lower() != 'close'
+                              and version.upper() == 'HTTP/1.1')
+                self.requests += 1
+                if method != 'GET':
+                    status, body = 405, json.dumps({'error': 'Only GET is supported'}).encode()
+                else:
+                    try:
+                        status, body = await self.respond(target)
+                    except Exception as e:
+                        status, body = 500, json.dumps({'error': f"{type(e).__name__}: {e}"}).encode()
+                if status >= 400:
+                    self.errors += 1
+                await self.write(writer, status, body, keep_alive)
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def write(self, writer, status, body, keep_alive):
+        header = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                  f"Content-Type: application/json\r\n"
+                  f"Content-Length: {len(body)}\r\n"
+                  f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(header.encode('latin-1') + body)
+        await writer.drain()
+
+    async def serve(self, host='127.0.0.1', port=8000):
+        server = await asyncio.start_server(self.handle_connection, host, port, limit=MAX_HEADER_BYTES)
+        addresses = ', '.join(f"http://{sock.getsockname()[0]}:{sock.getsockname()[1]}" for sock in server.sockets)
+        print(f"🚀 Serving GDP analytics on {addresses} (cache {'on' if self.cache is not None else 'off'})")
+        async with server:
+            await server.serve_forever()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Local HTTP API over the GDP analysis functions')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--data', default=DEFAULT_DATA_FILE, help='Source CSV (cleaned through the cache)')
+    parser.add_argument('--no-cache', action='store_true', help='Disable the response cache')
+    parser.add_argument('--cache-size', type=int, default=256, help='Cached responses kept in memory')
+    parser.add_argument('--workers', type=int, default=4, help='Threads running the analysis handlers')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    df, gdp_column = load_and_clean_data(args.data)
+    service = AnalyticsService(df, gdp_column)
+    server = HTTPServer(service, cache=not args.no_cache, cache_size=args.cache_size, workers=args.workers)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\n👋 Service stopped")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,245 @@
+"""
+Trajectory similarity search for GDP per capita analysis
+Author: GitHub Portfolio Project
+"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .panel import GDPPanel
+except ImportError:
+    from panel import GDPPanel
+
+INDEX_VERSION = 1
+METRICS = ('euclidean', 'correlation', 'dtw')
+# DTW candidates refined in the first batch (in lower-bound order); later batches double
+DTW_BATCH = 64
+
+
+def _dtw(query, candidates, band):
+    """
+    Banded DTW (sum of squared differences) between one query and each candidate row
+    """
+    n_candidates, width = candidates.shape
+    cost = np.full((n_candidates, width + 1, width + 1), np.inf)
+    cost[:, 0, 0] = 0.0
+    for i in range(width):
+        for j in range(max(0, i - band), min(width, i + band + 1)):
+            step = (candidates[:, j] - query[i]) ** 2
+            cost[:, i + 1, j + 1] = step + np.minimum(np.minimum(cost[:, i, j], cost[:, i, j + 1]), cost[:, i + 1, j])
+    return cost[:, width, width]
+
+
+def _envelope(series, band):
+    """
+    Running (upper, lower) envelope of a series over +/- band positions
+    """
+    width = len(series)
+    padded = np.pad(series, band, mode='edge')
+    windows = np.lib.stride_tricks.sliding_window_view(padded, 2 * band + 1)[:width]
+    return windows.max(axis=1), windows.min(axis=1)
+
+
+class TrajectoryIndex:
+    """
+    Log GDP per capita trajectories of every entity, prepared for peer search
+
+    Values sit on a gap-free year grid with running sums of the values,
+    their squares and the observation count, so the mean and spread of any
+    year window come out in O(entities) and distances against a query are a
+    single matrix-vector product. Trajectories are compared after removing
+    each one's mean over the window (euclidean, dtw: same growth path at any
+    level) or after full standardisation (correlation: same shape). Only
+    entities observed in every year of the window are candidates.
+    """
+
+    def __init__(self, entities, years, values, observed, gdp_column):
+        self.entities = np.asarray(entities, dtype=object)
+        self.years = np.asarray(years, dtype=np.int64)
+        self.values = np.asarray(values, dtype=np.float64)
+        self.observed = np.asarray(observed, dtype=bool)
+        self.gdp_column = gdp_column
+        self.entity_index = {entity: i for i, entity in enumerate(self.entities)}
+        # DTW candidates refined exactly by the last dtw query (the rest were pruned by the bound)
+        self.last_dtw_evaluated = 0
+
+        zeros = np.zeros((len(self.entities), 1))
+        self._sum = np.hstack([zeros, np.cumsum(self.values, axis=1)])
+        self._sum_sq = np.hstack([zeros, np.cumsum(self.values * self.values, axis=1)])
+        self._count = np.hstack([zeros, np.cumsum(self.observed, axis=1)])
+
+    @classmethod
+    def from_panel(cls, panel):
+        """
+        Build the index from a GDPPanel (log of positive values, missing years as gaps)
+        """
+        years = np.arange(panel.years.min(), panel.years.max() + 1) if len(panel.years) else panel.years
+        values = np.zeros((len(panel.entities), len(years)))
+        observed = np.zeros(values.shape, dtype=bool)
+        positive = panel.values > 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values[:, panel.years - years[0]] = np.where(positive, np.log(panel.values), 0.0)
+        observed[:, panel.years - years[0]] = positive
+        return cls(panel.entities, years, values, observed, panel.gdp_column)
+
+    @classmethod
+    def from_frame(cls, df, gdp_column):
+        """
+        Build the index from the long-format output of load_and_clean_data
+        """
+        return cls.from_panel(GDPPanel.from_frame(df, gdp_column))
+
+    def __len__(self):
+        return len(self.entities)
+
+    def __repr__(self):
+        year_range = f"{self.years.min()}-{self.years.max()}" if len(self.years) else "empty"
+        return f"TrajectoryIndex({len(self.entities)} entities, {year_range})"
+
+    def save(self, path):
+        """
+        Persist the index as a single .npz (atomic replace)
+        """
+        meta = {'version': INDEX_VERSION, 'gdp_column': self.gdp_column}
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = path + '.tmp.npz'
+        np.savez(tmp_path, entities=self.entities.astype(str), years=self.years, values=self.values,
+                 observed=self.observed, __meta__=np.array(json.dumps(meta)))
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load an index written by save()
+        """
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data['__meta__']))
+            if meta.get('version') != INDEX_VERSION:
+                raise ValueError(f"Unsupported similarity index version {meta.get('version')} in {path}")
+            return cls(data['entities'], data['years'], data['values'], data['observed'], meta['gdp_column'])
+
+    def _columns(self, start=None, end=None):
+        first = 0 if start is None else int(start) - int(self.years[0])
+        last = len(self.years) - 1 if end is None else int(end) - int(self.years[0])
+        if first < 0 or last >= len(self.years) or first > last:
+            raise ValueError(f"Year window {start}-{end} is outside {self.years[0]}-{self.years[-1]}")
+        return first, last + 1
+
+    def window_stats(self, start=None, end=None):
+        """
+        Per-entity (complete, mean, centered sum of squares) over a year window
+        """
+        first, stop = self._columns(start, end)
+        width = stop - first
+        complete = self._count[:, stop] - self._count[:, first] == width
+        mean = (self._sum[:, stop] - self._sum[:, first]) / width
+        spread = np.maximum(self._sum_sq[:, stop] - self._sum_sq[:, first] - width * mean * mean, 0.0)
+        return complete, mean, spread
+
+    def trajectories(self, entities=None, start=None, end=None):
+        """
+        Mean-removed log trajectories over a year window (rows as in `entities`)
+        """
+        first, stop = self._columns(start, end)
+        rows = slice(None) if entities is None else [self.entity_index[entity] for entity in entities]
+        window = self.values[rows, first:stop]
+        return window - window.mean(axis=1, keepdims=True)
+
+    def _scores(self, queries, start, end, metric):
+        """
+        Distances from query trajectories (Q x width, mean removed) to every entity
+        """
+        first, stop = self._columns(start, end)
+        width = stop - first
+        complete, mean, spread = self.window_stats(start, end)
+        # Centered dot products: sum(a b) - width * mean_a * mean_b, and the query's is zero-mean
+        cross = queries @ self.values[:, first:stop].T
+        query_spread = (queries * queries).sum(axis=1)[:, None]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if metric == 'euclidean':
+                squared = np.maximum(query_spread + spread[None, :] - 2 * cross, 0.0)
+                distance = np.sqrt(squared / width)
+            else:
+                distance = 1 - cross / np.sqrt(query_spread * spread[None, :])
+        return np.where(complete[None, :], distance, np.nan)
+
+    def distance_matrix(self, start=None, end=None, metric='euclidean'):
+        """
+        Entity x entity euclidean or correlation distances over a year window, from one matrix product
+        """
+        if metric not in ('euclidean', 'correlation'):
+            raise ValueError(f"Unknown matrix metric: {metric} (choose from euclidean, correlation)")
+        complete = self.window_stats(start, end)[0]
+        distances = self._scores(np.where(complete[:, None], self.trajectories(start=start, end=end), 0.0),
+                                 start, end, metric)
+        distances[~complete] = np.nan
+        return pd.DataFrame(distances, index=self.entities, columns=self.entities)
+
+    def query(self, entity, start=None, end=None, k=10, metric='euclidean', band=2):
+        """
+        The k entities whose trajectory over [start, end] is closest to `entity`'s
+
+        euclidean: RMS difference of the mean-removed log paths (log points);
+        correlation: 1 - Pearson correlation; dtw: banded dynamic time warping
+        (+/- band years) on the mean-removed paths, RMS per year, with LB_Keogh
+        bounds skipping candidates that cannot enter the top k.
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric: {metric} (choose from {', '.join(METRICS)})")
+        if entity not in self.entity_index:
+            raise ValueError(f"Unknown entity: {entity}")
+        complete = self.window_stats(start, end)[0]
+        row = self.entity_index[entity]
+        if not complete[row]:
+            raise ValueError(f"{entity} has missing years in the window {start}-{end}")
+        query = self.trajectories([entity], start, end)
+
+        if metric == 'dtw':
+            rows, distances = self._dtw_neighbours(query[0], row, complete, start, end, k, band)
+        else:
+            distances = self._scores(query, start, end, metric)[0]
+            distances[row] = np.nan
+            candidates = np.flatnonzero(~np.isnan(distances))
+            if len(candidates) > k:
+                candidates = candidates[np.argpartition(distances[candidates], k)[:k]]
+            rows = candidates[np.argsort(distances[candidates], kind='stable')]
+            distances = distances[rows]
+
+        return pd.DataFrame({'Entity': self.entities[rows], 'distance': distances},
+                            index=pd.RangeIndex(1, len(rows) + 1, name='rank'))
+
+    def _dtw_neighbours(self, query, row, complete, start, end, k, band):
+        first, stop = self._columns(start, end)
+        width = stop - first
+        candidates = np.flatnonzero(complete)
+        candidates = candidates[candidates != row]
+        series = self.values[candidates, first:stop]
+        series = series - series.mean(axis=1, keepdims=True)
+
+        # LB_Keogh: squared distance of each candidate to the query's band envelope
+        upper, lower = _envelope(query, band)
+        bound = (np.maximum(series - upper, 0.0) ** 2 + np.maximum(lower - series, 0.0) ** 2).sum(axis=1)
+        order = np.argsort(bound, kind='stable')
+
+        best_rows = np.zeros(0, dtype=np.int64)
+        best = np.zeros(0)
+        evaluated = 0
+        batch_size = DTW_BATCH
+        while evaluated < len(order):
+            batch = order[evaluated:evaluated + batch_size]
+            if len(best) >= k and bound[batch[0]] > best[-1]:
+                break
+            exact = _dtw(query, series[batch], band)
+            evaluated += len(batch)
+            batch_size *= 2
+            best = np.concatenate([best, exact])
+            best_rows = np.concatenate([best_rows, batch])
+            keep = np.argsort(best, kind='stable')[:k]
+            best, best_rows = best[keep], best_rows[keep]
+        self.last_dtw_evaluated = evaluated
+        return candidates[best_rows], np.sqrt(best / width)
@@ -6,6 +6,14 @@ Author: GitHub Portfolio Project
 import pandas as pd
 import numpy as np
 
+# utils is also imported as a top-level module (notebooks, generate_plots.py)
+try:
+    from .instrumentation import instrument
+    from .rolling import frame_rolling
+except ImportError:
+    from instrumentation import instrument
+    from rolling import frame_rolling
+
 def get_continent_mapping():
     """
     Returns a dictionary mapping countries to continents
@@ -80,12 +88,22 @@ def get_continent_mapping():
     
     return continent_mapping
 
+def _as_frame(df):
+    """
+    Long-format view of a GDPPanel (duck-typed so utils stays importable on its own)
+    """
+    if not isinstance(df, pd.DataFrame) and hasattr(df, 'to_frame'):
+        return df.to_frame()
+    return df
+
+@instrument()
 def add_continent_column(df):
     """
     Add continent column to dataframe based on Entity column
     """
     continent_mapping = get_continent_mapping()
-    df_copy = df.copy()
+    # Shallow copy: adds the column without duplicating the existing data
+    df_copy = _as_frame(df).copy(deep=False)
     df_copy['Continent'] = df_copy['Entity'].map(continent_mapping)
     
     # Handle unmapped countries
@@ -97,6 +115,50 @@ def add_continent_column(df):
     
     return df_copy
 
+def downcast_frame(df, gdp_column, float_tolerance=0.01):
+    """
+    Compact dtypes: categorical Entity/Code/Continent, int16 Year and float32
+    GDP values when the float32 round-trip error stays within float_tolerance
+    """
+    df_compact = df.copy(deep=False)
+    
+    for col in ['Entity', 'Code', 'Continent']:
+        if col in df_compact.columns and not isinstance(df_compact[col].dtype, pd.CategoricalDtype):
+            df_compact[col] = df_compact[col].astype('category')
+    
+    years = df_compact['Year']
+    if len(years) == 0 or (years.min() >= np.iinfo(np.int16).min and years.max() <= np.iinfo(np.int16).max):
+        df_compact['Year'] = years.astype(np.int16)
+    
+    values = df_compact[gdp_column].to_numpy(dtype=np.float64)
+    values_32 = values.astype(np.float32)
+    if np.nanmax(np.abs(values_32 - values), initial=0.0) <= float_tolerance:
+        df_compact[gdp_column] = values_32
+    
+    return df_compact
+
+def memory_report(df, label='DataFrame'):
+    """
+    Print and return the deep memory usage (bytes) of each column
+    """
+    usage = df.memory_usage(deep=True)
+    total_mb = usage.sum() / 1024 ** 2
+    
+    print(f"🧠 Memory report: {label} ({len(df):,} rows) - total {total_mb:,.2f} MB")
+    for col, size in usage.items():
+        dtype = df[col].dtype if col in df.columns else ''
+        print(f"   {str(col)[:40]:<40} {str(dtype):<12} {size / 1024 ** 2:>10,.3f} MB")
+    
+    return usage
+
+def get_income_brackets():
+    """
+    Returns (bins, labels) of the GDP per capita income brackets
+    """
+    bins = [0, 5000, 15000, 50000, float('inf')]
+    labels = ['Low Income', 'Lower Middle', 'Upper Middle', 'High Income']
+    return bins, labels
+
 def get_crisis_years():
     """
     Returns dictionary of major economic crisis years
@@ -106,36 +168,59 @@ def get_crisis_years():
         'covid_crisis': [2020, 2021, 2022]
     }
 
+def get_crisis_windows(pre_years=2):
+    """
+    Returns (name, pre-crisis years, crisis years) windows built from get_crisis_years
+    """
+    windows = []
+    for name, crisis_years in get_crisis_years().items():
+        first_year = min(crisis_years)
+        pre_crisis = list(range(first_year - pre_years, first_year))
+        windows.append((name, pre_crisis, list(crisis_years)))
+    return windows
+
 def calculate_growth_rate(df, gdp_column, entity_column='Entity'):
     """
     Calculate year-over-year growth rate for each entity
     """
-    df_copy = df.copy()
-    df_copy = df_copy.sort_values([entity_column, 'Year'])
-    df_copy['growth_rate'] = df_copy.groupby(entity_column)[gdp_column].pct_change() * 100
+    df_copy = _as_frame(df).sort_values([entity_column, 'Year'])
+    df_copy['growth_rate'] = df_copy.groupby(entity_column, observed=True)[gdp_column].pct_change() * 100
     return df_copy
 
 def get_moving_average(df, gdp_column, window=5, entity_column='Entity'):
     """
     Calculate moving average for GDP per capita
     """
-    df_copy = df.copy()
-    df_copy = df_copy.sort_values([entity_column, 'Year'])
-    df_copy[f'{window}y_moving_avg'] = df_copy.groupby(entity_column)[gdp_column].rolling(window=window, min_periods=1).mean().reset_index(0, drop=True)
+    df_copy = _as_frame(df).sort_values([entity_column, 'Year'])
+    df_copy[f'{window}y_moving_avg'] = frame_rolling(df_copy, gdp_column, window, 'mean', entity_column)
     return df_copy
 
+@instrument()
 def filter_complete_data(df, min_years=10):
     """
     Filter entities that have data for at least min_years
     """
+    df = _as_frame(df)
     entity_counts = df['Entity'].value_counts()
     valid_entities = entity_counts[entity_counts >= min_years].index
     return df[df['Entity'].isin(valid_entities)]
 
-def get_top_bottom_countries(df, gdp_column, year=2023, n=10):
+@instrument()
+def get_top_bottom_countries(df, gdp_column, year=2023, n=10, index=None):
     """
     Get top and bottom n countries for a specific year
+    
+    Pass a PanelIndex (src/indexing.py) as index to answer from its
+    per-year sorted order instead of scanning the frame.
     """
+    if index is not None:
+        if not index.has_year(year):
+            latest_year = index.latest_year
+            print(f"⚠️ {year} verisi bulunamadı, {latest_year} kullanılıyor")
+            year = latest_year
+        return index.top(year, n), index.bottom(year, n)
+    
+    df = _as_frame(df)
     year_data = df[df['Year'] == year].copy()
     if len(year_data) == 0:
         # Try latest available year
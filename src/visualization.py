@@ -3,22 +3,157 @@ Visualization functions for GDP per capita analysis
 Author: GitHub Portfolio Project
 """
 
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import json
+import os
+import time
+
 import pandas as pd
 import numpy as np
 
-# Set style
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+# Plotting backends are imported on first use, so importing this module
+# (or src.data_processing) does not pay for matplotlib/seaborn/plotly startup
+_backends = {}
+
+# Export resolutions: 'tight' bounding boxes cost an extra draw pass, so preview skips it
+RESOLUTION_PROFILES = {
+    'preview': {'dpi': 72, 'bbox_inches': None, 'plotly_scale': 1},
+    'web': {'dpi': 110, 'bbox_inches': 'tight', 'plotly_scale': 1},
+    'print': {'dpi': 300, 'bbox_inches': 'tight', 'plotly_scale': 2},
+}
+
+# Batch export: non-interactive backend, no show(), figures closed after saving
+_export = {'batch': False, 'resolution': 'print'}
+
+# Plotly HTML export modes: 'standalone' embeds plotly.js and every point in each
+# file (original output); 'compact' writes one shared plotly.min.js next to the
+# files, LTTB-downsamples traces beyond max_points and draws traces with at
+# least webgl_threshold points with WebGL
+PLOTLY_OUTPUT_MODES = ('standalone', 'compact')
+_plotly_output = {'mode': 'standalone', 'max_points': 2000, 'webgl_threshold': 1000}
+
+def _pyplot():
+    """
+    matplotlib.pyplot with the project style applied (imported on first call)
+    """
+    if 'plt' not in _backends:
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
+        # Set style
+        plt.style.use('seaborn-v0_8')
+        sns.set_palette("husl")
+        _backends['plt'] = plt
+    return _backends['plt']
+
+def _plotly_express():
+    """
+    plotly.express (imported on first call)
+    """
+    if 'px' not in _backends:
+        import plotly.express as px
+        _backends['px'] = px
+    return _backends['px']
+
+def set_batch_mode(enabled=True, resolution='print'):
+    """
+    Switch to headless batch export (Agg backend, no show()) at a resolution profile
+    """
+    if resolution not in RESOLUTION_PROFILES:
+        raise ValueError(f"Unknown resolution profile: {resolution} (choose from {', '.join(RESOLUTION_PROFILES)})")
+    _export['batch'] = enabled
+    _export['resolution'] = resolution
+    if enabled:
+        _pyplot().switch_backend('Agg')
+
+def get_resolution_profile(resolution=None):
+    """
+    savefig settings of a resolution profile (the active one by default)
+    """
+    return RESOLUTION_PROFILES[resolution or _export['resolution']]
+
+def set_plotly_output(mode='compact', max_points=2000, webgl_threshold=1000):
+    """
+    Choose how plotly figures are written to HTML (see PLOTLY_OUTPUT_MODES)
+    """
+    if mode not in PLOTLY_OUTPUT_MODES:
+        raise ValueError(f"Unknown plotly output mode: {mode} (choose from {', '.join(PLOTLY_OUTPUT_MODES)})")
+    _plotly_output.update(mode=mode, max_points=max_points, webgl_threshold=webgl_threshold)
+
+def get_plotly_output():
+    return dict(_plotly_output)
+
+def write_plotly_html(fig, path):
+    """
+    Write a plotly figure as HTML in the active output mode; returns slimming stats
+    """
+    if _plotly_output['mode'] == 'standalone':
+        fig.write_html(path)
+        return {}
+    from .downsample import slim_figure
+    fig, stats = slim_figure(fig, _plotly_output['max_points'], _plotly_output['webgl_threshold'])
+    # 'directory' references plotly.min.js beside the HTML and writes it only if missing
+    fig.write_html(path, include_plotlyjs='directory')
+    return stats
+
+def _decode_array(value):
+    # plotly serialises numpy arrays as base64 typed arrays ({'dtype', 'bdata'})
+    if isinstance(value, dict) and 'bdata' in value:
+        import base64
+        return np.frombuffer(base64.b64decode(value['bdata']), dtype=np.dtype(value['dtype']))
+    return value
+
+def inspect_plotly_html(path):
+    """
+    Size and load proxies for a plotly HTML file
+
+    Reports the file size, whether plotly.js is embedded, the number of
+    embedded data points and the time to read the file and decode the
+    figure JSON (the part of page load that grows with the data).
+    """
+    start = time.perf_counter()
+    with open(path, encoding='utf-8') as f:
+        html = f.read()
+    decoder = json.JSONDecoder()
+    points = 0
+    position = html.find('Plotly.newPlot(')
+    if position >= 0:
+        position += len('Plotly.newPlot(')
+        _, position = decoder.raw_decode(html, html.index('"', position))
+        traces, _ = decoder.raw_decode(html, html.index('[', position))
+        for trace in traces:
+            lengths = [len(_decode_array(trace[key])) for key in ('y', 'z', 'locations', 'x') if key in trace]
+            points += max(lengths, default=0)
+    return {
+        'path': path,
+        'bytes': os.path.getsize(path),
+        'embedded_plotlyjs': 'src="plotly.min.js"' not in html and 'plotly.js v' in html,
+        'points': points,
+        'load_ms': (time.perf_counter() - start) * 1000,
+    }
+
+def _save_figure(fig, save_path):
+    profile = get_resolution_profile()
+    fig.savefig(save_path, dpi=profile['dpi'], bbox_inches=profile['bbox_inches'])
+
+def _show(fig):
+    """
+    Display a matplotlib figure, or release it in batch mode
+    """
+    plt = _pyplot()
+    if _export['batch']:
+        plt.close(fig)
+    else:
+        plt.show()
+
+def _show_plotly(fig):
+    if not _export['batch']:
+        fig.show()
 
 def plot_world_gdp_trend(world_trends, gdp_column, save_path=None):
     """
     Plot world GDP per capita trend over time
     """
+    plt = _pyplot()
     fig, ax = plt.subplots(figsize=(12, 6))
     
     # Main trend line  
@@ -53,9 +188,9 @@ def plot_world_gdp_trend(world_trends, gdp_column, save_path=None):
     plt.tight_layout()
     
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        _save_figure(plt.gcf(), save_path)
     
-    plt.show()
+    _show(plt.gcf())
     
     # Key insights
     print("🔍 Key Insights:")
@@ -66,6 +201,9 @@ def plot_continent_comparison(continent_trends, save_path=None):
     """
     Plot continent-wise GDP comparison
     """
+    plt = _pyplot()
+    px = _plotly_express()
+    
     # Interactive Plotly version
     fig = px.line(continent_trends, x='Year', y='avg_gdp', color='Continent',
                   title='🌍 GDP Per Capita by Continent (1990-2023)',
@@ -86,9 +224,9 @@ def plot_continent_comparison(continent_trends, save_path=None):
     )
     
     if save_path:
-        fig.write_html(save_path.replace('.png', '.html'))
+        write_plotly_html(fig, save_path.replace('.png', '.html'))
     
-    fig.show()
+    _show_plotly(fig)
     
     # Static version for GitHub
     plt.figure(figsize=(12, 8))
@@ -109,23 +247,32 @@ def plot_continent_comparison(continent_trends, save_path=None):
     plt.tight_layout()
     
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        _save_figure(plt.gcf(), save_path)
     
-    plt.show()
+    _show(plt.gcf())
 
-def plot_top_bottom_countries(df, gdp_column, year=2023, save_path=None):
+def plot_top_bottom_countries(df, gdp_column, year=2023, save_path=None, index=None):
     """
     Plot top and bottom countries comparison
     """
-    year_data = df[df['Year'] == year]
-    if len(year_data) == 0:
-        year = df['Year'].max()
+    plt = _pyplot()
+    if index is not None:
+        # Year blocks of the index are already sorted by GDP
+        if not index.has_year(year):
+            year = index.latest_year
+            print(f"⚠️ Using {year} data instead")
+        top_10 = index.top(year, 10)
+        bottom_10 = index.bottom(year, 10)
+    else:
         year_data = df[df['Year'] == year]
-        print(f"⚠️ Using {year} data instead")
-    
-    # Get top and bottom 10
-    top_10 = year_data.nlargest(10, gdp_column)
-    bottom_10 = year_data.nsmallest(10, gdp_column)
+        if len(year_data) == 0:
+            year = df['Year'].max()
+            year_data = df[df['Year'] == year]
+            print(f"⚠️ Using {year} data instead")
+        
+        # Get top and bottom 10
+        top_10 = year_data.nlargest(10, gdp_column)
+        bottom_10 = year_data.nsmallest(10, gdp_column)
     
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
     
@@ -158,22 +305,28 @@ def plot_top_bottom_countries(df, gdp_column, year=2023, save_path=None):
     plt.tight_layout()
     
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        _save_figure(plt.gcf(), save_path)
     
-    plt.show()
+    _show(plt.gcf())
     
     # Print insights
     ratio = top_10.iloc[0][gdp_column] / bottom_10.iloc[0][gdp_column]
     print(f"💰 Wealth Gap: The richest country has {ratio:.1f}x more GDP per capita than the poorest")
 
-def plot_world_map_choropleth(df, gdp_column, year=2023, save_path=None):
+def plot_world_map_choropleth(df, gdp_column, year=2023, save_path=None, index=None):
     """
     Create interactive world map showing GDP per capita
     """
-    year_data = df[df['Year'] == year]
-    if len(year_data) == 0:
-        year = df['Year'].max()
+    px = _plotly_express()
+    if index is not None:
+        if not index.has_year(year):
+            year = index.latest_year
+        year_data = index.year(year)
+    else:
         year_data = df[df['Year'] == year]
+        if len(year_data) == 0:
+            year = df['Year'].max()
+            year_data = df[df['Year'] == year]
     
     # Create choropleth map
     fig = px.choropleth(
@@ -195,14 +348,15 @@ def plot_world_map_choropleth(df, gdp_column, year=2023, save_path=None):
     )
     
     if save_path:
-        fig.write_html(save_path.replace('.png', '.html'))
+        write_plotly_html(fig, save_path.replace('.png', '.html'))
     
-    fig.show()
+    _show_plotly(fig)
 
 def plot_crisis_impact(crisis_analysis, save_path=None):
     """
     Plot impact of economic crises
     """
+    plt = _pyplot()
     fig, axes = plt.subplots(2, 2, figsize=(16, 12))
     
     # 2008 Crisis Impact
@@ -250,14 +404,15 @@ def plot_crisis_impact(crisis_analysis, save_path=None):
     plt.tight_layout()
     
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        _save_figure(plt.gcf(), save_path)
     
-    plt.show()
+    _show(plt.gcf())
 
 def plot_inequality_trends(inequality_data, save_path=None):
     """
     Plot wealth inequality trends over time
     """
+    plt = _pyplot()
     fig, axes = plt.subplots(2, 2, figsize=(16, 10))
     
     # Rich-Poor Ratio
@@ -296,19 +451,23 @@ def plot_inequality_trends(inequality_data, save_path=None):
     plt.tight_layout()
     
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        _save_figure(plt.gcf(), save_path)
     
-    plt.show()
+    _show(plt.gcf())
 
-def create_animated_gdp_plot(df, gdp_column, save_path=None):
+def create_animated_gdp_plot(df, gdp_column, save_path=None, index=None):
     """
     Create animated plot showing GDP evolution over time
     """
+    px = _plotly_express()
     # Select top 15 countries by latest GDP
-    latest_year = df['Year'].max()
-    top_countries = df[df['Year'] == latest_year].nlargest(15, gdp_column)['Entity'].tolist()
-    
-    df_top = df[df['Entity'].isin(top_countries)]
+    if index is not None:
+        top_countries = index.top(index.latest_year, 15)['Entity'].tolist()
+        df_top = index.entities_frame(top_countries)
+    else:
+        latest_year = df['Year'].max()
+        top_countries = df[df['Year'] == latest_year].nlargest(15, gdp_column)['Entity'].tolist()
+        df_top = df[df['Entity'].isin(top_countries)]
     
     fig = px.line(df_top, x='Year', y=gdp_column, color='Entity',
                   title='🎬 GDP Per Capita Evolution: Top 15 Countries',
@@ -319,8 +478,8 @@ def create_animated_gdp_plot(df, gdp_column, save_path=None):
     fig.update_layout(title_font_size=16)
     
     if save_path:
-        fig.write_html(save_path.replace('.png', '_animated.html'))
+        write_plotly_html(fig, save_path.replace('.png', '_animated.html'))
     
-    fig.show()
+    _show_plotly(fig)
     
     return fig
\ No newline at end of file
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Incrementally update outputs/gdp_with_features.csv when new data arrives.
+Only rows whose rolling windows touch new or revised observations (plus the
+cross-sectional features of the years they fall in) are recomputed.
+"""
+
+import os
+import sys
+import time
+import argparse
+import warnings
+warnings.filterwarnings('ignore')
+
+# Set up paths
+project_root = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(project_root)
+
+from src.data_processing import load_and_clean_data
+from src.features import build_features, export_features, update_features_file, verify_incremental_update
+
+data_file = os.path.join(project_root, 'data', 'gdp-per-capita-worldbank.csv')
+features_file = os.path.join(project_root, 'outputs', 'gdp_with_features.csv')
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description='Update the engineered feature dataset')
+    parser.add_argument('--full', action='store_true',
+                        help='Rebuild every feature from scratch instead of patching')
+    parser.add_argument('--check', action='store_true',
+                        help='Verify that an incremental update of the latest year equals a full recompute')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Update or verify the feature dataset"""
+    args = parse_args(argv)
+    df, gdp_column = load_and_clean_data(data_file)
+    
+    if args.check:
+        latest_year = df['Year'].max()
+        print(f"\n🔍 Checking incremental update of {latest_year} against a full recompute...")
+        summary = verify_incremental_update(df[df['Year'] < latest_year], df, gdp_column)
+        status = "✅ identical" if summary['matches_full_recompute'] else "❌ MISMATCH"
+        print(f"{status} ({summary['rows_recomputed']} rows recomputed, years {summary['years_recomputed']})")
+        return 0 if summary['matches_full_recompute'] else 1
+    
+    start = time.perf_counter()
+    if args.full or not os.path.exists(features_file):
+        export_features(build_features(df, gdp_column), features_file)
+        print(f"\n✅ Rebuilt all features in {time.perf_counter() - start:.2f}s")
+    else:
+        summary = update_features_file(features_file, df, gdp_column)
+        if summary['entities_affected'] == 0:
+            print("\n✅ Features are up to date, nothing to recompute")
+        else:
+            print(f"\n✅ Recomputed {summary['rows_recomputed']} rows for {summary['entities_affected']} entities "
+                  f"(years {summary['years_recomputed']}) in {time.perf_counter() - start:.2f}s")
+    print(f"📁 {features_file}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())